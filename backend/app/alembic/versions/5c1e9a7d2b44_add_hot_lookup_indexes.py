@@ -0,0 +1,75 @@
+"""add hot lookup indexes
+
+Revision ID: 5c1e9a7d2b44
+Revises: 0f5648b6107f
+Create Date: 2026-10-18 11:03:27.518240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e9a7d2b44'
+down_revision: Union[str, None] = '0f5648b6107f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DUPLICATE_EMAILS = sa.text(
+    "SELECT lower(email) AS email, array_agg(email ORDER BY email) AS variants "
+    "FROM users GROUP BY lower(email) HAVING count(*) > 1 ORDER BY 1"
+)
+INDEX_STATE = sa.text(
+    "SELECT i.indisvalid, i.indisunique FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE c.relname = :name AND c.relnamespace = to_regnamespace(current_schema())"
+)
+
+
+def _check_duplicate_emails(conn: sa.Connection) -> None:
+    # a unique index build would fail halfway and leave an INVALID index behind
+    duplicates = conn.execute(DUPLICATE_EMAILS).all()
+    if duplicates:
+        listing = "\n".join(f"  {row.email}: {', '.join(row.variants)}" for row in duplicates)
+        raise RuntimeError(
+            "Cannot create ix_users_email_lower: emails that differ only by case must be "
+            f"merged first ({len(duplicates)} groups):\n{listing}"
+        )
+
+
+def _drop_invalid_index(conn: sa.Connection, name: str) -> sa.Row | None:
+    # a failed CREATE INDEX CONCURRENTLY leaves an INVALID index that still slows writes
+    state = conn.execute(INDEX_STATE, {"name": name}).first()
+    if state is not None and not state.indisvalid:
+        op.drop_index(name, postgresql_concurrently=True)
+        return None
+    return state
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    _check_duplicate_emails(conn)
+    # CONCURRENTLY cannot run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        for name in ('ix_items_owner_id_created_at_id', 'ix_profile_roles_role_id', 'ix_users_created_at_id'):
+            _drop_invalid_index(conn, name)
+        op.create_index('ix_items_owner_id_created_at_id', 'items', ['owner_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_profile_roles_role_id', 'profile_roles', ['role_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        # no if_not_exists: only a valid unique index left by an earlier partial run is reused
+        state = _drop_invalid_index(conn, 'ix_users_email_lower')
+        if state is not None and not state.indisunique:
+            raise RuntimeError("ix_users_email_lower exists but is not unique; drop it and re-run")
+        if state is None:
+            op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_created_at_id', table_name='users', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_users_email_lower', table_name='users', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_profile_roles_role_id', table_name='profile_roles', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_items_owner_id_created_at_id', table_name='items', postgresql_concurrently=True, if_exists=True)
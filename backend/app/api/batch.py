@@ -0,0 +1,39 @@
+# path: app/api/batch.py
+
+from typing import Any, List, Optional, Tuple, Type, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+from app.schemas.token import BatchRowError
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+def validate_batch_rows(
+    rows: List[Any], schema: Type[SchemaType], *, max_rows: Optional[int] = None
+) -> Tuple[List[Tuple[int, SchemaType]], List[BatchRowError]]:
+    """
+    batch 요청의 각 행을 개별 검증하여 (index, 스키마 객체) 목록과 행별 오류 목록으로 분리.
+    한 행의 오류가 전체 요청을 422로 실패시키지 않도록 body는 raw dict 목록으로 받는다.
+    max_rows를 주지 않으면 BATCH_MAX_ROWS 적용.
+    """
+    max_rows = settings.BATCH_MAX_ROWS if max_rows is None else max_rows
+    if len(rows) > max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch size exceeds {max_rows} rows",
+        )
+    valid: List[Tuple[int, SchemaType]] = []
+    errors: List[BatchRowError] = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, schema.model_validate(row)))
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc']) or 'row'}: {err['msg']}"
+                for err in e.errors()
+            )
+            errors.append(BatchRowError(index=index, detail=detail))
+    return valid, errors
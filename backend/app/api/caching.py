@@ -0,0 +1,30 @@
+# path: app/api/caching.py
+
+from fastapi import Request, Response
+
+from app.core.response_cache import CachedResponse
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 etag와 일치하는지 확인 (목록, weak 비교, * 지원)
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached_json_response(request: Request, entry: CachedResponse) -> Response:
+    """
+    캐시된 JSON 본문을 그대로 응답. 클라이언트가 같은 ETag를 보냈으면 본문 없이 304.
+    """
+    # private: 사용자별 인증 응답이므로 공유 캐시(프록시)에는 저장하지 않음
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
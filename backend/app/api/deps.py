@@ -1,16 +1,31 @@
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
+from uuid import UUID
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core import security
 from app.core.config import settings
-from app.database.session import engine
+from app.core.user_state import (
+    LAST_WRITE_COOKIE,
+    LAST_WRITE_HEADER,
+    AuthUser,
+    access_token_cache,
+    access_token_digest,
+    last_write_marker,
+    user_state_cache,
+    wrote_recently,
+)
+from app.database.routing import USE_REPLICA
+from app.database.session import AsyncSessionLocal, SessionLocal
 from app.schemas.token import TokenPayload
 from app.models.user import User
 
@@ -21,22 +36,35 @@ reusable_oauth2 = OAuth2PasswordBearer(
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get a SQLAlchemy database db.
+    Uses the module-level SessionLocal so every request shares the worker's pool.
     """
-    from sqlalchemy.orm import sessionmaker
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
     try:
-        db = SessionLocal()
         yield db
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an AsyncSession for `async def` routes.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 SessionDep = Annotated[Session, Depends(get_db)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
-def get_current_user(db: SessionDep, token: TokenDep) -> User:
+def decode_access_token(token: str) -> TokenPayload:
     """
-    Get the current user based on the provided token.
+    Verify the JWT signature/expiry and return its claims.
+    Verified claims are cached per token digest until the token's exp, so repeat
+    requests with the same token skip the HMAC check and model validation.
     """
+    key = access_token_digest(token)
+    token_data = access_token_cache.get(key)
+    if token_data is not None:
+        return token_data
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -47,18 +75,113 @@ def get_current_user(db: SessionDep, token: TokenDep) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+    # tokens without exp are never cached
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        access_token_cache.set(key, token_data, ttl=remaining)
+    return token_data
 
-    user = db.query(User).filter(User.id == token_data.sub).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+def mark_recent_write(response: Response) -> None:
+    """
+    Start the client's read-your-writes window.
+    The last-write time travels with the client (short-lived cookie, echoed in
+    X-Last-Write for non-browser clients), so every worker sees the same window.
+    """
+    marker = last_write_marker()
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        marker,
+        max_age=settings.READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax",
+    )
+    response.headers[LAST_WRITE_HEADER] = marker
+
+def read_your_writes(request: Request) -> bool:
+    """
+    True while the client's last write is younger than READ_YOUR_WRITES_SECONDS.
+    """
+    marker = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+    return wrote_recently(marker)
+
+async def get_current_principal(
+    request: Request, response: Response, db: AsyncSessionDep, token: TokenDep
+) -> AuthUser:
+    """
+    Resolve the authenticated user's id/is_active/is_superuser.
+    Served from the in-process user-state cache; the DB is only hit on a miss.
+    Write requests also start the client's read-your-writes window.
+    """
+    token_data = decode_access_token(token)
+    try:
+        user_id = UUID(str(token_data.sub))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+
+    principal = user_state_cache.get(user_id)
+    if principal is None:
+        result = await db.execute(
+            select(User.id, User.is_active, User.is_superuser).where(User.id == user_id)
+        )
+        row = result.first()
+        if not row:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = AuthUser(
+            id=row.id, is_active=bool(row.is_active), is_superuser=bool(row.is_superuser)
+        )
+        user_state_cache.set(user_id, principal)
+
+    if not principal.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    if request.method not in SAFE_METHODS:
+        mark_recent_write(response)
+    return principal
+
+CurrentPrincipal = Annotated[AuthUser, Depends(get_current_principal)]
 
+def get_read_db(request: Request, principal: CurrentPrincipal) -> Generator[Session, None, None]:
+    """
+    Session for read-only endpoints: SELECTs go to the replica (when configured),
+    unless the client wrote within READ_YOUR_WRITES_SECONDS.
+    """
+    db = SessionLocal()
+    db.info[USE_REPLICA] = not read_your_writes(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(
+    request: Request, principal: CurrentPrincipal
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    AsyncSession counterpart of get_read_db.
+    """
+    async with AsyncSessionLocal() as db:
+        db.info[USE_REPLICA] = not read_your_writes(request)
+        yield db
+
+ReadSessionDep = Annotated[Session, Depends(get_read_db)]
+AsyncReadSessionDep = Annotated[AsyncSession, Depends(get_async_read_db)]
+
+def get_current_user(db: SessionDep, principal: CurrentPrincipal) -> User:
+    """
+    Load the current user as an ORM object.
+    Only needed by routes that read or modify the User row itself.
+    """
+    user = db.get(User, principal.id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
     return user
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+def get_current_active_superuser(current_user: CurrentPrincipal) -> AuthUser:
     """
     Ensure the current user is a superuser.
     """
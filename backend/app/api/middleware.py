@@ -0,0 +1,115 @@
+# path: app/api/middleware.py
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    DB_SECONDS_PER_REQUEST,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    REQUESTS_TOTAL,
+)
+from app.database.instrumentation import QueryStats, current_query_stats
+
+logger = logging.getLogger("app.requests")
+
+UNMATCHED_ROUTE = "unmatched"
+_MAX_STATEMENT_LENGTH = 500
+
+
+def route_id(scope: Scope) -> str:
+    """
+    라우팅 후 scope에 기록된 APIRoute의 unique_id (custom_generate_unique_id 결과)
+    """
+    route = scope.get("route")
+    return getattr(route, "unique_id", None) or getattr(route, "name", None) or UNMATCHED_ROUTE
+
+
+def server_timing(stats: QueryStats, total_seconds: float) -> str:
+    return (
+        f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries", '
+        f"app;dur={total_seconds * 1000:.2f}"
+    )
+
+
+async def track_in_flight(request: Request) -> AsyncIterator[None]:
+    """
+    앱 전역 dependency: 라우트별 처리 중 요청 수 게이지
+    (미들웨어 시점에는 아직 라우트가 결정되지 않으므로 dependency로 측정)
+    """
+    gauge = REQUESTS_IN_FLIGHT.labels(route=route_id(request.scope))
+    gauge.inc()
+    try:
+        yield
+    finally:
+        gauge.dec()
+
+
+class RequestMetricsMiddleware:
+    """
+    요청별 지연 시간 / 상태 코드 / SQL 문 수 / DB 시간 / 가장 느린 문장을 집계하는 ASGI 미들웨어.
+
+    - 응답 헤더: Server-Timing (헤더 전송 시점까지의 값, 스트리밍 본문 중 쿼리는 제외)
+    - 요청 완료 후: 구조화 로그 1줄 + route별 histogram/counter (스트리밍 포함 전체 값)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (b"server-timing", server_timing(stats, time.perf_counter() - started).encode())
+                    )
+                    message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            self._record(scope, stats, status_code, time.perf_counter() - started)
+
+    @staticmethod
+    def _record(scope: Scope, stats: QueryStats, status_code: int, elapsed: float) -> None:
+        route = route_id(scope)
+        method = scope["method"]
+        REQUEST_LATENCY.labels(route=route, method=method).observe(elapsed)
+        REQUESTS_TOTAL.labels(route=route, method=method, status=str(status_code)).inc()
+        DB_QUERIES_PER_REQUEST.labels(route=route).observe(stats.count)
+        DB_SECONDS_PER_REQUEST.labels(route=route).observe(stats.total_seconds)
+        entry: dict[str, Any] = {
+            "event": "request",
+            "route": route,
+            "method": method,
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(elapsed * 1000, 2),
+            "db_queries": stats.count,
+            "db_ms": round(stats.total_seconds * 1000, 2),
+            "db_slowest_ms": round(stats.slowest_seconds * 1000, 2),
+            "db_slowest_statement": (stats.slowest_statement or "")[:_MAX_STATEMENT_LENGTH] or None,
+        }
+        logger.info(json.dumps(entry))
@@ -2,48 +2,94 @@
 
 from typing import Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-
-from app.api.deps import get_current_user, SessionDep
-from app.models.user import User
-from app.crud.item import crud_item
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.api.batch import validate_batch_rows
+from app.api.deps import get_current_principal, AsyncReadSessionDep, AsyncSessionDep
+from app.core.user_state import AuthUser
+from app.database.session import AsyncSessionLocal
+from app.models.item import Item
+from app.utils.export import MEDIA_TYPES, ExportFormat, astream_rows, export_headers
+from app.crud.item import async_crud_item
+from app.crud.pagination import InvalidCursor
 from app.schemas.item import (
     ItemCreate,
     ItemUpdate,
     ItemPublic,
+    ItemsBatchResult,
     ItemsPublic
 )
 
 router = APIRouter()
 
 @router.get("/", response_model=ItemsPublic)
-def read_my_items(
-    db: SessionDep,
+async def read_my_items(
+    db: AsyncReadSessionDep,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user)
+    cursor: str | None = None,
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> Any:
     """
     현재 로그인한 사용자의 Item 목록을 조회
     (슈퍼유저 로직은 필요하다면 수정 가능)
+    - cursor(또는 skip 미지정) 시 keyset 페이지네이션, skip 지정 시 offset 방식
+    - count는 워커별 캐시 값일 수 있음: ITEM_COUNT_CACHE_BACKEND=memory 이고 워커가 여러 개면
+      다른 워커에서 생성/삭제한 항목이 최대 ITEM_COUNT_CACHE_TTL_SECONDS 동안 반영되지 않음
+    """
+    next_cursor = None
+    if cursor is None and skip:
+        items = await async_crud_item.get_by_owner(db=db, owner_id=current_user.id, skip=skip, limit=limit)
+    else:
+        try:
+            items, next_cursor = await async_crud_item.get_by_owner_keyset(
+                db=db, owner_id=current_user.id, cursor=cursor, limit=limit
+            )
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    count = await async_crud_item.count_by_owner(db=db, owner_id=current_user.id)
+    return ItemsPublic(data=items, count=count, next_cursor=next_cursor)
+
+
+ITEM_EXPORT_FIELDS = ("id", "title", "owner_id", "created_at", "updated_at")
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_items(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    current_user: AuthUser = Depends(get_current_principal)
+) -> StreamingResponse:
+    """
+    Item 스트리밍 내보내기 (NDJSON / CSV)
+    - 슈퍼유저: 전체 Item
+    - 일반 사용자: 본인 Item
     """
-    items = crud_item.get_by_owner(db=db, owner_id=current_user.id, skip=skip, limit=limit)
-    return ItemsPublic(data=items, count=len(items))
+    criteria = [] if current_user.is_superuser else [Item.owner_id == current_user.id]
+
+    async def generate():
+        # 요청 스코프 세션은 응답 스트리밍 전에 닫히므로 전용 세션 사용
+        async with AsyncSessionLocal() as db:
+            partitions = async_crud_item.stream_partitions(db, ITEM_EXPORT_FIELDS, *criteria)
+            async for chunk in astream_rows(partitions, ITEM_EXPORT_FIELDS, fmt):
+                yield chunk
+
+    return StreamingResponse(
+        generate(), media_type=MEDIA_TYPES[fmt], headers=export_headers("items", fmt)
+    )
 
 
 @router.get("/{item_id}", response_model=ItemPublic)
-def read_item_by_id(
+async def read_item_by_id(
     item_id: UUID,
-    db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    db: AsyncSessionDep,
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> Any:
     """
     특정 Item 상세 조회
     - 일반사용자: 본인 아이템만 조회 가능
     - 슈퍼유저: 다른 사람 아이템도 조회 가능
     """
-    db_item = crud_item.get(db=db, id=item_id)
+    db_item = await async_crud_item.get(db=db, id=item_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Item not found")
 
@@ -55,37 +101,54 @@ def read_item_by_id(
 
 
 @router.post("/", response_model=ItemPublic)
-def create_item(
+async def create_item(
     item_in: ItemCreate,
-    db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    db: AsyncSessionDep,
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> Any:
     """
     Item 생성
     - owner_id는 current_user.id 로 설정
     """
-    new_item = crud_item.create(db=db, obj_in=ItemCreate(**item_in.dict()))
-    # 생성 후, owner_id를 직접 세팅(또는 create 단계에서 포함)
-    new_item.owner_id = current_user.id
-    db.add(new_item)
-    db.commit()
-    db.refresh(new_item)
+    new_item = await async_crud_item.create_with_owner(
+        db=db, obj_in=item_in, owner_id=current_user.id
+    )
     return new_item
 
 
+@router.post("/batch", response_model=ItemsBatchResult)
+async def create_items_batch(
+    db: AsyncSessionDep,
+    rows: list[dict[str, Any]] = Body(...),
+    current_user: AuthUser = Depends(get_current_principal)
+) -> Any:
+    """
+    Item 일괄 생성
+    - 각 행을 개별 검증하고, 유효한 행만 한 트랜잭션에서 multi-row INSERT
+    - 검증 실패 행은 errors에 (index, detail)로 보고
+    """
+    valid, errors = validate_batch_rows(rows, ItemCreate)
+    items = []
+    if valid:
+        items = await async_crud_item.create_many(
+            db=db, objs_in=[item_in for _, item_in in valid], owner_id=current_user.id
+        )
+    return ItemsBatchResult(data=items, count=len(items), errors=errors)
+
+
 @router.patch("/{item_id}", response_model=ItemPublic)
-def update_item(
+async def update_item(
     item_id: UUID,
     item_in: ItemUpdate,
-    db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    db: AsyncSessionDep,
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> Any:
     """
     특정 Item 업데이트
     - 일반 사용자: 본인 아이템만 수정
     - 슈퍼유저: 다른 사람 아이템도 수정 가능
     """
-    db_item = crud_item.get(db=db, id=item_id)
+    db_item = await async_crud_item.get(db=db, id=item_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Item not found")
 
@@ -93,27 +156,27 @@ def update_item(
     if (db_item.owner_id != current_user.id) and (not current_user.is_superuser):
         raise HTTPException(status_code=403, detail="Not enough privileges")
 
-    updated_item = crud_item.update(db=db, db_obj=db_item, obj_in=item_in)
+    updated_item = await async_crud_item.update(db=db, db_obj=db_item, obj_in=item_in)
     return updated_item
 
 
 @router.delete("/{item_id}")
-def delete_item(
+async def delete_item(
     item_id: UUID,
-    db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    db: AsyncSessionDep,
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> Any:
     """
     특정 Item 삭제
     - 일반 사용자: 본인 아이템만 삭제
     - 슈퍼유저: 다른 사람 아이템도 삭제 가능
     """
-    db_item = crud_item.get(db=db, id=item_id)
+    db_item = await async_crud_item.get(db=db, id=item_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Item not found")
 
     if (db_item.owner_id != current_user.id) and (not current_user.is_superuser):
         raise HTTPException(status_code=403, detail="Not enough privileges")
 
-    crud_item.remove(db=db, id=item_id)
+    await async_crud_item.remove(db=db, id=item_id)
     return {"message": "Item deleted successfully"}
@@ -1,21 +1,24 @@
 from datetime import timedelta
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
+from app.crud.token import crud_refresh_token
 from app.crud.user import crud_user
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core import security
 from app.core.config import settings
+from app.core.rate_limit import login_rate_limiter
 from app.core.security import get_password_hash
-from app.schemas.token import Message, NewPassword, Token
+from app.core.user_state import invalidate_user_state
+from app.schemas.token import Message, NewPassword, RefreshTokenRequest, Token
 from app.schemas.user import UserPublic
 from app.utils.utils import (
     generate_password_reset_token,
     generate_reset_password_email,
-    send_email,
+    enqueue_email,
     verify_password_reset_token,
 )
 
@@ -24,11 +27,17 @@ router = APIRouter()
 
 @router.post("/access-token")
 def login_access_token(
-    db: SessionDep, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
+    request: Request, db: SessionDep, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
 ) -> Token:
     """
     OAuth2 compatible token login, get an access token for future requests
+    and a refresh token to renew it with /login/refresh
+    (throttled per email and per client IP before the DB lookup and bcrypt verify;
+    a successful login clears the email's failed attempts)
     """
+    login_rate_limiter.check(
+        email=form_data.username, ip=request.client.host if request.client else None
+    )
     user = crud_user.authenticate(
         db=db, email=form_data.username, password=form_data.password
     )
@@ -36,14 +45,46 @@ def login_access_token(
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    login_rate_limiter.reset_email(form_data.username)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return Token(
         access_token=security.create_access_token(
             user.id, expires_delta=access_token_expires
-        )
+        ),
+        refresh_token=crud_refresh_token.issue(db, user_id=user.id),
+    )
+
+
+@router.post("/refresh")
+def refresh_access_token(db: SessionDep, body: RefreshTokenRequest) -> Token:
+    """
+    Exchange a refresh token for a new access token and a new refresh token.
+    The presented token is revoked; reusing a revoked token revokes its whole family.
+    Tokens of inactive users are rejected without issuing a new one.
+    No password hashing happens here.
+    """
+    rotated = crud_refresh_token.rotate(db, token=body.refresh_token)
+    if rotated is None:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    user_id, refresh_token = rotated
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return Token(
+        access_token=security.create_access_token(
+            user_id, expires_delta=access_token_expires
+        ),
+        refresh_token=refresh_token,
     )
 
 
+@router.post("/logout")
+def logout(db: SessionDep, body: RefreshTokenRequest) -> Message:
+    """
+    Revoke a refresh token (and the tokens rotated from the same login)
+    """
+    crud_refresh_token.revoke(db, token=body.refresh_token)
+    return Message(message="Logged out")
+
+
 @router.post("/login/test-token", response_model=UserPublic)
 def test_token(current_user: CurrentUser) -> Any:
     """
@@ -68,7 +109,7 @@ def recover_password(email: str, db: SessionDep) -> Message:
     email_data = generate_reset_password_email(
         email_to=user.email, email=email, token=password_reset_token
     )
-    send_email(
+    enqueue_email(
         email_to=user.email,
         subject=email_data.subject,
         html_content=email_data.html_content,
@@ -95,7 +136,9 @@ def reset_password(db: SessionDep, body: NewPassword) -> Message:
     hashed_password = get_password_hash(password=body.new_password)
     user.hashed_password = hashed_password
     db.add(user)
+    crud_refresh_token.revoke_all_for_user(db, user_id=user.id, commit=False)
     db.commit()
+    invalidate_user_state(user.id)
     return Message(message="Password updated successfully")
 
 
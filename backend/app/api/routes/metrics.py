@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render_latest
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Prometheus scrape endpoint (all uvicorn workers when PROMETHEUS_MULTIPROC_DIR is set)
+    """
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
@@ -1,7 +1,10 @@
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
-from app.api.deps import SessionDep, get_current_active_superuser, get_current_user
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from app.api.caching import cached_json_response
+from app.api.deps import ReadSessionDep, SessionDep, get_current_active_superuser, get_current_principal
+from app.core.response_cache import profile_cache_key, response_cache, roles_cache_key
+from app.core.user_state import AuthUser
 from app.schemas.profile import (
     ProfileCreate,
     ProfileUpdate,
@@ -15,7 +18,7 @@ from app.schemas.role import (
 )
 from app.schemas.token import Message
 from app.crud.profile import crud_profile, crud_role
-from app.models.user import User
+from app.crud.pagination import InvalidCursor
 
 router = APIRouter()
 
@@ -26,25 +29,50 @@ router = APIRouter()
 # ===================================================================
 #
 
-@router.get("/roles", response_model=RolesPublic, dependencies=[Depends(get_current_active_superuser)])
+@router.get(
+    "/roles",
+    response_class=Response,
+    responses={200: {"model": RolesPublic}, 304: {"description": "Not Modified"}},
+    dependencies=[Depends(get_current_active_superuser)],
+)
 def read_roles(
-    db: SessionDep,
+    request: Request,
+    db: ReadSessionDep,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_superuser),
-) -> RolesPublic:
+    cursor: str | None = None,
+    current_user: AuthUser = Depends(get_current_active_superuser),
+) -> Response:
     """
     [관리자 전용] Role 목록 조회
-    """
-    roles = crud_role.get_multi(db=db, skip=skip, limit=limit)
-    return RolesPublic(data=[RolePublic.model_validate(u) for u in roles], count=len(roles))
+    - cursor(또는 skip 미지정) 시 keyset 페이지네이션 (Role은 id 기준), skip 지정 시 offset 방식
+    - 직렬화된 응답을 캐시하며 ETag/If-None-Match 지원 (Role 생성/수정/삭제 시 무효화)
+    """
+    key = roles_cache_key(skip, limit, cursor)
+    entry = response_cache.get(key)
+    if entry is None:
+        next_cursor = None
+        if cursor is None and skip:
+            roles = crud_role.get_multi(db=db, skip=skip, limit=limit)
+        else:
+            try:
+                roles, next_cursor = crud_role.get_multi_keyset(db=db, cursor=cursor, limit=limit)
+            except InvalidCursor:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        body = RolesPublic(
+            data=[RolePublic.model_validate(u) for u in roles],
+            count=crud_role.count(db=db, mode="exact"),
+            next_cursor=next_cursor,
+        ).model_dump_json().encode()
+        entry = response_cache.set(key, body)
+    return cached_json_response(request, entry)
 
 
 @router.get("/roles/{role_id}", response_model=RolePublic, dependencies=[Depends(get_current_active_superuser)])
 def read_role_by_id(
     role_id: int,
     db: SessionDep,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: AuthUser = Depends(get_current_active_superuser),
 ) -> RolePublic:
     """
     [관리자 전용] 특정 Role 정보 조회
@@ -59,7 +87,7 @@ def read_role_by_id(
 def create_role(
     role_in: RoleCreate,
     db: SessionDep,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: AuthUser = Depends(get_current_active_superuser),
 ) -> RoleCreate:
     """
     [관리자 전용] Role 생성
@@ -74,7 +102,7 @@ def update_role(
     role_id: int,
     role_in: RoleUpdate,
     db: SessionDep,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: AuthUser = Depends(get_current_active_superuser),
 ) -> RolePublic:
     """
     [관리자 전용] Role 정보 수정
@@ -90,7 +118,7 @@ def update_role(
 def delete_role(
     role_id: int,
     db: SessionDep,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: AuthUser = Depends(get_current_active_superuser),
 ) -> Message:
     """
     [관리자 전용] Role 삭제
@@ -111,19 +139,29 @@ def delete_role(
 # ===================================================================
 #
 
-@router.get("/{user_id}", response_model=ProfilePublic)
+@router.get(
+    "/{user_id}",
+    response_class=Response,
+    responses={200: {"model": ProfilePublic}, 304: {"description": "Not Modified"}},
+)
 def read_profile(
+    request: Request,
     user_id: UUID,
-    db: SessionDep,
-    current_user: User = Depends(get_current_user),
-) -> ProfilePublic:
+    db: ReadSessionDep,
+    current_user: AuthUser = Depends(get_current_principal),
+) -> Response:
     """
     특정 사용자와 Profile 조회
+    - 직렬화된 응답을 캐시하며 ETag/If-None-Match 지원 (프로필/Role 수정 시 무효화)
     """
-    profile = crud_profile.get_by_user_id(db=db, user_id=user_id)
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found")
-    return ProfilePublic.model_validate(profile)
+    key = profile_cache_key(user_id)
+    entry = response_cache.get(key)
+    if entry is None:
+        profile = crud_profile.get_by_user_id(db=db, user_id=user_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        entry = response_cache.set(key, ProfilePublic.model_validate(profile).model_dump_json().encode())
+    return cached_json_response(request, entry)
 
 
 @router.post("/{user_id}", response_model=ProfilePublic)
@@ -131,7 +169,7 @@ def create_profile(
     user_id: UUID,
     profile_in: ProfileCreate,
     db: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_principal),
 ) -> ProfilePublic:
     """
     특정 사용자에 Profile 생성
@@ -159,7 +197,7 @@ def update_profile(
     user_id: UUID,
     profile_in: ProfileUpdate,
     db: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_principal),
 ) -> ProfilePublic:
     """
     특정 사용자 Profile 수정 (role_ids 포함)
@@ -1,8 +1,15 @@
 
+from typing import Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import joinedload
-from app.api.deps import SessionDep, get_current_active_superuser, get_current_user
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
+from app.api.batch import validate_batch_rows
+from app.api.deps import ReadSessionDep, SessionDep, get_current_active_superuser, get_current_principal, get_current_user
+from app.core.config import settings
+from app.core.user_state import AuthUser
+from app.database.session import SessionLocal
+from app.utils.export import MEDIA_TYPES, ExportFormat, export_headers, stream_rows
 from app.core.security import verify_password
 from app.schemas.user import (
     UserCreate,
@@ -10,14 +17,17 @@ from app.schemas.user import (
     UserUpdate,
     UserPublic,
     UsersPublic,
+    UsersBatchResult,
     UpdatePassword,
 )
 from app.schemas.profile import (
     ProfileCreate,
 )
-from app.schemas.token import Message
-from app.crud.user import crud_user
+from app.schemas.token import BatchRowError, Message
+from app.crud.user import EmailAlreadyExists, UnknownRoles, crud_user
 from app.crud.profile import crud_profile
+from app.crud.pagination import InvalidCursor
+from app.crud.token import crud_refresh_token
 from app.models.user import User
 
 router = APIRouter()
@@ -27,15 +37,53 @@ router = APIRouter()
 # --------------------------------------------------------
 @router.get("/", dependencies=[Depends(get_current_active_superuser)], response_model=UsersPublic)
 def read_users(
-    db: SessionDep,
+    db: ReadSessionDep,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: str | None = None,
 ) -> UsersPublic:
     """
     [관리자 전용] 모든 사용자 목록 조회
+    - cursor(또는 skip 미지정) 시 keyset 페이지네이션, 응답의 next_cursor로 다음 페이지 조회
+    - skip 지정 시 기존 offset 방식
+    """
+    next_cursor = None
+    if cursor is None and skip:
+        users = crud_user.get_multi(db=db, skip=skip, limit=limit)
+    else:
+        try:
+            users, next_cursor = crud_user.get_multi_keyset(db=db, cursor=cursor, limit=limit)
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return UsersPublic(
+        data=[UserPublic.model_validate(u) for u in users],
+        count=crud_user.count(db=db),
+        next_cursor=next_cursor,
+    )
+
+# --------------------------------------------------------
+# [관리자 전용] 전체 사용자 스트리밍 내보내기 (NDJSON / CSV)
+# - "/{user_id}" 보다 먼저 선언해야 경로 충돌이 없음
+# --------------------------------------------------------
+USER_EXPORT_FIELDS = ("id", "email", "full_name", "is_active", "is_superuser", "created_at", "updated_at")
+
+@router.get("/export", dependencies=[Depends(get_current_active_superuser)], response_class=StreamingResponse)
+def export_users(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+) -> StreamingResponse:
+    """
+    [관리자 전용] 모든 사용자를 server-side cursor로 스트리밍
     """
-    users = crud_user.get_multi(db=db, skip=skip, limit=limit)
-    return UsersPublic(data=[UserPublic.model_validate(u) for u in users], count=len(users))
+    def generate():
+        # 요청 스코프 세션은 응답 스트리밍 전에 닫히므로 전용 세션 사용
+        with SessionLocal() as db:
+            yield from stream_rows(
+                crud_user.iter_partitions(db, USER_EXPORT_FIELDS), USER_EXPORT_FIELDS, fmt
+            )
+
+    return StreamingResponse(
+        generate(), media_type=MEDIA_TYPES[fmt], headers=export_headers("users", fmt)
+    )
 
 # --------------------------------------------------------
 # 현재 로그인한 사용자 정보 조회
@@ -43,17 +91,13 @@ def read_users(
 @router.get("/me", response_model=UserPublic)
 def read_user_me(
     db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> UserPublic:
     """
     현재 로그인한 사용자 정보 조회
     """
-    user = (
-        db.query(User)
-        .options(joinedload(User.profile))
-        .filter(User.id == current_user.id)
-        .first()
-    )
+    # UserPublic은 관계를 직렬화하지 않으므로 profile join 없이 조회
+    user = crud_user.get(db=db, id=current_user.id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return UserPublic.model_validate(user)
@@ -64,7 +108,7 @@ def read_user_me(
 @router.delete("/me", response_model=Message)
 def delete_user_me(
     db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> Message:
     """
     현재 사용자 계정 삭제 (관리자는 불가)
@@ -95,6 +139,8 @@ def update_password_me(
         db_obj=current_user,
         obj_in=UserUpdate(password=body.new_password)
     )
+    # 다른 기기에 발급된 refresh token도 더 이상 사용할 수 없게 함
+    crud_refresh_token.revoke_all_for_user(db, user_id=current_user.id)
     return Message(message="Password updated successfully")
 
 # --------------------------------------------------------
@@ -103,13 +149,14 @@ def update_password_me(
 @router.get("/{user_id}", response_model=UserPublic)
 def read_user_by_id(
     user_id: UUID,
-    db: SessionDep,
-    current_user: User = Depends(get_current_user)
+    db: ReadSessionDep,
+    current_user: AuthUser = Depends(get_current_principal)
 ) -> UserPublic:
     """
     특정 사용자 정보 조회
     """
-    user = crud_user.get_with_relations(db=db, user_id=user_id)
+    # UserPublic은 items/profile을 직렬화하지 않으므로 관계 로딩 없이 조회
+    user = crud_user.get(db=db, id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     # 권한 체크
@@ -129,29 +176,74 @@ def create_user(
     """
     [관리자 전용] 사용자 생성
     """
-    if crud_user.get_user_by_email(db=db, email=user_in.email):
+    # User + 빈 프로필을 한 트랜잭션에서 생성 (이메일 중복은 ON CONFLICT로 확인)
+    try:
+        user = crud_user.create_with_profile(db=db, obj_in=user_in)
+    except EmailAlreadyExists:
         raise HTTPException(status_code=400, detail="Email already exists")
+    except UnknownRoles as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # 1. User 생성
-    user = crud_user.create_user(db=db, obj_in=user_in)
+    return UserPublic.model_validate(user)
 
-    # ------------------------------------------------
-    # 2. User 생성 후 "빈 프로필" 자동 생성
-    # ------------------------------------------------
-    crud_profile.create(
-        db=db,
-        obj_in=ProfileCreate(
-            user_id=user.id,
-            first_name="",
-            last_name="",
-            avatar_url="",
-            bio="",
-            birth_date=None
-        )
-    )
-    # ------------------------------------------------
+# --------------------------------------------------------
+# [관리자 전용] 사용자 일괄 생성
+# - 사용자 + 빈 프로필을 한 트랜잭션에서 multi-row INSERT
+# --------------------------------------------------------
+@router.post("/batch", response_model=UsersBatchResult, dependencies=[Depends(get_current_active_superuser)])
+def create_users_batch(
+    db: SessionDep,
+    rows: list[dict[str, Any]] = Body(...),
+) -> UsersBatchResult:
+    """
+    [관리자 전용] 사용자 일괄 생성
+    - 각 행을 개별 검증하고, 이메일 중복(배치 내/기존)은 행별 오류로 보고
+    - 행마다 비밀번호 해싱이 필요하므로 USER_BATCH_MAX_ROWS로 별도 제한
+    """
+    valid, errors = validate_batch_rows(rows, UserCreate, max_rows=settings.USER_BATCH_MAX_ROWS)
 
-    return UserPublic.model_validate(user)
+    # 기존 이메일은 한 번의 쿼리로 확인
+    existing = crud_user.get_existing_emails(db=db, emails=[user_in.email for _, user_in in valid])
+    seen: set[str] = set()
+    to_create: list[UserCreate] = []
+    for index, user_in in valid:
+        email = user_in.email.lower()
+        if email in existing or email in seen:
+            errors.append(BatchRowError(index=index, detail="Email already exists"))
+            continue
+        seen.add(email)
+        to_create.append(user_in)
+    errors.sort(key=lambda error: error.index)
+
+    users = []
+    if to_create:
+        try:
+            users = crud_user.create_users_many(db=db, objs_in=to_create, commit=False)
+            crud_profile.create_many(
+                db=db,
+                objs_in=[
+                    ProfileCreate(
+                        user_id=user.id,
+                        first_name="",
+                        last_name="",
+                        avatar_url="",
+                        bio="",
+                        birth_date=None
+                    )
+                    for user in users
+                ],
+                commit=False,
+            )
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+
+    return UsersBatchResult(
+        data=[UserPublic.model_validate(u) for u in users],
+        count=len(users),
+        errors=errors,
+    )
 
 # --------------------------------------------------------
 # [관리자 전용] 사용자 정보 업데이트
@@ -184,7 +276,7 @@ def update_user(
 def delete_user(
     user_id: UUID,
     db: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_principal),
 ) -> Message:
     """
     [관리자 전용] 사용자 삭제
@@ -210,27 +302,13 @@ def register_user(
     """
     회원가입 요청
     """
-    if crud_user.get_user_by_email(db=db, email=user_in.email):
+    # User + 빈 프로필을 한 트랜잭션에서 생성 (이메일 중복은 ON CONFLICT로 확인)
+    try:
+        user = crud_user.create_with_profile(db=db, obj_in=user_in.to_user_create())
+    except EmailAlreadyExists:
         raise HTTPException(status_code=400, detail="Email already exists")
-
-    # 1. User 생성
-    user = crud_user.create_user(db=db, obj_in=user_in.to_user_create())
-
-    # ------------------------------------------------
-    # 2. 빈 프로필 자동 생성
-    # ------------------------------------------------
-    crud_profile.create_profile(
-        db=db,
-        obj_in=ProfileCreate(
-            user_id=user.id,
-            first_name="",
-            last_name="",
-            avatar_url="",
-            bio="",
-            birth_date=None
-        )
-    )
-    # ------------------------------------------------
+    except UnknownRoles as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return UserPublic.model_validate(user)
 
@@ -1,9 +1,20 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic.networks import EmailStr
 
-from app.api.deps import get_current_active_superuser, get_current_user
+from app.api.deps import get_current_active_superuser, get_current_principal
+from app.core.security import password_hasher
+from app.core.user_state import access_token_cache
+from app.database.pool import get_pool_stats
+from app.database.session import async_engine, async_replica_engine, engine, replica_engine
+from app.schemas.metrics import CacheStatus, MailQueueStatus, PasswordHasherStatus, PoolsStatus, PoolStatus
 from app.schemas.token import Message
-from app.utils.utils import generate_test_email, generate_verification_email, send_email
+from app.utils.utils import (
+    enqueue_email,
+    generate_test_email,
+    generate_verification_email,
+    mail_queue,
+    send_generated_email_async,
+)
 
 router = APIRouter()
 
@@ -13,23 +24,25 @@ router = APIRouter()
     dependencies=[Depends(get_current_active_superuser)],
     status_code=201,
 )
-def test_email(email_to: EmailStr) -> Message:
+async def test_email(email_to: EmailStr) -> Message:
     """
     Test emails.
+    Sent right away over the async SMTP transport (not queued), so SMTP
+    misconfiguration is reported to the caller instead of only in the dead-letter table.
     """
-    email_data = generate_test_email(email_to=email_to)
-    send_email(
-        email_to=email_to,
-        subject=email_data.subject,
-        html_content=email_data.html_content,
-    )
+    import aiosmtplib  # lazy: see LAZY_MODULES in app/benchmarks/importtime.py
+
+    try:
+        await send_generated_email_async(generate_test_email, email_to=email_to)
+    except (aiosmtplib.SMTPException, OSError) as e:
+        raise HTTPException(status_code=502, detail=f"SMTP delivery failed: {e}")
     return Message(message="Test email sent")
 
 
 
 @router.post(
     "/verification_email/",
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_principal)],
     status_code=201,
 )
 def verification_email(email_to: EmailStr) -> Message:
@@ -37,13 +50,70 @@ def verification_email(email_to: EmailStr) -> Message:
     Family verification email
     """
     email_data = generate_verification_email(email_to=email_to)
-    send_email(
+    enqueue_email(
         email_to=email_to,
         subject=email_data.subject,
         html_content=email_data.html_content,
     )
     return Message(message="Test email sent")
 
+@router.get(
+    "/db-pool/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=PoolsStatus,
+)
+def db_pool_status() -> PoolsStatus:
+    """
+    DB connection pool metrics for the worker that served this request.
+    """
+    pools = [
+        PoolStatus(name="sync", **get_pool_stats(engine)),
+        PoolStatus(name="async", **get_pool_stats(async_engine.sync_engine)),
+    ]
+    if replica_engine is not None and async_replica_engine is not None:
+        pools += [
+            PoolStatus(name="replica", **get_pool_stats(replica_engine)),
+            PoolStatus(name="async-replica", **get_pool_stats(async_replica_engine.sync_engine)),
+        ]
+    return PoolsStatus(data=pools, count=len(pools))
+
+
+@router.get(
+    "/password-hasher/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=PasswordHasherStatus,
+)
+def password_hasher_status() -> PasswordHasherStatus:
+    """
+    Password hashing pool queue depth and latency for this worker.
+    """
+    return PasswordHasherStatus(**password_hasher.stats())
+
+
+@router.get(
+    "/mail-queue/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=MailQueueStatus,
+)
+def mail_queue_status() -> MailQueueStatus:
+    """
+    Background mail queue depth and delivery counters for this worker.
+    """
+    return MailQueueStatus(**mail_queue.stats())
+
+
+@router.get(
+    "/access-token-cache/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=CacheStatus,
+)
+def access_token_cache_status() -> CacheStatus:
+    """
+    Verified access-token cache size and hit/miss counters for this worker.
+    """
+    return CacheStatus(**access_token_cache.stats())
+
+
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
@@ -0,0 +1,66 @@
+"""
+Email template rendering microbenchmark.
+
+    python -m app.benchmarks.email_templates [--seconds 2]
+
+Compares the previous per-call path (read the file and build a new
+jinja2.Template every time) with the precompiled EmailTemplateRegistry.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from jinja2 import Template
+
+from app.utils.email_templates import EMAIL_TEMPLATES_DIR, EmailTemplateRegistry
+
+CONTEXT: dict[str, Any] = {
+    "project_name": "Benchmark",
+    "username": "user@example.com",
+    "email": "user@example.com",
+    "password": "secret",
+    "valid_hours": 48,
+    "link": "http://localhost:5173/reset-password?token=abc",
+}
+
+
+def render_uncached(name: str) -> str:
+    return Template((EMAIL_TEMPLATES_DIR / name).read_text()).render(CONTEXT)
+
+
+def measure(render: Callable[[str], str], names: list[str], seconds: float) -> float:
+    renders = 0
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for name in names:
+            render(name)
+        renders += len(names)
+    return renders / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of each run")
+    args = parser.parse_args()
+
+    registry = EmailTemplateRegistry(directory=EMAIL_TEMPLATES_DIR, auto_reload=False)
+    registry.preload()
+    reloading = EmailTemplateRegistry(directory=EMAIL_TEMPLATES_DIR, auto_reload=True)
+    reloading.preload()
+    names = registry.names()
+
+    results = {
+        "uncached (read + compile per render)": measure(render_uncached, names, args.seconds),
+        "registry": measure(lambda name: registry.render(name, CONTEXT), names, args.seconds),
+        "registry, mtime reload (local)": measure(lambda name: reloading.render(name, CONTEXT), names, args.seconds),
+    }
+    baseline = next(iter(results.values()))
+    for label, rate in results.items():
+        print(f"{label:40s} {rate:12,.0f} renders/s  x{rate / baseline:.1f}")
+
+
+if __name__ == "__main__":
+    main()
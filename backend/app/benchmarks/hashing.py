@@ -0,0 +1,137 @@
+"""
+Password hashing throughput per policy (login capacity vs. hash strength).
+
+    python -m app.benchmarks.hashing [--policy bcrypt:12 --policy argon2:t=2,m=19456,p=1 ...]
+                                     [--duration 3] [--json out.json]
+
+Hashes in a loop for each policy and reports hashes per second of wall time and
+per CPU-second (= per core; argon2 with p>1 uses several threads per hash).
+The configured policy is always included; argon2 policies are skipped when
+argon2-cffi is not installed. Expected login capacity of one worker is roughly
+per-core throughput x PASSWORD_HASH_WORKERS.
+"""
+
+import argparse
+import importlib.util
+import json
+import time
+from dataclasses import asdict, dataclass
+
+from app.core.config import settings
+from app.core.security import PasswordPolicy, password_policy
+
+DEFAULT_POLICIES = (
+    "bcrypt:10",
+    "bcrypt:12",
+    "bcrypt:13",
+    "argon2:t=2,m=19456,p=1",
+    "argon2:t=3,m=65536,p=1",
+    "argon2:t=1,m=47104,p=1",
+)
+
+
+@dataclass
+class HashingResult:
+    policy: str
+    hashes: int
+    wall_seconds: float
+    cpu_seconds: float
+
+    @property
+    def hashes_per_second(self) -> float:
+        return self.hashes / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def hashes_per_core_second(self) -> float:
+        return self.hashes / self.cpu_seconds if self.cpu_seconds else 0.0
+
+    @property
+    def ms_per_hash(self) -> float:
+        return self.wall_seconds * 1000 / self.hashes if self.hashes else 0.0
+
+
+def parse_policy(spec: str) -> PasswordPolicy:
+    """
+    "bcrypt:12" 또는 "argon2:t=2,m=19456,p=1" 형식의 정책 문자열 파싱
+    """
+    scheme, _, params = spec.partition(":")
+    if scheme == "bcrypt":
+        return PasswordPolicy(scheme="bcrypt", bcrypt_rounds=int(params or 12))
+    if scheme == "argon2":
+        values = dict(item.split("=", 1) for item in params.split(",") if item)
+        unknown = set(values) - {"t", "m", "p"}
+        if unknown:
+            raise ValueError(f"unknown argon2 parameters: {', '.join(sorted(unknown))}")
+        default = PasswordPolicy()
+        return PasswordPolicy(
+            scheme="argon2",
+            argon2_time_cost=int(values.get("t", default.argon2_time_cost)),
+            argon2_memory_cost_kib=int(values.get("m", default.argon2_memory_cost_kib)),
+            argon2_parallelism=int(values.get("p", default.argon2_parallelism)),
+        )
+    raise ValueError(f"unknown scheme in policy {spec!r} (expected bcrypt:<rounds> or argon2:t=..,m=..,p=..)")
+
+
+def measure(policy: PasswordPolicy, *, duration: float, min_hashes: int = 3) -> HashingResult:
+    context = policy.context()
+    context.hash("warm-up")  # backend loading is not part of the measurement
+    hashes = 0
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    while hashes < min_hashes or time.perf_counter() - wall_started < duration:
+        context.hash(f"benchmark-password-{hashes}")
+        hashes += 1
+    return HashingResult(
+        policy=policy.label,
+        hashes=hashes,
+        wall_seconds=time.perf_counter() - wall_started,
+        cpu_seconds=time.process_time() - cpu_started,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--policy", action="append", help="policy to measure (repeatable); defaults to a preset list")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds of hashing per policy")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    policies = [parse_policy(spec) for spec in (args.policy or DEFAULT_POLICIES)]
+    if password_policy not in policies:
+        policies.insert(0, password_policy)
+    if importlib.util.find_spec("argon2") is None:
+        skipped = [policy.label for policy in policies if policy.scheme == "argon2"]
+        if skipped:
+            print(f"argon2-cffi not installed, skipping: {', '.join(skipped)}")
+        policies = [policy for policy in policies if policy.scheme != "argon2"]
+
+    results = []
+    print(f"{'policy':44s} {'ms/hash':>9s} {'hash/s':>9s} {'hash/s/core':>12s}")
+    for policy in policies:
+        result = measure(policy, duration=args.duration)
+        results.append(result)
+        marker = "*" if policy == password_policy else " "
+        print(
+            f"{marker}{result.policy:43s} {result.ms_per_hash:9.1f} "
+            f"{result.hashes_per_second:9.1f} {result.hashes_per_core_second:12.1f}"
+        )
+    print(f"* current policy; password hash workers per web worker: {settings.PASSWORD_HASH_WORKERS}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                [
+                    {
+                        **asdict(result),
+                        "hashes_per_second": result.hashes_per_second,
+                        "hashes_per_core_second": result.hashes_per_core_second,
+                    }
+                    for result in results
+                ],
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
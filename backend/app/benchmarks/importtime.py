@@ -0,0 +1,109 @@
+"""
+Import-time profile of the application (cold start of a worker or test run).
+
+    python -m app.benchmarks.importtime [--budget-ms 2000] [--runs 5] [--json out.json]
+
+Runs `python -X importtime -c "import app.main"` in fresh interpreters, prints
+the total and the slowest top-level packages (self time summed per package),
+and exits with status 1 when the best run exceeds the budget or when a module
+that must stay lazy (emails, jinja2, sentry_sdk) was imported.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+LAZY_MODULES = ("aiosmtplib", "emails", "jinja2", "sentry_sdk")
+
+
+@dataclass
+class ImportProfile:
+    total_us: int
+    self_us_by_package: dict[str, int] = field(default_factory=dict)
+    modules: set[str] = field(default_factory=set)
+
+
+def parse_importtime(stderr: str, target: str) -> ImportProfile:
+    """
+    -X importtime 출력 ("import time: self [us] | cumulative | imported package") 파싱
+    """
+    total_us = 0
+    by_package: dict[str, int] = defaultdict(int)
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        modules.add(module)
+        by_package[module.split(".")[0]] += int(self_us)
+        if module == target:
+            total_us = int(cumulative_us)
+    return ImportProfile(total_us=total_us, self_us_by_package=dict(by_package), modules=modules)
+
+
+def profile_once(target: str) -> ImportProfile:
+    # Sentry은 DSN이 있을 때만 import 되므로, 측정은 DSN 없이 수행
+    env = {**os.environ, "SENTRY_DSN": ""}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr, target)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="app.main", help="module to import")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters; the best run is compared to the budget")
+    parser.add_argument("--budget-ms", type=float, help="fail when the best run is slower than this")
+    parser.add_argument("--top", type=int, default=15, help="packages to list")
+    parser.add_argument("--json", help="write the summary to this file")
+    args = parser.parse_args()
+
+    profiles = [profile_once(args.target) for _ in range(args.runs)]
+    totals_ms = [profile.total_us / 1000 for profile in profiles]
+    best = min(profiles, key=lambda profile: profile.total_us)
+    best_ms = best.total_us / 1000
+
+    print(f"import {args.target}: best {best_ms:.0f} ms, median {statistics.median(totals_ms):.0f} ms ({args.runs} runs)")
+    top = sorted(best.self_us_by_package.items(), key=lambda item: item[1], reverse=True)[: args.top]
+    for package, self_us in top:
+        print(f"  {package:30s} {self_us / 1000:8.1f} ms")
+
+    failures = [f"{module} is imported eagerly" for module in LAZY_MODULES if module in best.modules]
+    if args.budget_ms is not None and best_ms > args.budget_ms:
+        failures.append(f"import time {best_ms:.0f} ms exceeds the budget of {args.budget_ms:.0f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "target": args.target,
+                    "best_ms": best_ms,
+                    "median_ms": statistics.median(totals_ms),
+                    "runs_ms": totals_ms,
+                    "packages_ms": {package: self_us / 1000 for package, self_us in top},
+                    "budget_ms": args.budget_ms,
+                    "failures": failures,
+                },
+                f,
+                indent=2,
+            )
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
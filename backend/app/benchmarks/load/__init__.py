@@ -0,0 +1,11 @@
+"""
+API load-testing suite.
+
+    python -m app.benchmarks.load seed --users 1000 --items-per-user 20 --roles 50
+    python -m app.benchmarks.load run --base-url http://localhost:8000 --concurrency 50 --duration 60
+    python -m app.benchmarks.load compare load-results/before.json load-results/after.json
+
+Seeds users/items/roles directly into the configured Postgres database, drives a
+weighted mix of API calls with an asyncio/httpx client and writes per-endpoint
+p50/p95/p99 latency and throughput as JSON.
+"""
@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from app.benchmarks.load import __doc__ as USAGE
+from app.benchmarks.load.driver import ADMIN_MIX, USER_MIX, LoadConfig, run_load
+from app.benchmarks.load.seed import DEFAULT_PASSWORD
+from app.benchmarks.load.stats import PERCENTILES, Recorder, compare
+from app.core.config import settings
+
+RESULTS_DIR = Path("load-results")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def cmd_seed(args: argparse.Namespace) -> None:
+    from app.benchmarks.load.seed import reset, seed
+    from app.database.session import engine
+
+    with engine.begin() as conn:
+        if args.reset_only:
+            reset(conn)
+            print("Removed load-test data")
+            return
+        seed(
+            conn,
+            users=args.users,
+            items_per_user=args.items_per_user,
+            roles=args.roles,
+            password=args.password,
+        )
+    print(f"Seeded {args.users} users, {args.users * args.items_per_user} items, {args.roles} roles")
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    config = LoadConfig(
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        admin_concurrency=args.admin_concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        seeded_users=args.seeded_users,
+        password=args.password,
+        admin_email=settings.FIRST_SUPERUSER,
+        admin_password=settings.FIRST_SUPERUSER_PASSWORD,
+        page_size=args.page_size,
+        seed=args.seed,
+    )
+    recorder = Recorder()
+    elapsed = asyncio.run(run_load(config, recorder))
+    result: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "config": {
+                key: value
+                for key, value in vars(config).items()
+                if key not in ("password", "admin_password")
+            },
+            "mix": {"user": USER_MIX, "admin": ADMIN_MIX},
+            "measured_seconds": elapsed,
+        },
+        **recorder.summary(elapsed),
+    }
+    output = args.output or RESULTS_DIR / f"load-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+
+    header = " ".join(f"{f'p{pct}':>8s}" for pct in PERCENTILES)
+    print(f"{'endpoint':20s} {'requests':>9s} {'errors':>7s} {'rps':>8s} {header}")
+    for name, stats in [*result["endpoints"].items(), ("TOTAL", result["total"])]:
+        values = " ".join(f"{stats[f'p{pct}_ms']:8.1f}" for pct in PERCENTILES)
+        print(f"{name:20s} {stats['requests']:9d} {stats['errors']:7d} {stats['throughput_rps']:8.1f} {values}")
+    print(f"\nResults written to {output}")
+
+
+def cmd_compare(args: argparse.Namespace) -> None:
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    lines, regressed = compare(baseline, current, args.max_regression)
+    print("\n".join(lines))
+    if regressed:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.benchmarks.load", description=USAGE, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="seed load-test users/items/roles")
+    seed_parser.add_argument("--users", type=int, default=1000)
+    seed_parser.add_argument("--items-per-user", type=int, default=20)
+    seed_parser.add_argument("--roles", type=int, default=50)
+    seed_parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    seed_parser.add_argument("--reset-only", action="store_true", help="only remove previously seeded data")
+    seed_parser.set_defaults(func=cmd_seed)
+
+    run_parser = commands.add_parser("run", help="drive the API and write JSON results")
+    run_parser.add_argument("--base-url", default="http://localhost:8000")
+    run_parser.add_argument("--concurrency", type=int, default=50, help="regular virtual users")
+    run_parser.add_argument("--admin-concurrency", type=int, default=2, help="superuser virtual users")
+    run_parser.add_argument("--duration", type=float, default=60.0, help="measured seconds")
+    run_parser.add_argument("--warmup", type=float, default=10.0, help="unmeasured seconds before measuring")
+    run_parser.add_argument("--seeded-users", type=int, default=1000, help="--users used when seeding")
+    run_parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    run_parser.add_argument("--page-size", type=int, default=20)
+    run_parser.add_argument("--seed", type=int, default=42, help="random seed for the operation mix")
+    run_parser.add_argument("--output", type=Path, help=f"default: {RESULTS_DIR}/load-<timestamp>.json")
+    run_parser.set_defaults(func=cmd_run)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--max-regression", type=float, default=0.10, help="allowed p95/throughput change before failing (0.10 = 10%%)"
+    )
+    compare_parser.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+asyncio/httpx load driver: each virtual user logs in once and then picks
+weighted operations until the run ends.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from app.benchmarks.load.seed import seeded_email
+from app.benchmarks.load.stats import Recorder
+from app.core.config import settings
+
+API = settings.API_V1_STR
+
+# 일반 사용자 작업 비율 (가중치)
+USER_MIX: dict[str, int] = {
+    "login": 2,
+    "users_me": 30,
+    "items_list": 20,
+    "item_create": 10,
+    "item_read": 12,
+    "item_update": 8,
+    "item_delete": 6,
+    "profile_read": 12,
+}
+# 관리자 작업 비율
+ADMIN_MIX: dict[str, int] = {
+    "admin_users_page": 8,
+    "admin_roles": 2,
+}
+
+
+@dataclass
+class LoadConfig:
+    base_url: str
+    concurrency: int
+    admin_concurrency: int
+    duration: float
+    warmup: float
+    seeded_users: int
+    password: str
+    admin_email: str
+    admin_password: str
+    page_size: int
+    seed: int
+
+
+class VirtualUser:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        recorder: Recorder,
+        *,
+        email: str,
+        password: str,
+        mix: dict[str, int],
+        rng: random.Random,
+        page_size: int,
+    ) -> None:
+        self.client = client
+        self.recorder = recorder
+        self.email = email
+        self.password = password
+        self.rng = rng
+        self.page_size = page_size
+        self.headers: dict[str, str] = {}
+        self.user_id: str | None = None
+        self.item_ids: list[str] = []
+        self.created_ids: list[str] = []
+        self.users_cursor: str | None = None
+        self._names = list(mix)
+        self._weights = list(mix.values())
+
+    async def request(self, name: str, method: str, url: str, **kwargs: Any) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(name, time.perf_counter() - started, 0, ok=False)
+            return None
+        self.recorder.record(name, time.perf_counter() - started, response.status_code, ok=response.is_success)
+        return response if response.is_success else None
+
+    async def run(self, stop: asyncio.Event) -> None:
+        await self.login()
+        me = await self.request("users_me", "GET", f"{API}/users/me")
+        if me is not None:
+            self.user_id = me.json()["id"]
+        while not stop.is_set():
+            name = self.rng.choices(self._names, self._weights)[0]
+            operation: Callable[[], Awaitable[None]] = getattr(self, name)
+            await operation()
+            # 응답이 즉시 완료되거나 건너뛴 작업만 이어져도 다른 가상 사용자가 실행되도록 양보
+            await asyncio.sleep(0)
+
+    # ------------------------------------------------------------------
+    # operations
+    # ------------------------------------------------------------------
+    async def login(self) -> None:
+        response = await self.request(
+            "login",
+            "POST",
+            f"{API}/login/access-token",
+            data={"username": self.email, "password": self.password},
+        )
+        if response is not None:
+            self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def users_me(self) -> None:
+        await self.request("users_me", "GET", f"{API}/users/me")
+
+    async def items_list(self) -> None:
+        response = await self.request("items_list", "GET", f"{API}/items/", params={"limit": self.page_size})
+        if response is not None:
+            self.item_ids = [item["id"] for item in response.json()["data"]]
+
+    async def item_create(self) -> None:
+        response = await self.request(
+            "item_create", "POST", f"{API}/items/", json={"title": "load test", "description": None}
+        )
+        if response is not None:
+            self.created_ids.append(response.json()["id"])
+
+    async def item_read(self) -> None:
+        if not self.item_ids:
+            return await self.items_list()
+        await self.request("item_read", "GET", f"{API}/items/{self.rng.choice(self.item_ids)}")
+
+    async def item_update(self) -> None:
+        if not self.item_ids:
+            return await self.items_list()
+        item_id = self.rng.choice(self.item_ids)
+        await self.request(
+            "item_update", "PATCH", f"{API}/items/{item_id}", json={"id": item_id, "title": "updated", "description": None}
+        )
+
+    async def item_delete(self) -> None:
+        # 시드 데이터는 유지하고 이 실행에서 만든 항목만 삭제
+        if not self.created_ids:
+            return await self.item_create()
+        item_id = self.created_ids.pop()
+        if item_id in self.item_ids:
+            self.item_ids.remove(item_id)
+        await self.request("item_delete", "DELETE", f"{API}/items/{item_id}")
+
+    async def profile_read(self) -> None:
+        if self.user_id is not None:
+            await self.request("profile_read", "GET", f"{API}/profile/{self.user_id}")
+
+    async def admin_users_page(self) -> None:
+        params: dict[str, Any] = {"limit": self.page_size}
+        if self.users_cursor:
+            params["cursor"] = self.users_cursor
+        response = await self.request("admin_users_page", "GET", f"{API}/users/", params=params)
+        # 마지막 페이지 이후에는 처음부터 다시 페이징
+        self.users_cursor = response.json()["next_cursor"] if response is not None else None
+
+    async def admin_roles(self) -> None:
+        await self.request("admin_roles", "GET", f"{API}/profile/roles")
+
+
+async def run_load(config: LoadConfig, recorder: Recorder) -> float:
+    """
+    warmup 이후 duration 동안 측정하고, 실제 측정 시간(초)을 반환
+    """
+    limits = httpx.Limits(max_connections=config.concurrency + config.admin_concurrency)
+    async with httpx.AsyncClient(base_url=config.base_url, limits=limits, timeout=30.0) as client:
+        users = [
+            VirtualUser(
+                client,
+                recorder,
+                email=seeded_email(index % config.seeded_users),
+                password=config.password,
+                mix=USER_MIX,
+                rng=random.Random(config.seed + index),
+                page_size=config.page_size,
+            )
+            for index in range(config.concurrency)
+        ]
+        users += [
+            VirtualUser(
+                client,
+                recorder,
+                email=config.admin_email,
+                password=config.admin_password,
+                mix=ADMIN_MIX,
+                rng=random.Random(config.seed - index - 1),
+                page_size=config.page_size,
+            )
+            for index in range(config.admin_concurrency)
+        ]
+        stop = asyncio.Event()
+        tasks = [asyncio.create_task(user.run(stop)) for user in users]
+        await asyncio.sleep(config.warmup)
+        recorder.recording = True
+        started = time.perf_counter()
+        await asyncio.sleep(config.duration)
+        recorder.recording = False
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await asyncio.gather(*tasks)
+        return elapsed
@@ -0,0 +1,113 @@
+"""
+Seeds load-test users (with profiles and roles) and items with multi-row INSERTs.
+
+Seeded rows are recognisable by their email / role name prefix so `reset`
+removes only load-test data.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Connection, delete, insert, select
+
+from app.core.security import pwd_context
+from app.models.item import Item
+from app.models.profile import Profile, Role, profile_roles_association
+from app.models.user import User
+
+EMAIL_PREFIX = "load-"
+EMAIL_DOMAIN = "@example.com"
+ROLE_PREFIX = "load-role-"
+DEFAULT_PASSWORD = "load-test-password"
+CHUNK_SIZE = 5_000
+
+
+def seeded_email(index: int) -> str:
+    return f"{EMAIL_PREFIX}{index}{EMAIL_DOMAIN}"
+
+
+def _insert_chunked(conn: Connection, table: object, rows: list[dict]) -> None:
+    for start in range(0, len(rows), CHUNK_SIZE):
+        conn.execute(insert(table), rows[start:start + CHUNK_SIZE])  # type: ignore[arg-type]
+
+
+def reset(conn: Connection) -> None:
+    """
+    이전에 적재한 부하 테스트 데이터 삭제 (profiles / profile_roles 는 CASCADE)
+    """
+    user_ids = select(User.id).where(User.email.like(f"{EMAIL_PREFIX}%{EMAIL_DOMAIN}"))
+    conn.execute(delete(Item).where(Item.owner_id.in_(user_ids)))
+    conn.execute(delete(User).where(User.email.like(f"{EMAIL_PREFIX}%{EMAIL_DOMAIN}")))
+    conn.execute(delete(Role).where(Role.name.like(f"{ROLE_PREFIX}%")))
+
+
+def seed(
+    conn: Connection,
+    *,
+    users: int,
+    items_per_user: int,
+    roles: int,
+    roles_per_profile: int = 2,
+    password: str = DEFAULT_PASSWORD,
+) -> None:
+    """
+    users 명의 사용자(+Profile, Role 연결)와 사용자별 items_per_user 개의 Item 적재.
+    bcrypt 해시는 한 번만 계산해 모든 사용자에 재사용
+    """
+    reset(conn)
+    hashed_password = pwd_context.hash(password)
+    now = datetime.utcnow()
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    _insert_chunked(
+        conn,
+        User,
+        [
+            {
+                "id": user_id,
+                "full_name": f"Load User {index}",
+                "email": seeded_email(index),
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "is_superuser": False,
+                "created_at": now - timedelta(seconds=index),
+                "updated_at": now,
+            }
+            for index, user_id in enumerate(user_ids)
+        ],
+    )
+    _insert_chunked(
+        conn,
+        Profile,
+        [{"user_id": user_id, "created_at": now, "updated_at": now} for user_id in user_ids],
+    )
+    role_ids = list(
+        conn.scalars(
+            insert(Role).returning(Role.id),
+            [{"name": f"{ROLE_PREFIX}{index}"} for index in range(roles)],
+        )
+    )
+    if role_ids:
+        _insert_chunked(
+            conn,
+            profile_roles_association,
+            [
+                {"profile_user_id": user_id, "role_id": role_ids[(index + offset) % len(role_ids)]}
+                for index, user_id in enumerate(user_ids)
+                for offset in range(min(roles_per_profile, len(role_ids)))
+            ],
+        )
+    _insert_chunked(
+        conn,
+        Item,
+        [
+            {
+                "id": uuid.uuid4(),
+                "title": f"Load item {index}",
+                "owner_id": user_id,
+                "created_at": now - timedelta(seconds=index),
+                "updated_at": now,
+            }
+            for user_id in user_ids
+            for index in range(items_per_user)
+        ],
+    )
@@ -0,0 +1,104 @@
+"""
+Latency aggregation, JSON results and run-to-run comparison.
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    nearest-rank percentile (sorted_values 는 오름차순 정렬된 목록)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class EndpointSamples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class Recorder:
+    """
+    가상 사용자들이 공유하는 결과 수집기 (단일 이벤트 루프에서만 사용하므로 lock 불필요)
+    """
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointSamples] = defaultdict(EndpointSamples)
+        self.recording = False
+
+    def record(self, name: str, seconds: float, status: int, ok: bool) -> None:
+        if not self.recording:
+            return
+        samples = self.endpoints[name]
+        samples.latencies.append(seconds)
+        samples.statuses[status] += 1
+        if not ok:
+            samples.errors += 1
+
+    def summary(self, duration: float) -> dict[str, Any]:
+        endpoints = {name: _summarize(samples, duration) for name, samples in sorted(self.endpoints.items())}
+        combined = EndpointSamples()
+        for samples in self.endpoints.values():
+            combined.latencies.extend(samples.latencies)
+            combined.errors += samples.errors
+            for status, count in samples.statuses.items():
+                combined.statuses[status] += count
+        return {"endpoints": endpoints, "total": _summarize(combined, duration)}
+
+
+def _summarize(samples: EndpointSamples, duration: float) -> dict[str, Any]:
+    latencies = sorted(samples.latencies)
+    count = len(latencies)
+    result: dict[str, Any] = {
+        "requests": count,
+        "errors": samples.errors,
+        "error_rate": samples.errors / count if count else 0.0,
+        "throughput_rps": count / duration if duration else 0.0,
+        "mean_ms": sum(latencies) / count * 1000 if count else 0.0,
+        "max_ms": latencies[-1] * 1000 if count else 0.0,
+        "status_codes": {str(status): n for status, n in sorted(samples.statuses.items())},
+    }
+    for pct in PERCENTILES:
+        result[f"p{pct}_ms"] = percentile(latencies, pct) * 1000
+    return result
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], max_regression: float) -> tuple[list[str], bool]:
+    """
+    두 실행 결과의 endpoint별 p95 / 처리량 비교.
+    p95가 max_regression 비율 이상 느려지거나 처리량이 그만큼 줄어든 endpoint가 있으면 regressed=True
+    """
+    lines = [f"{'endpoint':28s} {'p95 ms (before -> after)':>30s} {'rps (before -> after)':>28s}"]
+    regressed = False
+    for name, after in current["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if before is None:
+            lines.append(f"{name:28s} {'(new)':>30s}")
+            continue
+        p95_change = _change(before["p95_ms"], after["p95_ms"])
+        rps_change = _change(before["throughput_rps"], after["throughput_rps"])
+        flag = ""
+        if p95_change > max_regression or rps_change < -max_regression:
+            regressed = True
+            flag = "  REGRESSION"
+        lines.append(
+            f"{name:28s} {before['p95_ms']:10.1f} -> {after['p95_ms']:8.1f} ({p95_change:+6.1%})"
+            f" {before['throughput_rps']:9.1f} -> {after['throughput_rps']:7.1f} ({rps_change:+6.1%}){flag}"
+        )
+    return lines, regressed
+
+
+def _change(before: float, after: float) -> float:
+    if before == 0:
+        return 0.0
+    return (after - before) / before
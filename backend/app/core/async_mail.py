@@ -0,0 +1,180 @@
+# path: app/core/async_mail.py
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+from typing import TYPE_CHECKING
+
+from app.core.mail import OutboundEmail
+
+if TYPE_CHECKING:
+    import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSMTPTransport:
+    """
+    aiosmtplib 기반 비동기 SMTP 발송기 (이벤트 루프를 막지 않음).
+
+    - 열린 SMTP 연결을 재사용 (꺼낼 때 NOOP으로 확인, 끊긴 연결은 새로 생성)
+    - 동시 발송 수를 max_concurrency 세마포어로 제한 (= 동시에 열리는 연결 수 상한)
+    - send_many는 메시지 묶음을 하나의 SMTP 세션으로 발송
+    - 연결과 세마포어는 이벤트 루프에 묶이므로, 다른 루프에서 호출되면 새로 만든다
+    - aiosmtplib은 첫 발송 시 import (메일을 보내지 않는 워커의 시작 시간에 포함되지 않도록)
+    """
+
+    def __init__(
+        self,
+        *,
+        connect: Callable[[], Awaitable["aiosmtplib.SMTP"]],
+        build_message: Callable[[OutboundEmail], EmailMessage],
+        max_concurrency: int,
+    ) -> None:
+        self._connect = connect
+        self._build_message = build_message
+        self.max_concurrency = max_concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._idle: list["aiosmtplib.SMTP"] = []
+        self.sent = 0
+        self.failed = 0
+        self.connections_opened = 0
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    async def send(self, mail: OutboundEmail) -> None:
+        """
+        메일 한 통 발송 (실패 시 aiosmtplib 예외를 그대로 전달)
+        """
+        import aiosmtplib
+
+        message = self._build_message(mail)
+        try:
+            async with self._connection() as smtp:
+                await smtp.send_message(message)
+        except (aiosmtplib.SMTPException, OSError):
+            self.failed += 1
+            raise
+        self.sent += 1
+
+    async def send_many(self, mails: Sequence[OutboundEmail]) -> list[OutboundEmail]:
+        """
+        여러 메일을 하나의 SMTP 세션으로 순서대로 발송
+
+        :param mails: 발송할 메일 목록
+        :return: 발송에 실패한 메일 목록 (attempts/last_error 갱신됨)
+        """
+        import aiosmtplib
+
+        failures: list[OutboundEmail] = []
+        pending = list(mails)
+        try:
+            async with self._connection() as smtp:
+                while pending:
+                    mail = pending[0]
+                    try:
+                        await smtp.send_message(self._build_message(mail))
+                    except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused, ValueError, TypeError) as e:
+                        # 메일 단위 오류: 해당 메일만 실패 처리하고 같은 세션으로 계속 발송
+                        pending.pop(0)
+                        failures.append(self._fail(mail, e))
+                        continue
+                    pending.pop(0)
+                    self.sent += 1
+        except (aiosmtplib.SMTPException, OSError) as e:
+            # 연결 실패/끊김: 아직 보내지 못한 메일은 모두 실패
+            failures.extend(self._fail(mail, e) for mail in pending)
+        return failures
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for smtp in idle:
+            await self._close(smtp)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "idle_connections": len(self._idle),
+            "connections_opened": self.connections_opened,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
+
+    # ------------------------------------------------------------------
+    # connection reuse
+    # ------------------------------------------------------------------
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이전 루프에서 연 연결은 이 루프에서 쓸 수 없음
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._idle = []
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator["aiosmtplib.SMTP"]:
+        import aiosmtplib
+
+        self._bind_loop()
+        async with self._slots:
+            smtp = await self._checkout()
+            try:
+                yield smtp
+            except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused):
+                # 메일 단위 거부: aiosmtplib이 RSET으로 봉투를 초기화하므로 세션은 재사용 가능
+                await self._release(smtp)
+                raise
+            except BaseException:
+                # 연결 끊김/타임아웃/취소: 세션 상태를 알 수 없으므로 버림
+                await self._close(smtp)
+                raise
+            await self._release(smtp)
+
+    async def _checkout(self) -> "aiosmtplib.SMTP":
+        while self._idle:
+            smtp = self._idle.pop()
+            if await self._is_alive(smtp):
+                return smtp
+            await self._close(smtp)
+        smtp = await self._connect()
+        self.connections_opened += 1
+        return smtp
+
+    async def _release(self, smtp: "aiosmtplib.SMTP") -> None:
+        if smtp.is_connected and len(self._idle) < self.max_concurrency:
+            self._idle.append(smtp)
+        else:
+            await self._close(smtp)
+
+    @staticmethod
+    async def _is_alive(smtp: "aiosmtplib.SMTP") -> bool:
+        import aiosmtplib
+
+        if not smtp.is_connected:
+            return False
+        try:
+            response = await smtp.noop()
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+        return response.code == 250
+
+    @staticmethod
+    async def _close(smtp: "aiosmtplib.SMTP") -> None:
+        import aiosmtplib
+
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            smtp.close()
+
+    def _fail(self, mail: OutboundEmail, error: Exception) -> OutboundEmail:
+        mail.attempts += 1
+        mail.last_error = repr(error)
+        self.failed += 1
+        logger.warning("Email to %s failed: %s", mail.email_to, mail.last_error)
+        return mail
@@ -0,0 +1,93 @@
+# path: app/core/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[ValueType]):
+    """
+    프로세스 내 LRU + TTL 캐시 (thread-safe).
+
+    - max_size 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 만료 시각(expires_at) 또는 기본 ttl 적용
+    - uvicorn 워커마다 독립된 인스턴스이므로, 무효화는 해당 워커에만 적용됨
+    """
+
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, ValueType]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> ValueType | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: ValueType, *, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def incr(self, key: Hashable, delta: int) -> None:
+        """
+        캐시에 있는 정수 값을 증감 (없거나 만료된 항목은 건드리지 않음, 만료 시각 유지)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                return
+            expires_at, value = entry
+            self._data[key] = (expires_at, value + delta)  # type: ignore[operator]
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        문자열 키 중 prefix로 시작하는 항목을 모두 제거하고 제거된 개수를 반환
+        """
+        with self._lock:
+            keys = [key for key in self._data if isinstance(key, str) and key.startswith(prefix)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
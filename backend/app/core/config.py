@@ -33,7 +33,34 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = secrets.token_urlsafe(32)
     # 60 minutes * 24 hours * 8 days = 8 days
+    # Lower this (e.g. to 30) once every client renews tokens with POST /login/refresh;
+    # the bundled frontend does not yet.
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
+    # Rotating refresh tokens (stored as SHA-256 hashes, single use)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 8
+    # Password hashing policy. New hashes use PASSWORD_HASH_SCHEME; hashes made with
+    # another scheme or other cost parameters are upgraded on the user's next login.
+    # argon2 needs the optional "argon2" extra (argon2-cffi).
+    PASSWORD_HASH_SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"
+    BCRYPT_ROUNDS: int = 12  # log2 of the work factor
+    ARGON2_TIME_COST: int = 2  # iterations
+    ARGON2_MEMORY_COST_KIB: int = 19_456  # 19 MiB
+    ARGON2_PARALLELISM: int = 1  # lanes; 1 keeps one login on one core
+    # Password hashing process pool (0 = hash inline on the request thread)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    # Login throttling (token buckets checked before the DB lookup and bcrypt).
+    # The memory backend is per worker, so the effective limit is multiplied by the worker count.
+    RATE_LIMIT_BACKEND: Literal["memory", "none"] = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5  # attempts per period for one email
+    LOGIN_RATE_LIMIT_PER_IP: int = 20  # attempts per period from one client IP
+    LOGIN_RATE_LIMIT_PERIOD_SECONDS: int = 60
+    # In-process cache of is_active/is_superuser used by the auth fast path
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+    AUTH_USER_CACHE_MAX_SIZE: int = 10_000
+    # Verified access-token claims, cached per token until the token's exp
+    ACCESS_TOKEN_CACHE_MAX_SIZE: int = 10_000
     FRONTEND_HOST: str = "http://localhost:5173"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
@@ -67,6 +94,44 @@ class Settings(BaseSettings):
             port=self.POSTGRES_PORT,
             path=self.POSTGRES_DB,
         )
+
+    # Optional read replica for read-only GET endpoints (unset = everything on the primary).
+    # Unset user/password/db/port fall back to the primary's values.
+    POSTGRES_REPLICA_SERVER: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    POSTGRES_REPLICA_USER: str | None = None
+    POSTGRES_REPLICA_PASSWORD: str | None = None
+    POSTGRES_REPLICA_DB: str | None = None
+    # after a client's own write, its reads stay on the primary for this long
+    # (carried by the client in the last_write cookie / X-Last-Write header, so it holds across workers)
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def SQLALCHEMY_REPLICA_DATABASE_URI(self) -> PostgresDsn | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return MultiHostUrl.build(
+            scheme="postgresql+psycopg",
+            username=self.POSTGRES_REPLICA_USER or self.POSTGRES_USER,
+            password=self.POSTGRES_REPLICA_PASSWORD or self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_REPLICA_SERVER,
+            port=self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+            path=self.POSTGRES_REPLICA_DB or self.POSTGRES_DB,
+        )
+
+    # Database connection pool (per uvicorn worker)
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 5
+    POSTGRES_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    POSTGRES_POOL_RECYCLE: int = 1800  # seconds, -1 disables recycling
+    POSTGRES_POOL_PRE_PING: bool = True
+    POSTGRES_STATEMENT_TIMEOUT_MS: int = 30_000  # 0 disables the timeout
+
+    # Per-request SQL count/time: always logged and recorded as histograms,
+    # additionally exposed to clients as a Server-Timing header when enabled
+    SERVER_TIMING_ENABLED: bool = True
+
     # 3rd Party API
     GOOGLE_MAPS_API_KEY: str
 
@@ -88,6 +153,48 @@ class Settings(BaseSettings):
 
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
 
+    # Background mail queue (per uvicorn worker)
+    MAIL_QUEUE_WORKERS: int = 2  # sender threads, each holding one pooled SMTP connection
+    MAIL_QUEUE_MAX_SIZE: int = 10_000  # enqueue fails with 503 beyond this
+    MAIL_BATCH_SIZE: int = 50  # messages sent per connection checkout
+    MAIL_MAX_ATTEMPTS: int = 5  # then the message goes to email_dead_letters
+    MAIL_RETRY_BACKOFF_SECONDS: float = 2.0  # doubled on every retry
+    MAIL_SMTP_TIMEOUT: int = 10  # seconds
+    # Direct async sends (aiosmtplib) from async routes: concurrent sends = open connections
+    MAIL_ASYNC_MAX_CONCURRENCY: int = 4
+
+    # Bulk CRUD / batch endpoints
+    BULK_CHUNK_SIZE: int = 1000  # rows per multi-row INSERT / executemany batch
+    BATCH_MAX_ROWS: int = 5000  # max rows accepted by a single batch request
+    # users are capped much lower: every row costs one password hash
+    USER_BATCH_MAX_ROWS: int = 200
+
+    # Streaming export: rows fetched per server-side cursor batch
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # List endpoint totals
+    # tables whose pg_class.reltuples estimate is above this use the estimate
+    COUNT_ESTIMATE_THRESHOLD: int = 100_000
+    # Per-owner item totals cached in each worker. Creates/deletes only adjust the cache of
+    # the worker that served them, so with several workers other workers report a stale
+    # count for up to ITEM_COUNT_CACHE_TTL_SECONDS. "auto" caches only when WEB_CONCURRENCY
+    # is 1; set "memory" explicitly to accept that staleness window with more workers.
+    ITEM_COUNT_CACHE_BACKEND: Literal["auto", "memory", "none"] = "auto"
+    ITEM_COUNT_CACHE_TTL_SECONDS: int = 300
+    ITEM_COUNT_CACHE_MAX_SIZE: int = 10_000
+
+    # number of uvicorn worker processes (uvicorn reads the same variable; the Dockerfile sets it)
+    WEB_CONCURRENCY: int = 1
+
+    # Serialized response cache for profile/role reads ("none" disables it).
+    # The memory backend is per worker and invalidation only reaches the worker that served
+    # the write: on other workers a stale body (and 304 for its ETag) is served for up to
+    # RESPONSE_CACHE_TTL_SECONDS. "auto" therefore uses it only when WEB_CONCURRENCY is 1;
+    # set "memory" explicitly to accept that staleness window with more workers.
+    RESPONSE_CACHE_BACKEND: Literal["auto", "memory", "none"] = "auto"
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_MAX_SIZE: int = 10_000
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def emails_enabled(self) -> bool:
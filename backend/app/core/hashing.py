@@ -0,0 +1,162 @@
+# path: app/core/hashing.py
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any
+
+
+class PasswordHasherBusy(Exception):
+    """
+    해싱 대기열이 가득 찼을 때 발생 (API 레벨에서 503으로 변환)
+    """
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 전용 프로세스 풀에서 실행하는 실행기.
+
+    - 웹 워커와 별도로 크기를 지정 (max_workers)
+    - 대기 + 실행 중인 작업 수를 max_pending 으로 제한하고, 초과 시 PasswordHasherBusy
+    - max_workers=0 이면 호출한 스레드에서 바로 실행 (테스트/로컬용)
+    - pending_listener 가 설정되면 대기열 길이가 바뀔 때마다 새 값으로 호출 (메트릭용)
+    """
+
+    pending_listener: Callable[[int], None] | None = None
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def start(self) -> None:
+        """
+        프로세스 풀을 미리 생성 (첫 로그인 요청이 풀 생성 비용을 치르지 않도록)
+        """
+        if self.max_workers > 0:
+            self._get_executor()
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # 멀티스레드 프로세스에서 fork 하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _acquire(self) -> float:
+        if not self._slots.acquire(blocking=False):
+            with self._stats_lock:
+                self._rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+        with self._stats_lock:
+            self._pending += 1
+            pending = self._pending
+        self._notify_pending(pending)
+        return time.perf_counter()
+
+    def _release(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._pending -= 1
+            self._completed += 1
+            self._latency_total += elapsed
+            if elapsed > self._latency_max:
+                self._latency_max = elapsed
+            pending = self._pending
+        self._slots.release()
+        self._notify_pending(pending)
+
+    def _notify_pending(self, pending: int) -> None:
+        if self.pending_listener is not None:
+            self.pending_listener(pending)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        started = self._acquire()
+        future: Future
+        try:
+            if self.max_workers > 0:
+                future = self._get_executor().submit(fn, *args)
+            else:
+                future = Future()
+                try:
+                    future.set_result(fn(*args))
+                except Exception as e:
+                    future.set_exception(e)
+        except Exception:
+            self._release(started)
+            raise
+        future.add_done_callback(lambda _: self._release(started))
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        동기 API: 결과가 나올 때까지 호출 스레드를 블로킹 (CPU/GIL은 점유하지 않음)
+        """
+        return self._submit(fn, *args).result()
+
+    def run_many(self, fn: Callable[..., Any], args_list: Sequence[tuple], *, window: int | None = None) -> list[Any]:
+        """
+        일괄 작업용 동기 API: 여러 작업을 풀에 나눠 동시에 실행하고 입력 순서대로 결과 반환.
+        동시에 제출하는 작업은 window개(기본: max_workers)로 제한해 max_pending 슬롯을 혼자 차지하지 않음
+        """
+        window = max(1, min(window or self.max_workers or 1, self.max_pending))
+        results: list[Any] = [None] * len(args_list)
+        in_flight: dict[Future, int] = {}
+        try:
+            for index, args in enumerate(args_list):
+                while len(in_flight) >= window:
+                    self._collect(in_flight, results)
+                in_flight[self._submit(fn, *args)] = index
+            while in_flight:
+                self._collect(in_flight, results)
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+        return results
+
+    @staticmethod
+    def _collect(in_flight: dict[Future, int], results: list[Any]) -> None:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[in_flight.pop(future)] = future.result()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        비동기 API: 이벤트 루프를 막지 않고 결과를 기다림
+        """
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            completed = self._completed
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": completed,
+                "rejected": self._rejected,
+                "latency_seconds_total": self._latency_total,
+                "latency_seconds_max": self._latency_max,
+                "latency_seconds_avg": self._latency_total / completed if completed else 0.0,
+            }
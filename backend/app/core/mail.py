@@ -0,0 +1,277 @@
+# path: app/core/mail.py
+
+import heapq
+import itertools
+import logging
+import queue
+import smtplib
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# 연결 자체가 끊긴 경우 (커넥션을 버리고 남은 메일은 재시도)
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError)
+
+
+@dataclass
+class OutboundEmail:
+    email_to: str
+    subject: str
+    html_content: str
+    attempts: int = 0
+    last_error: str | None = None
+
+
+class MailQueueFull(Exception):
+    """
+    발송 대기열이 가득 찼을 때 발생 (API 레벨에서 503으로 변환)
+    """
+
+
+class SMTPConnectionPool:
+    """
+    열린 SMTP 연결을 재사용하는 풀.
+    유휴 연결은 꺼낼 때 NOOP으로 확인하고, 끊긴 연결은 새로 만든다.
+    """
+
+    def __init__(self, *, factory: Callable[[], smtplib.SMTP], size: int) -> None:
+        self._factory = factory
+        self._idle: queue.LifoQueue[smtplib.SMTP] = queue.LifoQueue(maxsize=size)
+
+    @staticmethod
+    def _is_alive(conn: smtplib.SMTP) -> bool:
+        try:
+            return conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _close(conn: smtplib.SMTP) -> None:
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        conn: smtplib.SMTP | None = None
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        if conn is not None and not self._is_alive(conn):
+            self._close(conn)
+            conn = None
+        if conn is None:
+            conn = self._factory()
+        try:
+            yield conn
+        except _CONNECTION_ERRORS:
+            self._close(conn)
+            raise
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._close(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+class MailQueue:
+    """
+    프로세스 내 메일 발송 대기열.
+
+    - API는 enqueue 후 바로 반환, 워커 스레드가 batch 단위로 꺼내 하나의 SMTP 연결로 발송
+    - 실패 시 지수 backoff로 재시도, max_attempts를 넘기거나 5xx 응답이면 dead_letter 콜백 호출
+    - 종료 시 대기 중/재시도 대기 중인 메일은 dead_letter로 넘겨 유실되지 않도록 함
+    """
+
+    def __init__(
+        self,
+        *,
+        pool: SMTPConnectionPool,
+        build_message: Callable[[OutboundEmail], EmailMessage],
+        dead_letter: Callable[[OutboundEmail], None],
+        workers: int,
+        max_size: int,
+        batch_size: int,
+        max_attempts: int,
+        backoff_seconds: float,
+    ) -> None:
+        self._pool = pool
+        self._build_message = build_message
+        self._dead_letter = dead_letter
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._ready: queue.Queue[OutboundEmail] = queue.Queue(maxsize=max_size)
+        self._retry: list[tuple[float, int, OutboundEmail]] = []
+        self._retry_lock = threading.Lock()
+        self._seq = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._dead_lettered = 0
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def enqueue(self, mail: OutboundEmail) -> None:
+        try:
+            self._ready.put_nowait(mail)
+        except queue.Full:
+            raise MailQueueFull("Mail queue is full")
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopping.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"mail-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        대기열을 비울 때까지 발송한 뒤 워커를 종료
+        """
+        self._stopping.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        self._threads = []
+        with self._retry_lock:
+            leftovers = [mail for _, _, mail in self._retry]
+            self._retry = []
+        while True:
+            try:
+                leftovers.append(self._ready.get_nowait())
+            except queue.Empty:
+                break
+        for mail in leftovers:
+            mail.last_error = mail.last_error or "Mail queue stopped before delivery"
+            self._to_dead_letter(mail)
+        self._pool.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._retry_lock:
+            retrying = len(self._retry)
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "queued": self._ready.qsize(),
+                "retrying": retrying,
+                "sent": self._sent,
+                "failed": self._failed,
+                "dead_lettered": self._dead_lettered,
+            }
+
+    # ------------------------------------------------------------------
+    # worker
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            self._promote_due_retries()
+            batch = self._next_batch()
+            if batch:
+                self._send_batch(batch)
+            elif self._stopping.is_set():
+                return
+
+    def _next_batch(self) -> list[OutboundEmail]:
+        try:
+            batch = [self._ready.get(timeout=0.2)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._ready.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _send_batch(self, batch: list[OutboundEmail]) -> None:
+        pending = list(batch)
+        try:
+            with self._pool.connection() as conn:
+                while pending:
+                    mail = pending[0]
+                    try:
+                        message = self._build_message(mail)
+                    except (ValueError, TypeError) as e:
+                        pending.pop(0)
+                        self._fail(mail, e, permanent=True)
+                        continue
+                    try:
+                        conn.send_message(message)
+                    except smtplib.SMTPResponseException as e:
+                        pending.pop(0)
+                        self._fail(mail, e, permanent=e.smtp_code >= 500)
+                        continue
+                    except smtplib.SMTPRecipientsRefused as e:
+                        pending.pop(0)
+                        self._fail(mail, e, permanent=True)
+                        continue
+                    pending.pop(0)
+                    with self._stats_lock:
+                        self._sent += 1
+        except (smtplib.SMTPException, OSError) as e:
+            # 연결 실패/끊김: 아직 보내지 못한 메일은 모두 재시도
+            for mail in pending:
+                self._fail(mail, e, permanent=False)
+
+    def _fail(self, mail: OutboundEmail, error: Exception, *, permanent: bool) -> None:
+        mail.attempts += 1
+        mail.last_error = repr(error)
+        with self._stats_lock:
+            self._failed += 1
+        if permanent or mail.attempts >= self.max_attempts:
+            self._to_dead_letter(mail)
+            return
+        ready_at = time.monotonic() + self.backoff_seconds * (2 ** (mail.attempts - 1))
+        with self._retry_lock:
+            heapq.heappush(self._retry, (ready_at, next(self._seq), mail))
+
+    def _promote_due_retries(self) -> None:
+        now = time.monotonic()
+        with self._retry_lock:
+            while self._retry and self._retry[0][0] <= now:
+                _, _, mail = heapq.heappop(self._retry)
+                try:
+                    self._ready.put_nowait(mail)
+                except queue.Full:
+                    heapq.heappush(self._retry, (now + self.backoff_seconds, next(self._seq), mail))
+                    return
+
+    def _to_dead_letter(self, mail: OutboundEmail) -> None:
+        with self._stats_lock:
+            self._dead_lettered += 1
+        logger.warning("Email to %s dead-lettered after %d attempts: %s", mail.email_to, mail.attempts, mail.last_error)
+        try:
+            self._dead_letter(mail)
+        except Exception:
+            logger.exception("Failed to store dead-lettered email to %s", mail.email_to)
+
+
+def build_email_message(mail: OutboundEmail, *, from_name: str | None, from_email: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = mail.subject
+    message["From"] = formataddr((from_name or "", from_email))
+    message["To"] = mail.email_to
+    message.set_content(mail.html_content, subtype="html")
+    return message
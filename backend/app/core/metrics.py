@@ -0,0 +1,134 @@
+# path: app/core/metrics.py
+
+import os
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import Engine
+
+from app.core.hashing import PasswordHasher
+from app.database.pool import InstrumentedQueuePool
+
+# uvicorn --workers N 으로 실행할 때는 PROMETHEUS_MULTIPROC_DIR 을 지정해야 함.
+# 각 워커가 이 디렉터리의 mmap 파일에 값을 기록하고, /metrics 는 모든 워커의 파일을 합산.
+# 디렉터리는 워커 시작 전에 비워야 함 (Dockerfile CMD 참고)
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+# route label: custom_generate_unique_id 로 만든 route id (예: "Items-read_my_items")
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency",
+    ["route", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS_TOTAL = Counter(
+    "http_requests",
+    "Finished requests by status code",
+    ["route", "method", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled",
+    ["route"],
+    multiprocess_mode="livesum",
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_SECONDS_PER_REQUEST = Histogram(
+    "http_request_db_seconds",
+    "Total time spent in SQL statements per request",
+    ["route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+# 커넥션 풀 (pool label: primary / primary_async / replica / replica_async), 워커 합계
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool size (without overflow)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Overflow connections currently open",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+# bcrypt 해싱 대기열 (대기 + 실행 중), 워커 합계
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Password hash/verify jobs queued or running",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_CAPACITY = Gauge(
+    "password_hash_capacity",
+    "Maximum pending password hash/verify jobs before shedding",
+    multiprocess_mode="livesum",
+)
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """
+    checkout/반납 직후 풀 게이지를 갱신 (멀티프로세스 모드에서는 워커별 값이 파일에 기록됨)
+    """
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return
+    DB_POOL_SIZE.labels(pool=name).set(pool.size())
+    checked_out = DB_POOL_CHECKED_OUT.labels(pool=name)
+    overflow = DB_POOL_OVERFLOW.labels(pool=name)
+
+    def publish(current: InstrumentedQueuePool) -> None:
+        checked_out.set(current.checkedout())
+        overflow.set(max(current.overflow(), 0))
+
+    pool.usage_listener = publish
+    publish(pool)
+
+
+def instrument_password_hasher(hasher: PasswordHasher) -> None:
+    """
+    bcrypt 대기열 길이를 게이지로 기록
+    """
+    PASSWORD_HASH_CAPACITY.set(hasher.max_pending)
+    hasher.pending_listener = PASSWORD_HASH_PENDING.set
+    PASSWORD_HASH_PENDING.set(hasher.stats()["pending"])
+
+
+def render_latest() -> tuple[bytes, str]:
+    """
+    exposition 포맷 본문과 content type. 멀티프로세스 모드면 모든 워커의 값을 합산
+    """
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """
+    워커 종료 시 livesum 게이지 파일을 정리 (종료된 워커의 in-flight/풀 값이 합산되지 않도록)
+    """
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid(), MULTIPROC_DIR)
@@ -0,0 +1,143 @@
+# path: app/core/rate_limit.py
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+
+class RateLimited(Exception):
+    """
+    허용량을 초과한 요청 (API 레벨에서 429 + Retry-After로 변환)
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Too many requests")
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(math.ceil(self.retry_after), 1))
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    token bucket 설정: 최대 capacity 번까지 연속 허용, 이후 period_seconds 동안 capacity 개가 다시 채워짐
+    """
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+
+class RateLimitStore(ABC):
+    """
+    token bucket 저장소 인터페이스.
+    take()는 원자적으로 "채우기 + 차감"을 수행해야 함 (Redis라면 Lua 스크립트 하나로 구현 가능)
+    """
+
+    @abstractmethod
+    def take(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        """
+        토큰을 cost 만큼 차감. 허용되면 0, 거부되면 다시 시도할 수 있을 때까지의 초를 반환 (거부 시 차감하지 않음)
+        """
+
+    @abstractmethod
+    def reset(self, key: str) -> None: ...
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    프로세스 내 token bucket 저장소 (thread-safe, 워커 단위).
+    max_keys 초과 시 가장 오래 사용되지 않은 bucket부터 제거 (제거된 bucket은 가득 찬 상태로 다시 시작)
+    """
+
+    def __init__(self, *, max_keys: int) -> None:
+        self.max_keys = max_keys
+        # key -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(limit.capacity), now))
+            tokens = min(float(limit.capacity), tokens + (now - updated_at) * limit.refill_per_second)
+            if tokens < cost:
+                self._buckets[key] = (tokens, now)
+                self._buckets.move_to_end(key)
+                return (cost - tokens) / limit.refill_per_second
+            self._buckets[key] = (tokens - cost, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
+class NullRateLimitStore(RateLimitStore):
+    """
+    제한 비활성화용 저장소 (항상 허용)
+    """
+
+    def take(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        return 0.0
+
+    def reset(self, key: str) -> None:
+        pass
+
+
+class LoginRateLimiter:
+    """
+    로그인 시도 제한: 이메일별 bucket + IP별 bucket.
+    bcrypt 검증(및 DB 조회) 전에 호출해 credential stuffing 트래픽을 먼저 차단
+    """
+
+    def __init__(self, store: RateLimitStore, *, per_email: RateLimit, per_ip: RateLimit) -> None:
+        self.store = store
+        self.per_email = per_email
+        self.per_ip = per_ip
+
+    def check(self, *, email: str, ip: str | None) -> None:
+        """
+        허용량을 넘으면 RateLimited. IP bucket을 먼저 확인해 분산된 이메일 대입도 IP 단위로 차단
+        """
+        if ip is not None:
+            wait = self.store.take(f"login:ip:{ip}", self.per_ip)
+            if wait:
+                raise RateLimited(wait)
+        wait = self.store.take(f"login:email:{email.strip().lower()}", self.per_email)
+        if wait:
+            raise RateLimited(wait)
+
+    def reset_email(self, email: str) -> None:
+        self.store.reset(f"login:email:{email.strip().lower()}")
+
+
+def _make_store() -> RateLimitStore:
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimitStore(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+    return NullRateLimitStore()
+
+
+login_rate_limiter = LoginRateLimiter(
+    _make_store(),
+    per_email=RateLimit(
+        capacity=settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+        period_seconds=settings.LOGIN_RATE_LIMIT_PERIOD_SECONDS,
+    ),
+    per_ip=RateLimit(
+        capacity=settings.LOGIN_RATE_LIMIT_PER_IP,
+        period_seconds=settings.LOGIN_RATE_LIMIT_PERIOD_SECONDS,
+    ),
+)
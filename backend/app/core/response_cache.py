@@ -0,0 +1,145 @@
+# path: app/core/response_cache.py
+
+import hashlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Union
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+PROFILE_PREFIX = "profile:"
+ROLES_PREFIX = "roles:"
+
+
+class CacheBackend(ABC):
+    """
+    직렬화된 응답(bytes)을 저장하는 캐시 백엔드 인터페이스.
+    Redis 등 외부 저장소도 이 네 가지 연산만 구현하면 교체 가능.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    프로세스 내 LRU + TTL 백엔드 (워커 단위)
+    """
+
+    def __init__(self, *, max_size: int, ttl: int) -> None:
+        self._cache: TTLCache[bytes] = TTLCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        self._cache.delete_prefix(prefix)
+
+
+class NullCacheBackend(CacheBackend):
+    """
+    캐시 비활성화용 백엔드 (항상 miss)
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def delete_prefix(self, prefix: str) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """
+    JSON 응답 본문과 ETag를 함께 저장하는 캐시.
+    값은 b"<etag>\\n<body>" 형태로 백엔드에 저장하므로 hit 시 재직렬화/재해싱이 없음.
+    """
+
+    def __init__(self, backend: CacheBackend, *, ttl: int) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        etag, _, body = value.partition(b"\n")
+        return CachedResponse(body=body, etag=etag.decode())
+
+    def set(self, key: str, body: bytes) -> CachedResponse:
+        entry = CachedResponse(body=body, etag=self.make_etag(body))
+        self.backend.set(key, entry.etag.encode() + b"\n" + body, self.ttl)
+        return entry
+
+    def delete(self, key: str) -> None:
+        self.backend.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        self.backend.delete_prefix(prefix)
+
+
+def _make_backend() -> CacheBackend:
+    backend = settings.RESPONSE_CACHE_BACKEND
+    if backend == "auto":
+        # 워커가 여러 개면 다른 워커의 무효화를 받지 못해 TTL 동안 stale 응답/304를 내보냄
+        backend = "memory" if settings.WEB_CONCURRENCY <= 1 else "none"
+    if backend == "memory":
+        return MemoryCacheBackend(
+            max_size=settings.RESPONSE_CACHE_MAX_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+        )
+    return NullCacheBackend()
+
+
+response_cache = ResponseCache(_make_backend(), ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+def profile_cache_key(user_id: Union[str, UUID]) -> str:
+    return f"{PROFILE_PREFIX}{user_id}"
+
+
+def roles_cache_key(skip: int, limit: int, cursor: Optional[str]) -> str:
+    return f"{ROLES_PREFIX}{skip}:{limit}:{cursor or ''}"
+
+
+def invalidate_profile(user_id: Union[str, UUID]) -> None:
+    response_cache.delete(profile_cache_key(user_id))
+
+
+def invalidate_roles() -> None:
+    """
+    Role 변경 시 목록과, role 이름을 포함하는 모든 프로필 응답을 무효화
+    """
+    response_cache.delete_prefix(ROLES_PREFIX)
+    response_cache.delete_prefix(PROFILE_PREFIX)
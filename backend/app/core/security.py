@@ -1,12 +1,83 @@
+import hashlib
+import importlib.util
+import secrets
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Literal
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.hashing import PasswordHasher
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@dataclass(frozen=True)
+class PasswordPolicy:
+    """
+    Scheme and cost parameters for new password hashes.
+    Hashes that don't match the policy are reported by verify_and_update
+    (other scheme, or other rounds/memory/parallelism) so they can be rehashed.
+    """
+    scheme: Literal["bcrypt", "argon2"] = "bcrypt"
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 2
+    argon2_memory_cost_kib: int = 19_456
+    argon2_parallelism: int = 1
+
+    @classmethod
+    def from_settings(cls) -> "PasswordPolicy":
+        return cls(
+            scheme=settings.PASSWORD_HASH_SCHEME,
+            bcrypt_rounds=settings.BCRYPT_ROUNDS,
+            argon2_time_cost=settings.ARGON2_TIME_COST,
+            argon2_memory_cost_kib=settings.ARGON2_MEMORY_COST_KIB,
+            argon2_parallelism=settings.ARGON2_PARALLELISM,
+        )
+
+    @property
+    def label(self) -> str:
+        if self.scheme == "bcrypt":
+            return f"bcrypt(rounds={self.bcrypt_rounds})"
+        return (
+            f"argon2id(t={self.argon2_time_cost}, m={self.argon2_memory_cost_kib}KiB, "
+            f"p={self.argon2_parallelism})"
+        )
+
+    def context(self) -> CryptContext:
+        if self.scheme == "argon2" and importlib.util.find_spec("argon2") is None:
+            raise RuntimeError(
+                'PASSWORD_HASH_SCHEME="argon2" requires argon2-cffi (install the "argon2" extra)'
+            )
+        # Both schemes stay verifiable so existing hashes keep working after a switch;
+        # the non-default one is deprecated and therefore rehashed on login.
+        other = "argon2" if self.scheme == "bcrypt" else "bcrypt"
+        return CryptContext(
+            schemes=[self.scheme, other],
+            default=self.scheme,
+            deprecated="auto",
+            # min == max: hashes with a different cost also count as outdated
+            bcrypt__rounds=self.bcrypt_rounds,
+            bcrypt__min_rounds=self.bcrypt_rounds,
+            bcrypt__max_rounds=self.bcrypt_rounds,
+            argon2__type="ID",
+            argon2__rounds=self.argon2_time_cost,
+            argon2__min_rounds=self.argon2_time_cost,
+            argon2__max_rounds=self.argon2_time_cost,
+            argon2__memory_cost=self.argon2_memory_cost_kib,
+            argon2__parallelism=self.argon2_parallelism,
+        )
+
+
+password_policy = PasswordPolicy.from_settings()
+# Rebuilt from the same settings in every hashing worker process
+pwd_context = password_policy.context()
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
 
 
 ALGORITHM = "HS256"
@@ -19,9 +90,58 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def create_refresh_token() -> str:
+    """
+    Opaque random refresh token (256 bits); only its hash is stored.
+    """
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    # High-entropy random tokens don't need a slow KDF: a plain SHA-256 is enough
+    # and keeps /login/refresh free of bcrypt work.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+# Executed inside the hashing process pool
+def _verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+def _verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return password_hasher.run(_verify, plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify a password; on success also return a new hash when the stored one
+    doesn't match the current policy (otherwise None).
+    """
+    return password_hasher.run(_verify_and_update, plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    return password_hasher.run(_hash, password)
+
+
+def get_password_hashes(passwords: Sequence[str]) -> list[str]:
+    """
+    Hash many passwords concurrently on the hashing pool (bulk user creation).
+    """
+    return password_hasher.run_many(_hash, [(password,) for password in passwords])
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run_async(_verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.run_async(_hash, password)
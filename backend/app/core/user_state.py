@@ -0,0 +1,75 @@
+# path: app/core/user_state.py
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Optional, Union
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.schemas.token import TokenPayload
+
+
+@dataclass(frozen=True)
+class AuthUser:
+    """
+    인증에 필요한 최소한의 사용자 상태 (DB 조회 없이 권한 체크에 사용)
+    """
+    id: UUID
+    is_active: bool
+    is_superuser: bool
+
+
+# user_id -> AuthUser
+user_state_cache: TTLCache[AuthUser] = TTLCache(
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_user_state(user_id: Union[str, UUID]) -> None:
+    """
+    사용자 상태가 바뀌었을 때 (수정/삭제/비밀번호 재설정) 캐시에서 제거
+    """
+    user_state_cache.delete(UUID(str(user_id)))
+
+
+# sha256(access token) -> 서명/만료 검증을 마친 TokenPayload
+# 항목별 TTL은 토큰의 남은 유효 시간 (exp 이후에는 다시 jwt.decode로 검증 → 만료 처리)
+access_token_cache: TTLCache[TokenPayload] = TTLCache(
+    max_size=settings.ACCESS_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+def access_token_digest(token: str) -> bytes:
+    """
+    캐시 키 (토큰 원문을 메모리에 보관하지 않도록 digest 사용)
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+# read-your-writes 표식: 마지막 쓰기 시각(unix time, ms)을 클라이언트가 들고 다님
+# (cookie 또는 X-Last-Write 헤더). 워커 메모리에 두지 않으므로 어느 워커가 읽기를 받아도 동일하게 동작
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+# 여러 서버 간 시계 오차 허용치 (이만큼 미래인 표식까지는 유효)
+_CLOCK_SKEW_MS = 1000
+
+
+def last_write_marker() -> str:
+    return str(time.time_ns() // 1_000_000)
+
+
+def wrote_recently(marker: Optional[str]) -> bool:
+    """
+    표식의 시각이 READ_YOUR_WRITES_SECONDS 이내이면 True (잘못된 값/미래 시각은 무시)
+    """
+    if not marker:
+        return False
+    try:
+        elapsed_ms = time.time_ns() // 1_000_000 - int(marker)
+    except ValueError:
+        return False
+    return -_CLOCK_SKEW_MS <= elapsed_ms < settings.READ_YOUR_WRITES_SECONDS * 1000
@@ -1,12 +1,21 @@
 # path: app/crud/base.py
 
-from typing import Generic, TypeVar, Type, List, Optional, Union
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Dict, Generic, TypeVar, Type, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
+from sqlalchemy import RowMapping, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel
 
+from app.core.config import settings
+from app.crud.bulk import chunked, insert_rows, update_rows
+from app.crud.count import CountMode, async_count_rows, count_rows
+from app.crud.pagination import apply_keyset, keyset_columns, split_page
+
 # 제네릭 타입 변수 선언
 ModelType = TypeVar("ModelType")                # 실제 모델 클래스 (ex: User, Item 등)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)  # 생성용 Pydantic 스키마
@@ -17,6 +26,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     범용적인 CRUD 기능을 제공하는 베이스 클래스.
     """
 
+    # get / get_multi / get_multi_keyset 에 적용할 관계 로딩 전략.
+    # 응답 스키마가 읽는 관계는 하위 클래스에서 selectinload 등으로 선언해 N+1 lazy load를 방지
+    loader_options: Tuple[ORMOption, ...] = ()
+
     def __init__(self, model: Type[ModelType]):
         """
         초기화 메서드
@@ -33,7 +46,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         :param id: 조회할 레코드의 PK (int, UUID 모두 지원)
         :return: 해당 레코드를 반환하거나, 없으면 None을 반환
         """
-        return db.query(self.model).filter(self.model.id == id).first()
+        return db.query(self.model).options(*self.loader_options).filter(self.model.id == id).first()
 
     def get_multi(self, db: Session, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """
@@ -44,7 +57,54 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         :param limit: 반환할 최대 개수
         :return: 조회된 레코드 목록
         """
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return db.query(self.model).options(*self.loader_options).offset(skip).limit(limit).all()
+
+    def get_multi_keyset(
+        self, db: Session, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        keyset(cursor) 기반 다수 레코드 조회 메서드
+        (created_at, id) 순으로 정렬하므로 깊은 페이지도 첫 페이지와 동일한 비용
+
+        :param db: DB 세션
+        :param cursor: 이전 응답의 next_cursor (첫 페이지는 None)
+        :param limit: 반환할 최대 개수
+        :return: (조회된 레코드 목록, 다음 페이지 커서 또는 None)
+        """
+        stmt = apply_keyset(select(self.model).options(*self.loader_options), self.model, cursor, limit)
+        rows = db.execute(stmt).scalars().all()
+        return split_page(rows, self.model, limit)
+
+    def iter_partitions(
+        self, db: Session, fields: Sequence[str], *criteria: Any, batch_size: Optional[int] = None
+    ) -> Iterator[Sequence[RowMapping]]:
+        """
+        server-side cursor(yield_per)로 레코드를 batch 단위로 순회하는 메서드
+        ORM 객체를 만들지 않고 필요한 컬럼만 조회하므로 전체 행 수와 무관하게 메모리가 일정
+
+        :param db: DB 세션
+        :param fields: 조회할 컬럼 이름 목록
+        :param criteria: where 조건
+        :param batch_size: 한 번에 가져올 행 수 (기본값 EXPORT_BATCH_SIZE)
+        :return: 행(RowMapping) 묶음 iterator
+        """
+        stmt = (
+            select(*(getattr(self.model, field) for field in fields))
+            .where(*criteria)
+            .order_by(*keyset_columns(self.model))
+            .execution_options(yield_per=batch_size or settings.EXPORT_BATCH_SIZE)
+        )
+        yield from db.execute(stmt).mappings().partitions()
+
+    def count(self, db: Session, mode: CountMode = "auto") -> int:
+        """
+        전체 레코드 수 조회 메서드
+
+        :param db: DB 세션
+        :param mode: exact(COUNT(*)) / estimate(pg_class 추정치) / auto(큰 테이블만 추정치)
+        :return: 레코드 수
+        """
+        return count_rows(db, self.model, mode=mode)
 
     def create(self, db: Session, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -55,8 +115,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         :return: 생성된 레코드 객체
         """
         try:
-            obj_data = obj_in.model_dump()
-            db_obj = self.model(**obj_data)
+            # 모델 컬럼이 아닌 스키마 필드는 제외 (create_many와 동일)
+            db_obj = self.model(**insert_rows(self.model, [obj_in], {})[0])
             db.add(db_obj)
             db.commit()
             db.refresh(db_obj)
@@ -104,3 +164,352 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 db.rollback()
                 raise e
         return None
+
+    def create_many(
+        self,
+        db: Session,
+        objs_in: Sequence[CreateSchemaType],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+        **extra: Any,
+    ) -> List[ModelType]:
+        """
+        다수 레코드 일괄 생성 메서드 (chunk 단위 multi-row INSERT ... RETURNING)
+
+        :param db: DB 세션
+        :param objs_in: 생성에 필요한 Pydantic 스키마 객체 목록
+        :param chunk_size: INSERT 한 번에 담을 행 수 (기본값 BULK_CHUNK_SIZE)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :param extra: 모든 행에 공통으로 넣을 값 (ex: owner_id)
+        :return: 생성된 레코드 목록 (세션에서 분리된 객체)
+        """
+        rows = insert_rows(self.model, objs_in, extra)
+        return self._insert_many(db, rows, chunk_size=chunk_size, commit=commit)
+
+    def _insert_many(
+        self,
+        db: Session,
+        rows: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        try:
+            created: List[ModelType] = []
+            for chunk in chunked(rows, chunk_size):
+                created.extend(db.scalars(insert(self.model).returning(self.model), list(chunk)).all())
+            # commit 시 만료(expire)되어 행마다 재조회되지 않도록 세션에서 분리
+            for obj in created:
+                db.expunge(obj)
+            if commit:
+                db.commit()
+            return created
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
+    def update_many(
+        self,
+        db: Session,
+        objs_in: Sequence[Tuple[Union[int, UUID], UpdateSchemaType]],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+    ) -> int:
+        """
+        다수 레코드 일괄 업데이트 메서드 (PK 기준 executemany UPDATE)
+
+        :param db: DB 세션
+        :param objs_in: (PK, 업데이트 스키마) 목록 (exclude_unset=True 적용)
+        :param chunk_size: executemany 한 번에 담을 행 수 (기본값 BULK_CHUNK_SIZE)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :return: 업데이트 요청된 행 수
+        """
+        rows = update_rows(self.model, objs_in)
+        try:
+            for chunk in chunked(rows, chunk_size):
+                db.execute(update(self.model), list(chunk))
+            if commit:
+                db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
+    def delete_many(
+        self,
+        db: Session,
+        ids: Sequence[Union[int, UUID]],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        다수 레코드 일괄 삭제 메서드 (chunk 단위 DELETE ... WHERE id IN (...) RETURNING)
+
+        :param db: DB 세션
+        :param ids: 삭제할 PK 목록
+        :param chunk_size: DELETE 한 번에 담을 PK 수 (기본값 BULK_CHUNK_SIZE)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :return: 삭제된 레코드 목록 (세션에서 분리된 객체)
+        """
+        try:
+            deleted: List[ModelType] = []
+            for chunk in chunked(ids, chunk_size):
+                stmt = delete(self.model).where(self.model.id.in_(chunk)).returning(self.model)
+                deleted.extend(db.scalars(stmt).all())
+            for obj in deleted:
+                db.expunge(obj)
+            if commit:
+                db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    CRUDBase와 동일한 API를 AsyncSession 위에서 제공하는 비동기 베이스 클래스.
+    """
+
+    # get / get_multi / get_multi_keyset 에 적용할 관계 로딩 전략.
+    # 응답 스키마가 읽는 관계는 하위 클래스에서 selectinload 등으로 선언해 N+1 lazy load를 방지
+    loader_options: Tuple[ORMOption, ...] = ()
+
+    def __init__(self, model: Type[ModelType]):
+        """
+        초기화 메서드
+
+        :param model: SQLAlchemy 모델 클래스
+        """
+        self.model = model
+
+    async def get(self, db: AsyncSession, id: Union[int, UUID]) -> Optional[ModelType]:
+        """
+        단일 레코드 조회 메서드
+
+        :param db: 비동기 DB 세션
+        :param id: 조회할 레코드의 PK (int, UUID 모두 지원)
+        :return: 해당 레코드를 반환하거나, 없으면 None을 반환
+        """
+        result = await db.execute(
+            select(self.model).options(*self.loader_options).where(self.model.id == id)
+        )
+        return result.scalars().first()
+
+    async def get_multi(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        """
+        다수 레코드 조회 메서드
+
+        :param db: 비동기 DB 세션
+        :param skip: 시작 인덱스
+        :param limit: 반환할 최대 개수
+        :return: 조회된 레코드 목록
+        """
+        result = await db.execute(
+            select(self.model).options(*self.loader_options).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_multi_keyset(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        keyset(cursor) 기반 다수 레코드 조회 메서드
+
+        :param db: 비동기 DB 세션
+        :param cursor: 이전 응답의 next_cursor (첫 페이지는 None)
+        :param limit: 반환할 최대 개수
+        :return: (조회된 레코드 목록, 다음 페이지 커서 또는 None)
+        """
+        stmt = apply_keyset(select(self.model).options(*self.loader_options), self.model, cursor, limit)
+        result = await db.execute(stmt)
+        return split_page(result.scalars().all(), self.model, limit)
+
+    async def stream_partitions(
+        self, db: AsyncSession, fields: Sequence[str], *criteria: Any, batch_size: Optional[int] = None
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        server-side cursor(stream + yield_per)로 레코드를 batch 단위로 순회하는 메서드
+
+        :param db: 비동기 DB 세션
+        :param fields: 조회할 컬럼 이름 목록
+        :param criteria: where 조건
+        :param batch_size: 한 번에 가져올 행 수 (기본값 EXPORT_BATCH_SIZE)
+        :return: 행(RowMapping) 묶음 async iterator
+        """
+        stmt = (
+            select(*(getattr(self.model, field) for field in fields))
+            .where(*criteria)
+            .order_by(*keyset_columns(self.model))
+            .execution_options(yield_per=batch_size or settings.EXPORT_BATCH_SIZE)
+        )
+        result = await db.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield partition
+
+    async def count(self, db: AsyncSession, mode: CountMode = "auto") -> int:
+        """
+        전체 레코드 수 조회 메서드
+
+        :param db: 비동기 DB 세션
+        :param mode: exact(COUNT(*)) / estimate(pg_class 추정치) / auto(큰 테이블만 추정치)
+        :return: 레코드 수
+        """
+        return await async_count_rows(db, self.model, mode=mode)
+
+    async def create(self, db: AsyncSession, obj_in: CreateSchemaType) -> ModelType:
+        """
+        신규 레코드 생성 메서드
+
+        :param db: 비동기 DB 세션
+        :param obj_in: 생성에 필요한 Pydantic 스키마 객체
+        :return: 생성된 레코드 객체
+        """
+        try:
+            # 모델 컬럼이 아닌 스키마 필드는 제외 (create_many와 동일)
+            db_obj = self.model(**insert_rows(self.model, [obj_in], {})[0])
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise e
+
+    async def update(self, db: AsyncSession, db_obj: ModelType, obj_in: UpdateSchemaType) -> ModelType:
+        """
+        기존 레코드 업데이트 메서드
+
+        :param db: 비동기 DB 세션
+        :param db_obj: 기존 레코드 객체
+        :param obj_in: 업데이트에 필요한 Pydantic 스키마 객체 (exclude_unset=True 적용)
+        :return: 업데이트된 레코드 객체
+        """
+        try:
+            obj_data = obj_in.model_dump(exclude_unset=True)
+            for field, value in obj_data.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise e
+
+    async def remove(self, db: AsyncSession, id: Union[int, UUID]) -> Optional[ModelType]:
+        """
+        레코드 삭제 메서드
+
+        :param db: 비동기 DB 세션
+        :param id: 삭제할 레코드의 PK (int, UUID 모두 지원)
+        :return: 삭제된 레코드 객체 (존재하지 않으면 None)
+        """
+        obj = await self.get(db, id=id)
+        if obj:
+            try:
+                await db.delete(obj)
+                await db.commit()
+                return obj
+            except SQLAlchemyError as e:
+                await db.rollback()
+                raise e
+        return None
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        objs_in: Sequence[CreateSchemaType],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+        **extra: Any,
+    ) -> List[ModelType]:
+        """
+        다수 레코드 일괄 생성 메서드 (chunk 단위 multi-row INSERT ... RETURNING)
+
+        :param db: 비동기 DB 세션
+        :param objs_in: 생성에 필요한 Pydantic 스키마 객체 목록
+        :param chunk_size: INSERT 한 번에 담을 행 수 (기본값 BULK_CHUNK_SIZE)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :param extra: 모든 행에 공통으로 넣을 값 (ex: owner_id)
+        :return: 생성된 레코드 목록 (세션에서 분리된 객체)
+        """
+        rows = insert_rows(self.model, objs_in, extra)
+        return await self._insert_many(db, rows, chunk_size=chunk_size, commit=commit)
+
+    async def _insert_many(
+        self,
+        db: AsyncSession,
+        rows: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        try:
+            created: List[ModelType] = []
+            for chunk in chunked(rows, chunk_size):
+                created.extend((await db.scalars(insert(self.model).returning(self.model), list(chunk))).all())
+            # commit 시 만료(expire)되어 행마다 재조회되지 않도록 세션에서 분리
+            for obj in created:
+                db.expunge(obj)
+            if commit:
+                await db.commit()
+            return created
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise e
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        objs_in: Sequence[Tuple[Union[int, UUID], UpdateSchemaType]],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+    ) -> int:
+        """
+        다수 레코드 일괄 업데이트 메서드 (PK 기준 executemany UPDATE)
+
+        :param db: 비동기 DB 세션
+        :param objs_in: (PK, 업데이트 스키마) 목록 (exclude_unset=True 적용)
+        :param chunk_size: executemany 한 번에 담을 행 수 (기본값 BULK_CHUNK_SIZE)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :return: 업데이트 요청된 행 수
+        """
+        rows = update_rows(self.model, objs_in)
+        try:
+            for chunk in chunked(rows, chunk_size):
+                await db.execute(update(self.model), list(chunk))
+            if commit:
+                await db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise e
+
+    async def delete_many(
+        self,
+        db: AsyncSession,
+        ids: Sequence[Union[int, UUID]],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        다수 레코드 일괄 삭제 메서드 (chunk 단위 DELETE ... WHERE id IN (...) RETURNING)
+
+        :param db: 비동기 DB 세션
+        :param ids: 삭제할 PK 목록
+        :param chunk_size: DELETE 한 번에 담을 PK 수 (기본값 BULK_CHUNK_SIZE)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :return: 삭제된 레코드 목록 (세션에서 분리된 객체)
+        """
+        try:
+            deleted: List[ModelType] = []
+            for chunk in chunked(ids, chunk_size):
+                stmt = delete(self.model).where(self.model.id.in_(chunk)).returning(self.model)
+                deleted.extend((await db.scalars(stmt)).all())
+            for obj in deleted:
+                db.expunge(obj)
+            if commit:
+                await db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise e
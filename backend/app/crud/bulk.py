@@ -0,0 +1,49 @@
+# path: app/crud/bulk.py
+
+from collections.abc import Iterator
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+def chunked(rows: Sequence[T], chunk_size: Optional[int] = None) -> Iterator[Sequence[T]]:
+    """
+    rows를 chunk_size(기본값 BULK_CHUNK_SIZE) 단위로 분할
+    """
+    size = chunk_size or settings.BULK_CHUNK_SIZE
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _column_keys(model: Any) -> set[str]:
+    return {column.key for column in inspect(model).column_attrs}
+
+
+def insert_rows(model: Any, objs_in: Sequence[BaseModel], extra: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    생성 스키마 목록을 INSERT용 dict 목록으로 변환 (모델 컬럼이 아닌 필드는 제외)
+    """
+    keys = _column_keys(model)
+    return [
+        {k: v for k, v in {**obj_in.model_dump(), **extra}.items() if k in keys}
+        for obj_in in objs_in
+    ]
+
+
+def update_rows(
+    model: Any, objs_in: Sequence[Tuple[Union[int, UUID], BaseModel]]
+) -> List[Dict[str, Any]]:
+    """
+    (id, 업데이트 스키마) 목록을 PK 기반 bulk UPDATE용 dict 목록으로 변환 (exclude_unset)
+    """
+    keys = _column_keys(model) - {"id"}
+    return [
+        {"id": id, **{k: v for k, v in obj_in.model_dump(exclude_unset=True).items() if k in keys}}
+        for id, obj_in in objs_in
+    ]
@@ -0,0 +1,71 @@
+# path: app/crud/count.py
+
+from typing import Any, Literal, Optional
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# exact   : 항상 COUNT(*)
+# estimate: pg_class.reltuples 추정치 (통계가 없으면 COUNT(*)로 대체)
+# auto    : 추정치가 COUNT_ESTIMATE_THRESHOLD 이상인 큰 테이블만 추정치 사용
+CountMode = Literal["exact", "estimate", "auto"]
+
+_ESTIMATE_SQL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+
+def _item_count_cache_size() -> int:
+    """
+    워커가 여러 개면 (auto) 캐시 크기를 0으로 두어 항상 DB에서 집계
+    (다른 워커의 증감/무효화를 받지 못해 TTL 동안 stale 개수를 반환하므로)
+    """
+    backend = settings.ITEM_COUNT_CACHE_BACKEND
+    if backend == "auto":
+        backend = "memory" if settings.WEB_CONCURRENCY <= 1 else "none"
+    return settings.ITEM_COUNT_CACHE_MAX_SIZE if backend == "memory" else 0
+
+
+# owner_id -> 해당 사용자의 Item 개수
+item_count_cache: TTLCache[int] = TTLCache(
+    max_size=_item_count_cache_size(),
+    ttl=settings.ITEM_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+def count_statement(model: Any, *criteria: Any) -> Select:
+    return select(func.count()).select_from(model).where(*criteria)
+
+
+def _use_estimate(estimate: Optional[int], mode: CountMode) -> bool:
+    # reltuples = -1 (한 번도 ANALYZE 되지 않음) 이면 추정치를 쓰지 않음
+    if estimate is None or estimate < 0:
+        return False
+    return mode == "estimate" or estimate >= settings.COUNT_ESTIMATE_THRESHOLD
+
+
+def count_rows(db: Session, model: Any, mode: CountMode = "auto") -> int:
+    """
+    테이블 전체 행 수 (mode에 따라 정확한 값 또는 추정치)
+    """
+    if mode != "exact":
+        estimate = db.execute(_ESTIMATE_SQL, {"table_name": model.__tablename__}).scalar()
+        if _use_estimate(estimate, mode):
+            return int(estimate)
+    return db.execute(count_statement(model)).scalar_one()
+
+
+async def async_count_rows(db: AsyncSession, model: Any, mode: CountMode = "auto") -> int:
+    """
+    count_rows의 비동기 버전
+    """
+    if mode != "exact":
+        estimate = (
+            await db.execute(_ESTIMATE_SQL, {"table_name": model.__tablename__})
+        ).scalar()
+        if _use_estimate(estimate, mode):
+            return int(estimate)
+    return (await db.execute(count_statement(model))).scalar_one()
@@ -0,0 +1,14 @@
+# path: app/crud/email.py
+
+from app.crud.base import CRUDBase
+from app.models.email import EmailDeadLetter
+from app.schemas.email import EmailDeadLetterCreate, EmailDeadLetterUpdate
+
+
+class CRUDEmailDeadLetter(CRUDBase[EmailDeadLetter, EmailDeadLetterCreate, EmailDeadLetterUpdate]):
+    """
+    발송에 최종 실패한 메일(dead-letter) 기록용 CRUD 클래스
+    """
+
+
+crud_email_dead_letter = CRUDEmailDeadLetter(EmailDeadLetter)
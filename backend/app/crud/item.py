@@ -1,13 +1,25 @@
 # path: app/crud/item.py
 
-from typing import Union, List
+from typing import Any, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.crud.bulk import insert_rows
+from app.crud.count import count_statement, item_count_cache
+from app.crud.pagination import apply_keyset, split_page
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
 
+def _invalidate_owner_counts(items: Sequence[Item]) -> None:
+    # bulk 작업은 증감 대신 owner별 count 캐시를 비워 다음 조회 때 다시 집계
+    for owner_id in {item.owner_id for item in items}:
+        item_count_cache.delete(owner_id)
+
+
 class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
     """
     Item 모델에 특화된 CRUD 로직을 관리하는 클래스
@@ -24,4 +36,121 @@ class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
             .all()
         )
 
+    def get_by_owner_keyset(
+        self, db: Session, owner_id: UUID, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        특정 owner_id 기준 Item 리스트를 (created_at, id) keyset으로 조회
+        """
+        stmt = apply_keyset(
+            select(self.model).where(self.model.owner_id == owner_id), self.model, cursor, limit
+        )
+        return split_page(db.execute(stmt).scalars().all(), self.model, limit)
+
+    def count_by_owner(self, db: Session, owner_id: UUID) -> int:
+        """
+        특정 owner_id의 Item 개수 (TTL 캐시, create/remove 시 증감)
+        """
+        count = item_count_cache.get(owner_id)
+        if count is None:
+            count = db.execute(count_statement(self.model, self.model.owner_id == owner_id)).scalar_one()
+            item_count_cache.set(owner_id, count)
+        return count
+
+    def create(self, db: Session, obj_in: ItemCreate) -> Item:
+        db_obj = super().create(db, obj_in)
+        if db_obj.owner_id is not None:
+            item_count_cache.incr(db_obj.owner_id, 1)
+        return db_obj
+
+    def remove(self, db: Session, id: Union[int, UUID]) -> Optional[Item]:
+        obj = super().remove(db, id)
+        if obj:
+            item_count_cache.incr(obj.owner_id, -1)
+        return obj
+
+    def create_many(self, db: Session, objs_in: Sequence[ItemCreate], **kwargs: Any) -> List[Item]:
+        items = super().create_many(db, objs_in, **kwargs)
+        _invalidate_owner_counts(items)
+        return items
+
+    def delete_many(self, db: Session, ids: Sequence[Union[int, UUID]], **kwargs: Any) -> List[Item]:
+        items = super().delete_many(db, ids, **kwargs)
+        _invalidate_owner_counts(items)
+        return items
+
 crud_item = CRUDItem(Item)
+
+
+class AsyncCRUDItem(AsyncCRUDBase[Item, ItemCreate, ItemUpdate]):
+    """
+    CRUDItem의 비동기 버전 (items 라우터에서 사용)
+    """
+    async def get_by_owner(self, db: AsyncSession, owner_id: UUID, skip: int = 0, limit: int = 100) -> List[Item]:
+        """
+        특정 owner_id 기준으로 Item 리스트 조회
+        """
+        result = await db.execute(
+            select(self.model)
+            .where(self.model.owner_id == owner_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_owner_keyset(
+        self, db: AsyncSession, owner_id: UUID, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        특정 owner_id 기준 Item 리스트를 (created_at, id) keyset으로 조회
+        """
+        stmt = apply_keyset(
+            select(self.model).where(self.model.owner_id == owner_id), self.model, cursor, limit
+        )
+        result = await db.execute(stmt)
+        return split_page(result.scalars().all(), self.model, limit)
+
+    async def count_by_owner(self, db: AsyncSession, owner_id: UUID) -> int:
+        """
+        특정 owner_id의 Item 개수 (TTL 캐시, create/remove 시 증감)
+        """
+        count = item_count_cache.get(owner_id)
+        if count is None:
+            result = await db.execute(count_statement(self.model, self.model.owner_id == owner_id))
+            count = result.scalar_one()
+            item_count_cache.set(owner_id, count)
+        return count
+
+    async def create_with_owner(self, db: AsyncSession, obj_in: ItemCreate, owner_id: UUID) -> Item:
+        """
+        owner_id를 포함하여 Item 생성 (INSERT 한 번으로 처리)
+        - 모델 컬럼이 아닌 스키마 필드(description)는 제외
+        """
+        try:
+            db_obj = self.model(**insert_rows(self.model, [obj_in], {"owner_id": owner_id})[0])
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            item_count_cache.incr(owner_id, 1)
+            return db_obj
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise e
+
+    async def remove(self, db: AsyncSession, id: Union[int, UUID]) -> Optional[Item]:
+        obj = await super().remove(db, id)
+        if obj:
+            item_count_cache.incr(obj.owner_id, -1)
+        return obj
+
+    async def create_many(self, db: AsyncSession, objs_in: Sequence[ItemCreate], **kwargs: Any) -> List[Item]:
+        items = await super().create_many(db, objs_in, **kwargs)
+        _invalidate_owner_counts(items)
+        return items
+
+    async def delete_many(self, db: AsyncSession, ids: Sequence[Union[int, UUID]], **kwargs: Any) -> List[Item]:
+        items = await super().delete_many(db, ids, **kwargs)
+        _invalidate_owner_counts(items)
+        return items
+
+async_crud_item = AsyncCRUDItem(Item)
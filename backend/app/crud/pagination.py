@@ -0,0 +1,86 @@
+# path: app/crud/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class InvalidCursor(ValueError):
+    """
+    디코딩할 수 없거나 키 구성과 맞지 않는 커서 토큰
+    """
+
+
+def keyset_columns(model: Any) -> Tuple[InstrumentedAttribute, ...]:
+    """
+    keyset 정렬 키: created_at이 있으면 (created_at, id), 없으면 (id,)
+    """
+    if hasattr(model, "created_at"):
+        return (model.created_at, model.id)
+    return (model.id,)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(column: InstrumentedAttribute, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(obj: Any, columns: Sequence[InstrumentedAttribute]) -> str:
+    """
+    레코드의 정렬 키 값을 불투명한(opaque) URL-safe 토큰으로 인코딩
+    """
+    values = [_encode_value(getattr(obj, column.key)) for column in columns]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, columns: Sequence[InstrumentedAttribute]) -> List[Any]:
+    """
+    encode_cursor로 만든 토큰을 컬럼 타입에 맞는 값 목록으로 복원
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise InvalidCursor("Invalid cursor")
+        return [_decode_value(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def apply_keyset(stmt: Select, model: Any, cursor: Optional[str], limit: int) -> Select:
+    """
+    select 문에 keyset 조건/정렬을 적용. 다음 페이지 존재 여부 확인을 위해 limit + 1 개를 조회
+    """
+    columns = keyset_columns(model)
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        stmt = stmt.where(tuple_(*columns) > tuple_(*values))
+    return stmt.order_by(*columns).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], model: Any, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    limit + 1 개로 조회한 결과를 (페이지, next_cursor)로 분리
+    """
+    page = list(rows[:limit])
+    if len(rows) > limit and page:
+        return page, encode_cursor(page[-1], keyset_columns(model))
+    return page, None
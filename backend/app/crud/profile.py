@@ -3,7 +3,7 @@
 
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.models.profile import Profile, Role
 from app.schemas.profile import ProfileCreate, ProfileUpdate
 from app.schemas.role import RoleCreate, RoleUpdate
@@ -12,37 +12,42 @@ from typing import Optional, Union
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from app.core.response_cache import invalidate_profile, invalidate_roles
 
 class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
     """
     Profile 모델에 특화된 CRUD 로직을 관리하는 클래스
     """
+    # ProfilePublic이 roles를 직렬화하므로 항상 함께 로드 (프로필당 lazy load 방지)
+    loader_options = (selectinload(Profile.roles),)
+
     def get_by_user_id(self, db: Session, user_id: UUID) -> Optional[Profile]:
         """
-        user_id를 통해 Profile을 조회.
+        user_id를 통해 Profile을 조회 (roles 포함).
         """
         return (
             db.query(self.model)
+            .options(*self.loader_options)
             .filter(self.model.user_id == user_id)
             .first()
         )
     
     def create_profile(self, db: Session, obj_in: ProfileCreate) -> Profile:
+        """
+        Profile 생성 시 role_ids 연결까지 한 번의 commit으로 처리하는 메서드.
+        """
         try:
             # 1. role_ids를 제외하고 Profile 인스턴스 생성
-            obj_data = obj_in.model_dump(exclude={"role_ids"})
-            db_obj = Profile(**obj_data)  # role_ids가 제거됐으므로 에러가 안 난다
-            db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
+            obj_data = obj_in.model_dump(exclude={"role_ids", "roles"})
+            db_obj = Profile(**obj_data)
 
-            # 2. role_ids가 있다면, 실제 Role 관계를 맺는다
+            # 2. role_ids가 있다면, 같은 트랜잭션에서 Role 관계를 맺는다
             if obj_in.role_ids:
-                roles = crud_role.get_multi_by_ids(db=db, ids=obj_in.role_ids)
-                db_obj.roles = roles  # M:N 관계 설정
-                db.commit()
-                db.refresh(db_obj)
+                db_obj.roles = crud_role.get_multi_by_ids(db=db, ids=obj_in.role_ids)  # M:N 관계 설정
 
+            db.add(db_obj)
+            db.commit()
+            db.refresh(db_obj)
             return db_obj
 
         except SQLAlchemyError as e:
@@ -52,7 +57,9 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
     def update_profile(self, db: Session, db_obj: Profile, obj_in: ProfileUpdate) -> Profile:
         """
         Profile을 업데이트할 때, role_ids 처리까지 포함한 메서드.
+        (캐시된 프로필 응답은 성공/실패와 관계없이 무효화)
         """
+        user_id = db_obj.user_id
         try:
             # 1) role_ids 등 Profile 모델에 없는 필드는 제외
             obj_data = obj_in.model_dump(exclude={"role_ids", "roles"})
@@ -86,6 +93,8 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         except ValueError as ve:
             db.rollback()
             raise ve
+        finally:
+            invalidate_profile(user_id)
 
 crud_profile = CRUDProfile(Profile)
 
@@ -104,15 +113,21 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
             return []
         return db.query(self.model).filter(self.model.id.in_(ids)).all()
 
-    # 필요하다면 create/update 오버라이드 (아래는 기본 CRUDBase 사용)
-    #
-    # def create(self, db: Session, obj_in: RoleCreate) -> Role:
-    #     # 예시로, DB에 넣기 전에 추가 검증 로직이나 기본값 설정 등을 할 수 있음
-    #     return super().create(db, obj_in)
-    #
-    # def update(self, db: Session, db_obj: Role, obj_in: RoleUpdate) -> Role:
-    #     # 예시로, 기존 로직에 더해 다른 관계 업데이트 등을 할 수 있음
-    #     return super().update(db, db_obj, obj_in)
+    # Role 목록과 (role 이름을 포함하는) 프로필 응답 캐시를 함께 무효화
+    def create(self, db: Session, obj_in: RoleCreate) -> Role:
+        role = super().create(db, obj_in)
+        invalidate_roles()
+        return role
+
+    def update(self, db: Session, db_obj: Role, obj_in: RoleUpdate) -> Role:
+        role = super().update(db, db_obj, obj_in)
+        invalidate_roles()
+        return role
+
+    def remove(self, db: Session, id: int) -> Optional[Role]:
+        role = super().remove(db, id)
+        invalidate_roles()
+        return role
 
 
 
@@ -0,0 +1,119 @@
+# path: app/crud/token.py
+
+import uuid
+from datetime import timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import create_refresh_token, hash_refresh_token
+from app.crud.base import CRUDBase
+from app.models.token import RefreshToken
+from app.models.user import User
+from app.schemas.token import RefreshTokenCreate, RefreshTokenUpdate
+
+
+class CRUDRefreshToken(CRUDBase[RefreshToken, RefreshTokenCreate, RefreshTokenUpdate]):
+    """
+    Rotating refresh token CRUD 클래스 (DB에는 토큰의 SHA-256 해시만 저장)
+    """
+
+    def issue(
+        self, db: Session, *, user_id: UUID, family_id: Optional[UUID] = None, commit: bool = True
+    ) -> str:
+        """
+        새 refresh token 발급
+
+        :param db: DB 세션
+        :param user_id: 토큰 소유자
+        :param family_id: rotation으로 발급할 때 이전 토큰의 family (없으면 새 로그인 = 새 family)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :return: 클라이언트에 전달할 토큰 원문
+        """
+        token = create_refresh_token()
+        db.add(
+            self.model(
+                user_id=user_id,
+                family_id=family_id or uuid.uuid4(),
+                token_hash=hash_refresh_token(token),
+                expires_at=func.now() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            )
+        )
+        if commit:
+            db.commit()
+        return token
+
+    def rotate(self, db: Session, *, token: str) -> Optional[Tuple[UUID, str]]:
+        """
+        유효한 토큰을 폐기하고 같은 family로 새 토큰을 발급 (한 트랜잭션).
+        이미 폐기된 토큰이 다시 사용되면 family 전체를 폐기.
+        비활성 사용자의 토큰은 폐기하지도, 새로 발급하지도 않고 None 반환.
+
+        :param db: DB 세션
+        :param token: 클라이언트가 보낸 refresh token 원문
+        :return: (user_id, 새 토큰 원문), 유효하지 않으면 None
+        """
+        token_hash = hash_refresh_token(token)
+        try:
+            # 조건부 UPDATE ... FROM users ... RETURNING: 동시에 같은 토큰으로 요청해도 한 번만 성공,
+            # 사용자 활성 여부도 같은 문장에서 확인
+            row = db.execute(
+                update(self.model)
+                .where(
+                    self.model.token_hash == token_hash,
+                    self.model.revoked_at.is_(None),
+                    self.model.expires_at > func.now(),
+                    self.model.user_id == User.id,
+                    User.is_active.is_(True),
+                )
+                .values(revoked_at=func.now())
+                .returning(self.model.user_id, self.model.family_id)
+            ).first()
+            if row is None:
+                family_id = db.scalar(
+                    select(self.model.family_id).where(
+                        self.model.token_hash == token_hash, self.model.revoked_at.is_not(None)
+                    )
+                )
+                if family_id is not None:
+                    self._revoke(db, self.model.family_id == family_id)
+                db.commit()
+                return None
+            new_token = self.issue(db, user_id=row.user_id, family_id=row.family_id, commit=False)
+            db.commit()
+            return row.user_id, new_token
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
+    def revoke(self, db: Session, *, token: str) -> None:
+        """
+        토큰이 속한 family 전체를 폐기 (로그아웃)
+        """
+        family_id = select(self.model.family_id).where(
+            self.model.token_hash == hash_refresh_token(token)
+        ).scalar_subquery()
+        self._revoke(db, self.model.family_id == family_id)
+        db.commit()
+
+    def revoke_all_for_user(self, db: Session, *, user_id: UUID, commit: bool = True) -> None:
+        """
+        사용자의 모든 refresh token 폐기 (비밀번호 변경/재설정 시)
+        """
+        self._revoke(db, self.model.user_id == user_id)
+        if commit:
+            db.commit()
+
+    def _revoke(self, db: Session, condition: object) -> None:
+        db.execute(
+            update(self.model)
+            .where(condition, self.model.revoked_at.is_(None))  # type: ignore[arg-type]
+            .values(revoked_at=func.now())
+        )
+
+
+crud_refresh_token = CRUDRefreshToken(RefreshToken)
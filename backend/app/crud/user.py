@@ -1,22 +1,50 @@
 # path: app/crud/user.py
 
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Sequence, Set, Union
 from uuid import UUID
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.models.user import User
 from app.models.item import Item
+from app.models.profile import Profile, Role, profile_roles_association
+from app.schemas.profile import ProfileCreate
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, get_password_hashes, verify_and_update_password
+from app.core.response_cache import invalidate_profile
+from app.core.user_state import invalidate_user_state
+from app.crud.count import item_count_cache
 
 from .base import CRUDBase
 
+
+class EmailAlreadyExists(ValueError):
+    """
+    이미 등록된 이메일로 가입을 시도한 경우 (INSERT ... ON CONFLICT로 감지)
+    """
+
+
+class UnknownRoles(ValueError):
+    """
+    존재하지 않는 role id로 프로필 역할을 연결하려는 경우 (FK 오류 대신 사전 검증으로 감지)
+    """
+
+    def __init__(self, role_ids: Sequence[int]) -> None:
+        self.role_ids = list(role_ids)
+        super().__init__(f"Unknown role ids: {', '.join(map(str, self.role_ids))}")
+
+
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """
     User 모델에 특화된 CRUD 로직을 관리하는 클래스.
     """
+    # UserPublic은 관계를 직렬화하지 않으므로 목록 조회 시 관계를 로드하지 않음.
+    # 관계가 필요한 경우 get_with_relations 사용
+    loader_options = ()
 
     def get_with_relations(self, db: Session, user_id: Union[int, UUID]) -> Optional[User]:
         """
@@ -26,9 +54,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         :param user_id: 조회할 유저의 PK (int, UUID)
         :return: 조회된 User 객체 (없으면 None)
         """
+        # items(1:N)는 joinedload 시 user 행이 item 수만큼 중복되므로 selectinload,
+        # profile(1:1)은 join, profile.roles는 selectinload로 한 번의 추가 쿼리
         return (
             db.query(self.model)
-            .options(joinedload(self.model.items), joinedload(self.model.profile))
+            .options(
+                selectinload(self.model.items),
+                joinedload(self.model.profile).selectinload(Profile.roles),
+            )
             .filter(self.model.id == user_id)
             .first()
         )
@@ -48,6 +81,9 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
                 db.query(Item).filter(Item.owner_id == user_id).delete()
                 db.delete(user)
                 db.commit()
+                invalidate_user_state(user_id)
+                item_count_cache.delete(user_id)
+                invalidate_profile(user_id)
                 return user
             except SQLAlchemyError as e:
                 db.rollback()
@@ -64,11 +100,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """
         try:
             db_user = User(
-                full_name=obj_in.full_name,
+                full_name=obj_in.full_name or "",
                 email=obj_in.email,
                 hashed_password=get_password_hash(obj_in.password),
-                is_active=True,
-                is_superuser=False,
+                is_active=obj_in.is_active,
+                is_superuser=obj_in.is_superuser,
             )
             db.add(db_user)
             db.commit()
@@ -78,6 +114,73 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             db.rollback()
             raise e
 
+    def create_with_profile(
+        self,
+        *,
+        db: Session,
+        obj_in: UserCreate,
+        profile_in: Optional[ProfileCreate] = None,
+    ) -> User:
+        """
+        사용자 + 프로필 + 역할 연결을 하나의 트랜잭션에서 생성하는 unit-of-work 메서드 (commit 1회)
+
+        - 이메일 중복은 사전 조회 대신 INSERT ... ON CONFLICT DO NOTHING 으로 확인
+        - 중간에 실패하면 전체 롤백되므로 프로필 없는 사용자가 남지 않음
+
+        :param db: DB 세션
+        :param obj_in: 생성할 유저 정보 (UserCreate)
+        :param profile_in: 프로필 정보 (user_id는 무시, 없으면 빈 프로필 생성)
+        :return: 생성된 User 객체 (세션에서 분리된 객체)
+        :raises EmailAlreadyExists: 이미 등록된 이메일인 경우
+        :raises UnknownRoles: profile_in.role_ids 중 존재하지 않는 role이 있는 경우
+        """
+        # 해싱은 트랜잭션 밖에서 수행 (커넥션 점유 시간 최소화)
+        hashed_password = get_password_hash(obj_in.password)
+        profile_data = (
+            profile_in.model_dump(exclude={"user_id", "role_ids", "roles"})
+            if profile_in
+            else {"first_name": "", "last_name": "", "avatar_url": "", "bio": "", "birth_date": None}
+        )
+        role_ids = list(dict.fromkeys(profile_in.role_ids)) if profile_in else []
+
+        try:
+            if role_ids:
+                # FK 오류(500) 대신 명확한 오류를 내도록 INSERT 전에 한 번에 확인
+                found = set(db.scalars(select(Role.id).where(Role.id.in_(role_ids))))
+                missing = [role_id for role_id in role_ids if role_id not in found]
+                if missing:
+                    db.rollback()
+                    raise UnknownRoles(missing)
+            user = db.scalars(
+                pg_insert(self.model)
+                .values(
+                    full_name=obj_in.full_name or "",
+                    email=obj_in.email,
+                    hashed_password=hashed_password,
+                    is_active=obj_in.is_active,
+                    is_superuser=obj_in.is_superuser,
+                )
+                .on_conflict_do_nothing(index_elements=[func.lower(self.model.email)])
+                .returning(self.model)
+            ).one_or_none()
+            if user is None:
+                db.rollback()
+                raise EmailAlreadyExists("Email already exists")
+
+            db.execute(insert(Profile).values(user_id=user.id, **profile_data))
+            if role_ids:
+                db.execute(
+                    insert(profile_roles_association),
+                    [{"profile_user_id": user.id, "role_id": role_id} for role_id in role_ids],
+                )
+            # commit 후 만료된 속성 재조회(추가 SELECT)를 막기 위해 분리
+            db.expunge(user)
+            db.commit()
+            return user
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
     def update_user(self, *, db: Session, db_obj: User, obj_in: UserUpdate) -> User:
         """
         사용자 정보 업데이트 시, 비밀번호 해싱 등 부가 로직을 처리할 수 있는 메서드
@@ -100,6 +203,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             db.add(db_obj)
             db.commit()
             db.refresh(db_obj)
+            # is_active / is_superuser 변경이 인증 캐시에 바로 반영되도록 무효화
+            invalidate_user_state(db_obj.id)
             return db_obj
         except SQLAlchemyError as e:
             db.rollback()
@@ -107,20 +212,63 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
     def authenticate(self, *, db: Session, email: str, password: str) -> Optional[User]:
         """
-        이메일과 비밀번호를 사용해 사용자를 인증하는 메서드
+        이메일과 비밀번호를 사용해 사용자를 인증하는 메서드.
+        저장된 해시가 현재 해싱 정책(scheme/cost)과 다르면 인증 성공 시 새 해시로 교체
 
         :param db: DB 세션
         :param email: 사용자 이메일
         :param password: 평문 비밀번호
         :return: 인증된 User 객체 또는 None(인증 실패)
         """
-        user = db.query(self.model).filter(self.model.email == email).first()
+        user = db.query(self.model).filter(self.email_matches(email)).first()
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash is not None:
+            user.hashed_password = new_hash
+            try:
+                db.commit()
+            except SQLAlchemyError:
+                # 해시 교체 실패는 로그인을 막지 않음 (다음 로그인 때 다시 시도)
+                db.rollback()
         return user
 
+    def create_users_many(
+        self, *, db: Session, objs_in: Sequence[UserCreate], commit: bool = True
+    ) -> List[User]:
+        """
+        다수 사용자 일괄 생성 (해싱 프로세스 풀에서 비밀번호를 동시에 해싱 후 multi-row INSERT ... RETURNING)
+
+        :param db: DB 세션
+        :param objs_in: 생성할 유저 정보 목록 (UserCreate)
+        :param commit: False이면 commit하지 않고 호출자의 트랜잭션에 포함
+        :return: 생성된 User 객체 목록 (세션에서 분리된 객체)
+        """
+        hashed_passwords = get_password_hashes([obj_in.password for obj_in in objs_in])
+        rows = [
+            {
+                "full_name": obj_in.full_name or "",
+                "email": obj_in.email,
+                "hashed_password": hashed_password,
+                "is_active": obj_in.is_active,
+                "is_superuser": obj_in.is_superuser,
+            }
+            for obj_in, hashed_password in zip(objs_in, hashed_passwords)
+        ]
+        return self._insert_many(db, rows, commit=commit)
+
+    def get_existing_emails(self, *, db: Session, emails: Iterable[str]) -> Set[str]:
+        """
+        주어진 이메일 중 이미 등록된 이메일 집합(소문자)을 한 번의 쿼리로 조회
+        """
+        emails = [email.lower() for email in emails]
+        if not emails:
+            return set()
+        lowered = func.lower(self.model.email)
+        return set(db.scalars(select(lowered).where(lowered.in_(emails))).all())
+
     def get_user_by_email(self, *, db: Session, email: str) -> Optional[User]:
         """
         이메일로 사용자를 조회하는 메서드
@@ -129,7 +277,13 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         :param email: 조회할 이메일
         :return: 조회된 User 객체 또는 None
         """
-        return db.query(self.model).filter(self.model.email == email).first()
+        return db.query(self.model).filter(self.email_matches(email)).first()
+
+    def email_matches(self, email: str) -> ColumnElement[bool]:
+        """
+        대소문자 구분 없는 이메일 비교 조건 (ix_users_email_lower 인덱스 사용)
+        """
+        return func.lower(self.model.email) == email.lower()
 
 # CRUDUser 인스턴스 생성
 crud_user = CRUDUser(User)
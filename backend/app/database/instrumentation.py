@@ -0,0 +1,62 @@
+# path: app/database/instrumentation.py
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import Engine, event
+
+
+@dataclass
+class QueryStats:
+    """
+    요청 하나 동안 실행된 SQL 문 수 / 총 시간 / 가장 느린 문장
+    """
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        if elapsed > self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+
+
+# 미들웨어가 요청마다 새 QueryStats를 설정. 스레드풀(sync 라우트)과 AsyncSession의 greenlet에도
+# 컨텍스트가 복사되므로, 같은 객체를 변경하는 방식으로 집계
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+_START_TIMES = "query_start_times"
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    started = conn.info[_START_TIMES].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context: Any) -> None:
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_TIMES):
+        conn.info[_START_TIMES].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    엔진에 쿼리 수/시간 측정 hook을 등록 (AsyncEngine은 .sync_engine을 전달)
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,122 @@
+# path: app/database/pool.py
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Optional
+
+from sqlalchemy import Engine, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    커넥션 대기 시간을 측정하는 QueuePool.
+
+    uvicorn 워커마다 별도의 풀이 생성되므로, 수집된 지표도 워커(프로세스) 단위입니다.
+    usage_listener 가 설정되면 checkout/반납 직후 호출 (Prometheus 게이지 갱신용)
+    """
+
+    usage_listener: Optional[Callable[["InstrumentedQueuePool"], None]] = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self._checkouts += 1
+                self._wait_total += waited
+                if waited > self._wait_max:
+                    self._wait_max = waited
+        self._notify_usage()
+        return conn
+
+    def _do_return_conn(self, record: Any) -> None:
+        super()._do_return_conn(record)
+        self._notify_usage()
+
+    def _notify_usage(self) -> None:
+        if self.usage_listener is not None:
+            self.usage_listener(self)
+
+    def recreate(self) -> QueuePool:
+        # engine.dispose() 등으로 풀이 다시 만들어져도 listener 유지
+        pool = super().recreate()
+        pool.usage_listener = self.usage_listener  # type: ignore[attr-defined]
+        return pool
+
+    def stats(self) -> dict[str, Any]:
+        """
+        현재 풀 상태와 누적 대기 시간 지표를 반환
+        """
+        with self._stats_lock:
+            checkouts = self._checkouts
+            wait_total = self._wait_total
+            wait_max = self._wait_max
+            timeouts = self._timeouts
+        return {
+            "pid": os.getpid(),
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_seconds_total": wait_total,
+            "wait_seconds_max": wait_max,
+            "wait_seconds_avg": wait_total / checkouts if checkouts else 0.0,
+        }
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """
+    AsyncEngine용 계측 풀 (asyncio 큐 사용)
+    """
+
+
+def get_pool_stats(engine: Engine) -> dict[str, Any]:
+    """
+    엔진 풀의 지표를 반환. 계측되지 않은 풀이면 같은 형태로 반환하되 누적 지표는 0
+    (QueuePool이면 현재 상태는 채우고, NullPool/StaticPool 등은 모두 0)
+    """
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+    stats: dict[str, Any] = {
+        "pid": os.getpid(),
+        "size": 0,
+        "checked_in": 0,
+        "checked_out": 0,
+        "overflow": 0,
+        "max_overflow": 0,
+        "checkouts": 0,
+        "timeouts": 0,
+        "wait_seconds_total": 0.0,
+        "wait_seconds_max": 0.0,
+        "wait_seconds_avg": 0.0,
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    return stats
@@ -0,0 +1,38 @@
+# path: app/database/routing.py
+
+from typing import Any, Optional
+
+from sqlalchemy import Engine, Select
+from sqlalchemy.orm import Session
+
+# session.info 키: True이면 읽기 전용 SELECT를 replica로 보냄
+USE_REPLICA = "use_replica"
+
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기를 primary와 replica로 나누는 세션.
+
+    - session.info[USE_REPLICA]가 True이고, 일반 SELECT(FOR UPDATE 제외)이면 replica
+    - flush / INSERT / UPDATE / DELETE 등 그 외 모든 작업은 primary
+    - 한 번 primary를 사용한 세션은 이후 SELECT도 primary에 고정 (자신이 쓴 데이터를 바로 읽도록)
+    - replica_bind가 없으면 항상 primary
+    """
+
+    def __init__(self, *args: Any, replica_bind: Optional[Engine] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self._pinned_to_primary = False
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        if (
+            self.replica_bind is not None
+            and self.info.get(USE_REPLICA)
+            and not self._pinned_to_primary
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            return self.replica_bind
+        self._pinned_to_primary = True
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
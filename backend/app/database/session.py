@@ -1,22 +1,94 @@
-from sqlalchemy import create_engine, select
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
-from app.schemas.user import User, UserCreate
+from app.models.user import User
+from app.schemas.user import UserCreate
 from app.crud.user import crud_user
+from app.database.instrumentation import instrument_engine
+from app.database.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+from app.database.routing import RoutingSession
 
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _connect_args() -> dict:
+    # 서버 측 statement_timeout 설정 (0이면 비활성화)
+    if settings.POSTGRES_STATEMENT_TIMEOUT_MS > 0:
+        return {"options": f"-c statement_timeout={settings.POSTGRES_STATEMENT_TIMEOUT_MS}"}
+    return {}
+
+
+def _engine_options() -> dict:
+    return {
+        "pool_size": settings.POSTGRES_POOL_SIZE,
+        "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+        "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+        "pool_pre_ping": settings.POSTGRES_POOL_PRE_PING,
+        "connect_args": _connect_args(),
+    }
+
+
+# 워커(프로세스)마다 하나의 엔진/풀, 하나의 세션 팩토리를 공유
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedQueuePool,
+    **_engine_options(),
+)
+
+# 비동기 엔진 (psycopg3 async). 동일한 풀 설정을 사용하며 async 라우터 전용
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    **_engine_options(),
+)
+
+# 읽기 전용 replica 엔진 (POSTGRES_REPLICA_SERVER 미설정 시 None → 모든 쿼리가 primary)
+replica_engine: Engine | None = None
+async_replica_engine: AsyncEngine | None = None
+if settings.SQLALCHEMY_REPLICA_DATABASE_URI is not None:
+    replica_engine = create_engine(
+        str(settings.SQLALCHEMY_REPLICA_DATABASE_URI),
+        poolclass=InstrumentedQueuePool,
+        **_engine_options(),
+    )
+    async_replica_engine = create_async_engine(
+        str(settings.SQLALCHEMY_REPLICA_DATABASE_URI),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **_engine_options(),
+    )
+
+# 요청별 쿼리 수/DB 시간 집계 (app.api.middleware.RequestMetricsMiddleware)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+if replica_engine is not None and async_replica_engine is not None:
+    instrument_engine(replica_engine)
+    instrument_engine(async_replica_engine.sync_engine)
+
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=RoutingSession,
+    replica_bind=replica_engine,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_bind=async_replica_engine.sync_engine if async_replica_engine is not None else None,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 def init_db(db: Session) -> None:
 
-    user = db.exec(
+    user = db.execute(
         select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
+    ).scalars().first()
     if not user:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
             password=settings.FIRST_SUPERUSER_PASSWORD,
             is_superuser=True,
         )
-        user = crud_user.create_user(session=db, user_create=user_in)
+        user = crud_user.create_user(db=db, obj_in=user_in)
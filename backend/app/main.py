@@ -1,10 +1,23 @@
-import sentry_sdk
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.api.middleware import RequestMetricsMiddleware, track_in_flight
+from app.api.routes import metrics
 from app.core.config import settings
+from app.core.hashing import PasswordHasherBusy
+from app.core.mail import MailQueueFull
+from app.core.metrics import instrument_password_hasher, instrument_pool, mark_process_dead
+from app.core.rate_limit import RateLimited
+from app.core.security import password_hasher
+from app.database.session import async_engine, async_replica_engine, engine, replica_engine
+from app.utils.email_templates import email_templates
+from app.utils.utils import mail_queue, mail_transport
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -12,14 +25,66 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
+    import sentry_sdk  # imported only when configured: it dominates cold-start import time
+
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    password_hasher.start()
+    instrument_password_hasher(password_hasher)
+    instrument_pool(engine, "primary")
+    instrument_pool(async_engine.sync_engine, "primary_async")
+    if replica_engine is not None and async_replica_engine is not None:
+        instrument_pool(replica_engine, "replica")
+        instrument_pool(async_replica_engine.sync_engine, "replica_async")
+    if settings.emails_enabled:
+        # workers that cannot send mail never import jinja2
+        email_templates.preload()
+        mail_queue.start()
+    yield
+    # drain queued mail before tearing down; undelivered mail is dead-lettered
+    mail_queue.stop()
+    await mail_transport.close()
+    password_hasher.shutdown()
+    mark_process_dead()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
+    dependencies=[Depends(track_in_flight)],
 )
 
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(RateLimited)
+async def rate_limited_handler(request: Request, exc: RateLimited) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many requests, please retry later"},
+        headers={"Retry-After": exc.retry_after_header},
+    )
+
+
+@app.exception_handler(MailQueueFull)
+async def mail_queue_full_handler(request: Request, exc: MailQueueFull) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Mail queue is full, please retry shortly"},
+        headers={"Retry-After": "5"},
+    )
+
 print("SuperUser :", settings.FIRST_SUPERUSER)
 
 # Set all CORS enabled origins
@@ -32,4 +97,8 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+# outermost: measures the whole request, including other middleware
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(metrics.router, tags=["Metrics"])
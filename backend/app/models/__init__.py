@@ -3,8 +3,12 @@
 from .user import User
 from .item import Item
 from .profile import Profile, Role
+from .email import EmailDeadLetter
+from .token import RefreshToken
 
 __all__ = ["User", 
-           "Profile", "Role", "Item"
+           "Profile", "Role", "Item",
+           "EmailDeadLetter",
+           "RefreshToken",
            ]
 
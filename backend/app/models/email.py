@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from .base import Base, TimestampMixin
+import uuid
+
+
+# -----------------------------------------------------------------------------
+# 재시도 한도를 넘긴 발송 실패 메일 (dead-letter)
+# -----------------------------------------------------------------------------
+class EmailDeadLetter(Base, TimestampMixin):
+    __tablename__ = 'email_dead_letters'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    email_to = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html_content = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
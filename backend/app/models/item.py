@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, DateTime, String, ForeignKey,func
+from sqlalchemy import Column, DateTime, String, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
@@ -13,3 +13,8 @@ class Item(Base, TimestampMixin):
     owner_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
 
     owner = relationship("User", back_populates="items")
+
+    # owner_id 필터 + (created_at, id) keyset 정렬을 인덱스만으로 처리
+    __table_args__ = (
+        Index("ix_items_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, func, Table
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index, func, Table
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
@@ -8,6 +8,7 @@ from datetime import datetime
 # 다대다(M:N) 관계: Profile <-> Role
 #   1) ondelete='CASCADE': DB 레벨에서 Profile/Role 삭제 시 association row 삭제
 #   2) primary_key=True : 두 컬럼 모두 PK로 설정 (1 Profile : 여러 Role 매핑 시 중복 방지)
+#   3) PK (profile_user_id, role_id)는 role_id 단독 조회/조인에 쓰이지 않으므로 별도 인덱스
 # -----------------------------------------------------------------------------
 profile_roles_association = Table(
     'profile_roles',
@@ -23,7 +24,8 @@ profile_roles_association = Table(
         Integer,
         ForeignKey('roles.id', ondelete='CASCADE'),
         primary_key=True
-    )
+    ),
+    Index('ix_profile_roles_role_id', 'role_id'),
 )
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from .base import Base, TimestampMixin
+import uuid
+
+
+# -----------------------------------------------------------------------------
+# Refresh token (원문은 저장하지 않고 SHA-256 해시만 저장)
+#   - 사용할 때마다 폐기(revoked_at)되고 같은 family_id로 새 토큰이 발급됨 (rotation)
+#   - 이미 폐기된 토큰이 다시 사용되면 탈취로 보고 family 전체를 폐기
+# -----------------------------------------------------------------------------
+class RefreshToken(Base, TimestampMixin):
+    __tablename__ = 'refresh_tokens'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True,
+    )
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
@@ -1,5 +1,5 @@
 # models/user.py
-from sqlalchemy import Column, String, Boolean, DateTime, func
+from sqlalchemy import Column, String, Boolean, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -32,3 +32,10 @@ class User(Base, TimestampMixin):
         cascade="all, delete-orphan",
         passive_deletes=True
     )
+
+    __table_args__ = (
+        # 대소문자 구분 없는 이메일 조회/중복 확인 (lower(email) = lower(:email))
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        # 사용자 목록 (created_at, id) keyset 정렬
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+# ---------------------------------------
+# Email Dead-letter Schema
+# ---------------------------------------
+class EmailDeadLetterCreate(BaseModel):
+    email_to: str
+    subject: str
+    html_content: str
+    attempts: int
+    last_error: str | None = None
+
+
+class EmailDeadLetterUpdate(BaseModel):
+    attempts: int | None = None
+    last_error: str | None = None
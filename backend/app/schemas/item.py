@@ -3,9 +3,11 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from uuid import UUID
 
+from app.schemas.token import BatchRowError
+
 class ItemBase(BaseModel):  
     title: str
-    description: str | None
+    description: str | None = None
 
 class ItemCreate(ItemBase):  # 항목 생성시 시 클라이언트로 부터 받을 데이터 속성
     pass
@@ -25,4 +27,9 @@ class ItemPublic(ItemBase): #  API를 통해 반환할 속성, ID는 항상 필
 class ItemsPublic(BaseModel):   ## User 모델과 1:N 관계
     data: list[ItemPublic]
     count: int
+    next_cursor: str | None = None  # keyset 페이지네이션용 다음 페이지 커서
 
+class ItemsBatchResult(BaseModel):  # POST /items/batch 응답: 생성된 항목 + 행별 오류
+    data: list[ItemPublic]
+    count: int
+    errors: list[BatchRowError] = []
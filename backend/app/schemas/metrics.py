@@ -0,0 +1,60 @@
+from pydantic import BaseModel
+
+
+# ---------------------------------------
+# DB Connection Pool 상태 (워커 단위)
+# ---------------------------------------
+class PoolStatus(BaseModel):
+    name: str
+    pid: int
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    wait_seconds_avg: float
+
+
+class PoolsStatus(BaseModel):
+    data: list[PoolStatus]
+    count: int
+
+
+# ---------------------------------------
+# Password Hashing 프로세스 풀 상태 (워커 단위)
+# ---------------------------------------
+class PasswordHasherStatus(BaseModel):
+    workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    latency_seconds_total: float
+    latency_seconds_max: float
+    latency_seconds_avg: float
+
+
+# ---------------------------------------
+# 메일 발송 대기열 상태 (워커 단위)
+# ---------------------------------------
+class MailQueueStatus(BaseModel):
+    workers: int
+    queued: int
+    retrying: int
+    sent: int
+    failed: int
+    dead_lettered: int
+
+
+# ---------------------------------------
+# 프로세스 내 캐시 상태 (워커 단위)
+# ---------------------------------------
+class CacheStatus(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
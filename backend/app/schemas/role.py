@@ -29,4 +29,5 @@ class RolePublic(RoleBase):
 
 class RolesPublic(BaseModel):
     data: list[RolePublic]  # Role ID
-    count: int
\ No newline at end of file
+    count: int
+    next_cursor: str | None = None  # keyset 페이지네이션용 다음 페이지 커서
\ No newline at end of file
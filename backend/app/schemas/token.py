@@ -1,13 +1,38 @@
+from datetime import datetime
+from uuid import UUID
+
 from pydantic import BaseModel, Field
 
 # Generic message
 class Message(BaseModel):
     message: str
 
+# Per-row error reported by batch endpoints
+class BatchRowError(BaseModel):
+    index: int  # 요청 배열에서의 위치
+    detail: str
+
 # JSON payload containing access token
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None  # rotating; exchange at POST /login/refresh
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(min_length=1, max_length=256)
+
+
+# Stored refresh token rows (only the hash of the token is persisted)
+class RefreshTokenCreate(BaseModel):
+    user_id: UUID
+    family_id: UUID
+    token_hash: str
+    expires_at: datetime
+
+
+class RefreshTokenUpdate(BaseModel):
+    revoked_at: datetime | None = None
 
 
 # Contents of JWT token
@@ -4,6 +4,7 @@ from uuid import UUID
 from datetime import datetime
 from app.schemas.item import ItemPublic
 from app.schemas.profile import ProfilePublic
+from app.schemas.token import BatchRowError
 
 class UserBase(BaseModel):
     """
@@ -107,3 +108,13 @@ class UsersPublic(BaseModel):
     """
     data: list[UserPublic]
     count: int
+    next_cursor: str | None = None  # keyset 페이지네이션용 다음 페이지 커서
+
+
+class UsersBatchResult(BaseModel):
+    """
+    POST /users/batch 응답: 생성된 사용자 + 행별 오류
+    """
+    data: list[UserPublic]
+    count: int
+    errors: list[BatchRowError] = []
@@ -1,9 +1,11 @@
 import uuid
 
 from fastapi.testclient import TestClient
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.models.item import Item
 from app.tests.utils.item import create_random_item
 
 
@@ -19,11 +21,29 @@ def test_create_item(
     assert response.status_code == 200
     content = response.json()
     assert content["title"] == data["title"]
-    assert content["description"] == data["description"]
+    # items 테이블에 description 컬럼이 없으므로 저장되지 않음
+    assert content["description"] is None
     assert "id" in content
     assert "owner_id" in content
 
 
+def test_create_item_persists_row(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        json={"title": "Persisted", "description": "not a column"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    item = db.get(Item, uuid.UUID(content["id"]))
+    assert item is not None
+    assert item.title == "Persisted"
+    assert content["owner_id"] == str(item.owner_id)
+    assert content["created_at"] is not None
+
+
 def test_read_item(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -162,3 +182,127 @@ def test_delete_item_not_enough_permissions(
     assert response.status_code == 400
     content = response.json()
     assert content["detail"] == "Not enough permissions"
+
+
+def test_read_items_keyset_pagination(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    created: set[str] = set()
+    for i in range(3):
+        r = client.post(
+            f"{settings.API_V1_STR}/items/",
+            headers=superuser_token_headers,
+            json={"title": f"Keyset {i}", "description": None},
+        )
+        assert r.status_code == 200
+        created.add(r.json()["id"])
+    owner_id = r.json()["owner_id"]
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params: dict[str, str | int] = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            f"{settings.API_V1_STR}/items/",
+            headers=superuser_token_headers,
+            params=params,
+        )
+        assert response.status_code == 200
+        content = response.json()
+        assert len(content["data"]) <= 2
+        seen.extend(item["id"] for item in content["data"])
+        cursor = content["next_cursor"]
+        if not cursor:
+            break
+
+    # next_cursor로 이어 붙인 페이지가 소유자의 모든 항목을 정확히 한 번씩 포함
+    owned = {str(id) for id in db.scalars(select(Item.id).where(Item.owner_id == uuid.UUID(owner_id)))}
+    assert created <= owned
+    assert len(seen) == len(set(seen))
+    assert set(seen) == owned
+
+
+def test_read_items_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_read_items_count_is_total(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    for i in range(2):
+        r = client.post(
+            f"{settings.API_V1_STR}/items/",
+            headers=superuser_token_headers,
+            json={"title": f"Count {i}", "description": None},
+        )
+        assert r.status_code == 200
+    owner_id = uuid.UUID(r.json()["owner_id"])
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        params={"limit": 1},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content["data"]) == 1
+    total = content["count"]
+    assert total >= 2
+    assert total == db.scalar(select(func.count()).select_from(Item).where(Item.owner_id == owner_id))
+
+    # 삭제 시 owner별 count 캐시가 즉시 갱신됨 (같은 워커 기준)
+    r = client.delete(
+        f"{settings.API_V1_STR}/items/{content['data'][0]['id']}",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 200
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        params={"limit": 1},
+    )
+    assert response.json()["count"] == total - 1
+
+
+def test_create_items_batch(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    rows = [
+        {"title": "Batch 1"},
+        {"description": "missing title"},
+        {"title": "Batch 2", "description": "second"},
+    ]
+    response = client.post(
+        f"{settings.API_V1_STR}/items/batch",
+        headers=superuser_token_headers,
+        json=rows,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] == 2
+    assert [item["title"] for item in content["data"]] == ["Batch 1", "Batch 2"]
+    assert [error["index"] for error in content["errors"]] == [1]
+    assert content["errors"][0]["detail"].startswith("title:")
+    # 쓰기 응답은 read-your-writes 표식을 클라이언트에 돌려줌
+    assert response.headers["X-Last-Write"]
+    assert "last_write" in response.cookies
+
+
+def test_create_items_batch_too_large(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/items/batch",
+        headers=superuser_token_headers,
+        json=[{"title": "x"}] * (settings.BATCH_MAX_ROWS + 1),
+    )
+    assert response.status_code == 413
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
@@ -5,8 +6,13 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.core.config import settings
-from app.core.security import verify_password
+from app.core.rate_limit import LoginRateLimiter, MemoryRateLimitStore, RateLimit
+from app.core.security import password_hasher, verify_password
+from app.crud.user import crud_user
+from app.models.token import RefreshToken
 from app.models.user import User
+from app.schemas.user import UserCreate
+from app.tests.utils.utils import random_email, random_lower_string
 from app.utils.utils import generate_password_reset_token
 
 
@@ -32,6 +38,20 @@ def test_get_access_token_incorrect_password(client: TestClient) -> None:
     assert r.status_code == 400
 
 
+def test_get_access_token_hasher_busy(client: TestClient) -> None:
+    # 해싱 대기열이 가득 찬 상태: 로그인은 대기하지 않고 503 + Retry-After
+    full = threading.BoundedSemaphore(1)
+    full.acquire()
+    login_data = {
+        "username": settings.FIRST_SUPERUSER,
+        "password": settings.FIRST_SUPERUSER_PASSWORD,
+    }
+    with patch.object(password_hasher, "_slots", full):
+        r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == "1"
+
+
 def test_use_access_token(
     client: TestClient, superuser_token_headers: dict[str, str]
 ) -> None:
@@ -104,3 +124,144 @@ def test_reset_password_invalid_token(
     assert "detail" in response
     assert r.status_code == 400
     assert response["detail"] == "Invalid token"
+
+
+def test_login_is_throttled_before_authentication(client: TestClient) -> None:
+    limiter = LoginRateLimiter(
+        MemoryRateLimitStore(max_keys=100),
+        per_email=RateLimit(capacity=2, period_seconds=60),
+        per_ip=RateLimit(capacity=100, period_seconds=60),
+    )
+    login_data = {"username": "throttled@example.com", "password": "incorrect"}
+    with (
+        patch("app.api.routes.login.login_rate_limiter", limiter),
+        patch("app.api.routes.login.crud_user.authenticate", return_value=None) as authenticate,
+    ):
+        for _ in range(2):
+            r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+            assert r.status_code == 400
+        r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+    assert authenticate.call_count == 2
+
+
+def test_successful_login_resets_email_bucket(client: TestClient) -> None:
+    limiter = LoginRateLimiter(
+        MemoryRateLimitStore(max_keys=100),
+        per_email=RateLimit(capacity=2, period_seconds=60),
+        per_ip=RateLimit(capacity=100, period_seconds=60),
+    )
+    wrong = {"username": settings.FIRST_SUPERUSER, "password": "incorrect"}
+    right = {"username": settings.FIRST_SUPERUSER, "password": settings.FIRST_SUPERUSER_PASSWORD}
+    with patch("app.api.routes.login.login_rate_limiter", limiter):
+        r = client.post(f"{settings.API_V1_STR}/login/access-token", data=wrong)
+        assert r.status_code == 400
+        r = client.post(f"{settings.API_V1_STR}/login/access-token", data=right)
+        assert r.status_code == 200
+        # 성공한 로그인이 이메일 bucket을 비웠으므로 다시 capacity만큼 시도 가능
+        for _ in range(2):
+            r = client.post(f"{settings.API_V1_STR}/login/access-token", data=wrong)
+            assert r.status_code == 400
+        r = client.post(f"{settings.API_V1_STR}/login/access-token", data=wrong)
+    assert r.status_code == 429
+
+
+def _login_superuser(client: TestClient) -> dict[str, str]:
+    login_data = {
+        "username": settings.FIRST_SUPERUSER,
+        "password": settings.FIRST_SUPERUSER_PASSWORD,
+    }
+    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+    assert r.status_code == 200
+    return r.json()
+
+
+def test_refresh_token_rotates(client: TestClient) -> None:
+    tokens = _login_superuser(client)
+    assert tokens["refresh_token"]
+
+    with patch("app.core.security.verify_password") as verify:
+        r = client.post(
+            f"{settings.API_V1_STR}/login/refresh",
+            json={"refresh_token": tokens["refresh_token"]},
+        )
+        verify.assert_not_called()
+    assert r.status_code == 200
+    rotated = r.json()
+    assert rotated["access_token"]
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/users/me",
+        headers={"Authorization": f"Bearer {rotated['access_token']}"},
+    )
+    assert r.status_code == 200
+    assert r.json()["email"] == settings.FIRST_SUPERUSER
+
+
+def test_refresh_token_reuse_revokes_family(client: TestClient) -> None:
+    tokens = _login_superuser(client)
+    r = client.post(
+        f"{settings.API_V1_STR}/login/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert r.status_code == 200
+    rotated = r.json()
+
+    # replaying the already-used token fails and revokes the token issued from it
+    r = client.post(
+        f"{settings.API_V1_STR}/login/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert r.status_code == 401
+    r = client.post(
+        f"{settings.API_V1_STR}/login/refresh",
+        json={"refresh_token": rotated["refresh_token"]},
+    )
+    assert r.status_code == 401
+
+
+def test_logout_revokes_refresh_token(client: TestClient) -> None:
+    tokens = _login_superuser(client)
+    r = client.post(
+        f"{settings.API_V1_STR}/login/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert r.status_code == 200
+    r = client.post(
+        f"{settings.API_V1_STR}/login/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert r.status_code == 401
+
+
+def test_refresh_token_invalid(client: TestClient) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/login/refresh",
+        json={"refresh_token": "not-a-token"},
+    )
+    assert r.status_code == 401
+
+
+def test_refresh_token_of_inactive_user_is_rejected(client: TestClient, db: Session) -> None:
+    email = random_email()
+    password = random_lower_string()
+    user = crud_user.create_user(db=db, obj_in=UserCreate(email=email, password=password))
+    r = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": email, "password": password},
+    )
+    refresh_token = r.json()["refresh_token"]
+
+    user.is_active = False
+    db.commit()
+    r = client.post(
+        f"{settings.API_V1_STR}/login/refresh",
+        json={"refresh_token": refresh_token},
+    )
+    assert r.status_code == 401
+    tokens = db.scalars(select(RefreshToken).where(RefreshToken.user_id == user.id)).all()
+    assert len(tokens) == 1
+    assert tokens[0].revoked_at is None
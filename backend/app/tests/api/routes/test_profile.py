@@ -0,0 +1,73 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.user import crud_user
+from app.schemas.user import UserCreate
+from app.tests.utils.utils import random_email, random_lower_string
+
+
+def test_read_profile_etag_not_modified(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    user = crud_user.create_with_profile(
+        db=db, obj_in=UserCreate(email=random_email(), password=random_lower_string())
+    )
+    url = f"{settings.API_V1_STR}/profile/{user.id}"
+
+    r = client.get(url, headers=superuser_token_headers)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    assert r.json()["user_id"] == str(user.id)
+
+    r = client.get(url, headers={**superuser_token_headers, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+
+
+def test_update_profile_invalidates_cached_profile(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    user = crud_user.create_with_profile(
+        db=db, obj_in=UserCreate(email=random_email(), password=random_lower_string())
+    )
+    url = f"{settings.API_V1_STR}/profile/{user.id}"
+    etag = client.get(url, headers=superuser_token_headers).headers["etag"]
+
+    r = client.patch(url, headers=superuser_token_headers, json={"bio": "updated"})
+    assert r.status_code == 200
+
+    r = client.get(url, headers={**superuser_token_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["bio"] == "updated"
+    assert r.headers["etag"] != etag
+
+
+def test_update_role_invalidates_cached_roles(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/profile/roles",
+        headers=superuser_token_headers,
+        json={"name": random_lower_string()},
+    )
+    assert r.status_code == 200
+    url = f"{settings.API_V1_STR}/profile/roles"
+    roles = client.get(url, headers=superuser_token_headers).json()["data"]
+    role_id = next(role["id"] for role in roles if role["name"] == r.json()["name"])
+
+    new_name = random_lower_string()
+    r = client.patch(f"{url}/{role_id}", headers=superuser_token_headers, json={"name": new_name})
+    assert r.status_code == 200
+
+    names = {role["name"] for role in client.get(url, headers=superuser_token_headers).json()["data"]}
+    assert new_name in names
+
+
+def test_cached_routes_document_their_body_schema(client: TestClient) -> None:
+    paths = client.get(f"{settings.API_V1_STR}/openapi.json").json()["paths"]
+    for path, model in (("/profile/{user_id}", "ProfilePublic"), ("/profile/roles", "RolesPublic")):
+        responses = paths[f"{settings.API_V1_STR}{path}"]["get"]["responses"]
+        schema = responses["200"]["content"]["application/json"]["schema"]
+        assert schema["$ref"].endswith(f"/{model}")
+        assert "304" in responses
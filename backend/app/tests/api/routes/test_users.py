@@ -1,3 +1,4 @@
+import json
 import uuid
 from unittest.mock import patch
 
@@ -6,10 +7,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.crud import item
+from app.crud.user import crud_user
 from app.core.config import settings
 from app.core.security import verify_password
 from app.models.user import User
 from app.schemas.user import UserCreate
+from app.tests.utils.user import user_authentication_headers
 from app.tests.utils.utils import random_email, random_lower_string
 
 
@@ -62,6 +65,22 @@ def test_create_user_new_email(
         assert user.email == created_user["email"]
 
 
+def test_create_superuser_by_admin(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    email = random_email()
+    r = client.post(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        json={"email": email, "password": random_lower_string(), "is_superuser": True},
+    )
+    assert r.status_code == 200
+    assert r.json()["is_superuser"] is True
+    user = db.scalars(select(User).where(User.email == email)).one()
+    assert user.is_superuser is True
+    assert user.is_active is True
+
+
 def test_get_existing_user(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -490,3 +509,107 @@ def test_delete_user_without_privileges(
     )
     assert r.status_code == 403
     assert r.json()["detail"] == "The user doesn't have enough privileges"
+
+
+def test_deactivated_user_token_rejected_immediately(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    username = random_email()
+    password = random_lower_string()
+    user_in = UserCreate(email=username, password=password)
+    user = crud_user.create_user(db=db, obj_in=user_in)
+    headers = user_authentication_headers(
+        client=client, email=username, password=password
+    )
+
+    # 첫 요청에서 user-state 캐시가 채워짐
+    r = client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+    assert r.status_code == 200
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/{user.id}",
+        headers=superuser_token_headers,
+        json={"is_active": False},
+    )
+    assert r.status_code == 200
+
+    # update_user 가 캐시를 무효화하므로 TTL을 기다리지 않고 바로 거부됨
+    r = client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Inactive user"
+
+
+def test_create_users_batch(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    new_email = random_email()
+    rows = [
+        {"email": new_email, "password": random_lower_string(), "full_name": "Batch"},
+        {"email": "not-an-email", "password": random_lower_string()},
+        {"email": settings.FIRST_SUPERUSER, "password": random_lower_string()},
+        {"email": new_email, "password": random_lower_string()},
+    ]
+    r = client.post(
+        f"{settings.API_V1_STR}/users/batch",
+        headers=superuser_token_headers,
+        json=rows,
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert content["count"] == 1
+    assert content["data"][0]["email"] == new_email
+    assert [error["index"] for error in content["errors"]] == [1, 2, 3]
+    assert content["errors"][1]["detail"] == "Email already exists"
+
+
+def test_create_users_batch_too_large(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    # 사용자 batch는 행마다 비밀번호 해싱 비용이 들어 BATCH_MAX_ROWS보다 낮게 제한됨
+    assert settings.USER_BATCH_MAX_ROWS < settings.BATCH_MAX_ROWS
+    r = client.post(
+        f"{settings.API_V1_STR}/users/batch",
+        headers=superuser_token_headers,
+        json=[{"email": random_email(), "password": random_lower_string()}]
+        * (settings.USER_BATCH_MAX_ROWS + 1),
+    )
+    assert r.status_code == 413
+
+
+def test_create_users_batch_by_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/users/batch",
+        headers=normal_user_token_headers,
+        json=[{"email": random_email(), "password": random_lower_string()}],
+    )
+    assert r.status_code == 403
+
+
+def test_export_users_ndjson(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/users/export",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert settings.FIRST_SUPERUSER in {line["email"] for line in lines}
+    assert "hashed_password" not in lines[0]
+
+
+def test_export_users_csv(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/users/export",
+        headers=superuser_token_headers,
+        params={"format": "csv"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    header = r.text.splitlines()[0]
+    assert header == "id,email,full_name,is_active,is_superuser,created_at,updated_at"
@@ -0,0 +1,98 @@
+import socket
+from collections.abc import Iterator
+
+import pytest
+from aiosmtpd.controller import Controller
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.tests.core.test_mail_queue import RecordingHandler
+
+
+def test_db_pool_status(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    pools = {pool["name"]: pool for pool in content["data"]}
+    assert set(pools) == {"sync", "async"}
+    assert pools["sync"]["size"] == settings.POSTGRES_POOL_SIZE
+    assert pools["sync"]["max_overflow"] == settings.POSTGRES_MAX_OVERFLOW
+    assert pools["sync"]["checkouts"] >= 1
+
+
+def test_db_pool_status_not_enough_permissions(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/",
+        headers=normal_user_token_headers,
+    )
+    assert response.status_code == 403
+
+
+def test_password_hasher_status(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/password-hasher/",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["workers"] == settings.PASSWORD_HASH_WORKERS
+    assert content["max_pending"] == settings.PASSWORD_HASH_MAX_PENDING
+    # superuser login은 최소 한 번의 bcrypt 검증을 거침
+    assert content["completed"] >= 1
+
+
+@pytest.fixture
+def handler() -> Iterator[RecordingHandler]:
+    handler = RecordingHandler(reject={"bounce@example.com"})
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    handler.port = port  # type: ignore[attr-defined]
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture
+def smtp_settings(handler: RecordingHandler, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", handler.port)  # type: ignore[attr-defined]
+    monkeypatch.setattr(settings, "SMTP_TLS", False)
+    monkeypatch.setattr(settings, "SMTP_SSL", False)
+    monkeypatch.setattr(settings, "SMTP_USER", None)
+    monkeypatch.setattr(settings, "EMAILS_FROM_EMAIL", "noreply@example.com")
+
+
+@pytest.mark.usefixtures("smtp_settings")
+def test_test_email_is_sent_over_async_transport(
+    client: TestClient, superuser_token_headers: dict[str, str], handler: RecordingHandler
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/utils/test-email/",
+        headers=superuser_token_headers,
+        params={"email_to": "someone@example.com"},
+    )
+    assert response.status_code == 201
+    assert handler.received == ["someone@example.com"]
+
+
+@pytest.mark.usefixtures("smtp_settings")
+def test_test_email_reports_smtp_rejection(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/utils/test-email/",
+        headers=superuser_token_headers,
+        params={"email_to": "bounce@example.com"},
+    )
+    assert response.status_code == 502
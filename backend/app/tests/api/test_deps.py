@@ -0,0 +1,73 @@
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException, Request, Response
+
+from app.api import deps
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.user_state import (
+    LAST_WRITE_COOKIE,
+    LAST_WRITE_HEADER,
+    access_token_cache,
+    access_token_digest,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_access_token_cache() -> None:
+    access_token_cache.clear()
+
+
+def test_decode_access_token_is_cached_until_exp() -> None:
+    token = create_access_token("user-1", expires_delta=timedelta(minutes=5))
+    with patch("app.api.deps.jwt.decode", wraps=jwt.decode) as decode:
+        first = deps.decode_access_token(token)
+        second = deps.decode_access_token(token)
+    assert first.sub == second.sub == "user-1"
+    assert decode.call_count == 1
+
+    expires_at, _ = access_token_cache._data[access_token_digest(token)]
+    entry_ttl = expires_at - time.monotonic()
+    assert 0 < entry_ttl <= 5 * 60
+
+
+def test_invalid_tokens_are_not_cached() -> None:
+    expired = create_access_token("user-1", expires_delta=timedelta(seconds=-1))
+    tampered = create_access_token("user-1", expires_delta=timedelta(minutes=5)) + "x"
+    misses = access_token_cache.stats()["misses"]
+    for token in (expired, tampered):
+        with pytest.raises(HTTPException) as exc_info:
+            deps.decode_access_token(token)
+        assert exc_info.value.status_code == 403
+    assert len(access_token_cache) == 0
+    assert access_token_cache.stats()["misses"] == misses + 2
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def test_read_your_writes_marker_travels_with_client() -> None:
+    response = Response()
+    deps.mark_recent_write(response)
+    marker = response.headers[LAST_WRITE_HEADER]
+    assert f"{LAST_WRITE_COOKIE}={marker}" in response.headers["set-cookie"]
+    assert f"Max-Age={settings.READ_YOUR_WRITES_SECONDS}" in response.headers["set-cookie"]
+
+    # any worker sees the same window: the state is in the request, not in process memory
+    assert deps.read_your_writes(_request({"cookie": f"{LAST_WRITE_COOKIE}={marker}"}))
+    assert deps.read_your_writes(_request({LAST_WRITE_HEADER: marker}))
+    assert not deps.read_your_writes(_request({}))
+    assert not deps.read_your_writes(_request({LAST_WRITE_HEADER: "garbage"}))
+
+    expired = str(int(marker) - settings.READ_YOUR_WRITES_SECONDS * 1000)
+    future = str(int(marker) + 3600 * 1000)
+    assert not deps.read_your_writes(_request({LAST_WRITE_HEADER: expired}))
+    assert not deps.read_your_writes(_request({LAST_WRITE_HEADER: future}))
@@ -0,0 +1,82 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.core.user_state import user_state_cache
+from app.crud.count import item_count_cache
+from app.crud.item import crud_item
+from app.crud.profile import crud_role
+from app.crud.user import crud_user
+from app.schemas.item import ItemCreate
+from app.schemas.profile import ProfileCreate
+from app.schemas.role import RoleCreate
+from app.schemas.user import UserCreate
+from app.tests.utils.query_budget import assert_max_queries
+from app.tests.utils.user import user_authentication_headers
+from app.tests.utils.utils import random_email, random_lower_string
+
+
+@pytest.fixture(scope="module")
+def seeded_user(client: TestClient, db: Session) -> tuple[str, dict[str, str]]:
+    """
+    roles 2개가 연결된 프로필과 item 20개를 가진 사용자
+    """
+    email = random_email()
+    password = random_lower_string()
+    roles = [crud_role.create(db=db, obj_in=RoleCreate(name=random_lower_string())) for _ in range(2)]
+    user = crud_user.create_with_profile(
+        db=db,
+        obj_in=UserCreate(email=email, password=password),
+        # user_id는 무시되고 생성된 사용자 id가 사용됨
+        profile_in=ProfileCreate(user_id=uuid.uuid4(), role_ids=[role.id for role in roles]),
+    )
+    crud_item.create_many(db=db, objs_in=[ItemCreate(title=f"item {i}", description=None) for i in range(20)], owner_id=user.id)
+    return str(user.id), user_authentication_headers(client=client, email=email, password=password)
+
+
+# (path template, budget): 캐시가 모두 비어 있는 최악의 경우 기준
+# principal 조회 1 + 엔드포인트 자체 쿼리
+BUDGETS = [
+    ("/users/me", 2),
+    ("/users/{user_id}", 2),
+    ("/items/", 3),
+    ("/profile/{user_id}", 3),
+]
+
+
+@pytest.mark.parametrize("path,budget", BUDGETS)
+def test_endpoint_query_budget(
+    client: TestClient, seeded_user: tuple[str, dict[str, str]], path: str, budget: int
+) -> None:
+    user_id, headers = seeded_user
+    url = f"{settings.API_V1_STR}{path.format(user_id=user_id)}"
+    client.get(url, headers=headers)  # warm-up (커넥션/dialect 초기화 쿼리 제외)
+
+    user_state_cache.clear()
+    item_count_cache.clear()
+    response_cache.delete_prefix("")
+    with assert_max_queries(budget):
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("path,budget", [("/users/", 4), ("/profile/roles", 3)])
+def test_superuser_list_query_budget(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    seeded_user: tuple[str, dict[str, str]],
+    path: str,
+    budget: int,
+) -> None:
+    url = f"{settings.API_V1_STR}{path}"
+    client.get(url, headers=superuser_token_headers)
+
+    user_state_cache.clear()
+    response_cache.delete_prefix("")
+    with assert_max_queries(budget):
+        response = client.get(url, headers=superuser_token_headers)
+    assert response.status_code == 200
@@ -0,0 +1,145 @@
+"""
+CRUD 레이어 microbenchmark (pytest-benchmark).
+
+기본 테스트 실행에서는 제외되며 다음과 같이 실행:
+
+    RUN_BENCHMARKS=1 bash scripts/test.sh
+    BENCHMARK_USERS=50000 python -m pytest -m microbenchmark app/tests/benchmarks
+
+각 연산은 요청 하나처럼 새 세션에서 실행하며, 연산당 SQL 문 수(round-trip)를
+benchmark 결과의 extra_info["queries"]에 기록한다.
+"""
+
+import itertools
+import os
+import random
+import uuid
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import select
+
+from app.benchmarks.load.seed import DEFAULT_PASSWORD, EMAIL_PREFIX, ROLE_PREFIX, reset, seed, seeded_email
+from app.crud.base import CRUDBase
+from app.crud.item import crud_item
+from app.crud.profile import crud_profile, crud_role
+from app.crud.user import crud_user
+from app.database.session import SessionLocal, engine
+from app.models.item import Item
+from app.models.profile import Role
+from app.models.user import User
+from app.schemas.profile import ProfileUpdate
+from app.schemas.role import RoleCreate, RoleUpdate
+from app.tests.utils.query_budget import count_queries
+
+pytestmark = pytest.mark.microbenchmark
+
+USERS = int(os.environ.get("BENCHMARK_USERS", "10000"))
+ITEMS_PER_USER = int(os.environ.get("BENCHMARK_ITEMS_PER_USER", "10"))
+ROLES = int(os.environ.get("BENCHMARK_ROLES", "100"))
+
+crud_role_base = CRUDBase[Role, RoleCreate, RoleUpdate](Role)
+
+
+@pytest.fixture(scope="module")
+def dataset() -> Generator[dict[str, Any], None, None]:
+    """
+    설정된 크기로 users / profiles / roles / items 를 적재 (모듈 종료 시 삭제)
+    """
+    with engine.begin() as conn:
+        seed(conn, users=USERS, items_per_user=ITEMS_PER_USER, roles=ROLES)
+    with SessionLocal() as db:
+        user_ids = list(db.scalars(select(User.id).where(User.email.like(f"{EMAIL_PREFIX}%"))))
+        item_ids = list(db.scalars(select(Item.id).where(Item.owner_id.in_(user_ids[:1000]))))
+        role_ids = list(db.scalars(select(Role.id).where(Role.name.like(f"{ROLE_PREFIX}%"))))
+    yield {"user_ids": user_ids, "item_ids": item_ids, "role_ids": role_ids}
+    with engine.begin() as conn:
+        reset(conn)
+
+
+def _per_session(operation: Callable[..., Any]) -> Callable[..., Any]:
+    def run(*args: Any) -> Any:
+        with SessionLocal() as db:
+            return operation(db, *args)
+    return run
+
+
+def _record_queries(benchmark: BenchmarkFixture, run: Callable[..., Any], *args: Any) -> None:
+    with count_queries() as counter:
+        run(*args)
+    benchmark.extra_info["queries"] = counter.count
+    benchmark.extra_info["users"] = USERS
+    benchmark.extra_info["items"] = USERS * ITEMS_PER_USER
+
+
+def test_base_get(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    ids = itertools.cycle(dataset["item_ids"])
+    run = _per_session(lambda db: crud_item.get(db, next(ids)))
+    _record_queries(benchmark, run)
+    assert benchmark(run) is not None
+
+
+def test_base_get_multi(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    rng = random.Random(0)
+    total = USERS * ITEMS_PER_USER
+    run = _per_session(lambda db: crud_item.get_multi(db, skip=rng.randrange(max(total - 100, 1)), limit=100))
+    _record_queries(benchmark, run)
+    assert len(benchmark(run)) == 100
+
+
+def test_base_create(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    run = _per_session(lambda db: crud_role_base.create(db, RoleCreate(name=f"{ROLE_PREFIX}{uuid.uuid4().hex}")))
+    _record_queries(benchmark, run)
+    assert benchmark(run).id is not None
+
+
+def test_base_update(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    ids = itertools.cycle(dataset["role_ids"])
+
+    def update(db: Any) -> Role:
+        role = crud_role_base.get(db, next(ids))
+        return crud_role_base.update(db, role, RoleUpdate(name=f"{ROLE_PREFIX}{uuid.uuid4().hex}"))
+
+    run = _per_session(update)
+    _record_queries(benchmark, run)
+    benchmark(run)
+
+
+def test_base_remove(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    create = _per_session(lambda db: crud_role_base.create(db, RoleCreate(name=f"{ROLE_PREFIX}{uuid.uuid4().hex}")).id)
+    run = _per_session(crud_role_base.remove)
+    _record_queries(benchmark, run, create())
+    # 삭제할 Role 생성은 측정에서 제외
+    benchmark.pedantic(run, setup=lambda: ((create(),), {}), rounds=200)
+
+
+def test_user_authenticate(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    emails = itertools.cycle(seeded_email(index) for index in range(USERS))
+    run = _per_session(lambda db: crud_user.authenticate(db=db, email=next(emails), password=DEFAULT_PASSWORD))
+    _record_queries(benchmark, run)
+    # bcrypt가 대부분을 차지하므로 라운드 수를 제한
+    assert benchmark.pedantic(run, rounds=20) is not None
+
+
+def test_profile_update(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    user_ids = itertools.cycle(dataset["user_ids"])
+    role_ids = dataset["role_ids"]
+    rng = random.Random(0)
+
+    def update(db: Any) -> Any:
+        profile = crud_profile.get_by_user_id(db=db, user_id=next(user_ids))
+        obj_in = ProfileUpdate(first_name="bench", role_ids=rng.sample(role_ids, 2))
+        return crud_profile.update_profile(db=db, db_obj=profile, obj_in=obj_in)
+
+    run = _per_session(update)
+    _record_queries(benchmark, run)
+    benchmark(run)
+
+
+def test_role_get_multi_by_ids(benchmark: BenchmarkFixture, dataset: dict[str, Any]) -> None:
+    role_ids = dataset["role_ids"][:10]
+    run = _per_session(lambda db: crud_role.get_multi_by_ids(db=db, ids=role_ids))
+    _record_queries(benchmark, run)
+    assert len(benchmark(run)) == len(role_ids)
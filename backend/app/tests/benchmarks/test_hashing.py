@@ -0,0 +1,24 @@
+import pytest
+
+from app.benchmarks.hashing import measure, parse_policy
+from app.core.security import PasswordPolicy
+
+
+def test_parse_policy() -> None:
+    assert parse_policy("bcrypt:10") == PasswordPolicy(scheme="bcrypt", bcrypt_rounds=10)
+    assert parse_policy("argon2:t=3,m=65536,p=2") == PasswordPolicy(
+        scheme="argon2", argon2_time_cost=3, argon2_memory_cost_kib=65536, argon2_parallelism=2
+    )
+    assert parse_policy("argon2:t=1").argon2_memory_cost_kib == PasswordPolicy().argon2_memory_cost_kib
+    with pytest.raises(ValueError):
+        parse_policy("scrypt:1")
+    with pytest.raises(ValueError):
+        parse_policy("argon2:x=1")
+
+
+def test_measure_reports_throughput() -> None:
+    result = measure(PasswordPolicy(scheme="bcrypt", bcrypt_rounds=4), duration=0, min_hashes=3)
+    assert result.policy == "bcrypt(rounds=4)"
+    assert result.hashes == 3
+    assert result.hashes_per_second > 0
+    assert result.hashes_per_core_second > 0
@@ -0,0 +1,17 @@
+from app.benchmarks.importtime import parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   sqlalchemy.util
+import time:       400 |        500 | sqlalchemy
+import time:        50 |         50 |   app.core.config
+import time:       150 |        700 | app.main
+"""
+
+
+def test_parse_importtime() -> None:
+    profile = parse_importtime(SAMPLE, "app.main")
+    assert profile.total_us == 700
+    assert profile.self_us_by_package == {"sqlalchemy": 500, "app": 200}
+    assert "app.core.config" in profile.modules
+    assert "jinja2" not in profile.modules
@@ -0,0 +1,36 @@
+from app.benchmarks.load.stats import Recorder, compare, percentile
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+def test_recorder_ignores_warmup_and_counts_errors() -> None:
+    recorder = Recorder()
+    recorder.record("users_me", 1.0, 200, ok=True)
+    recorder.recording = True
+    recorder.record("users_me", 0.010, 200, ok=True)
+    recorder.record("users_me", 0.020, 503, ok=False)
+
+    summary = recorder.summary(duration=2.0)
+
+    users_me = summary["endpoints"]["users_me"]
+    assert users_me["requests"] == 2
+    assert users_me["errors"] == 1
+    assert users_me["throughput_rps"] == 1.0
+    assert users_me["status_codes"] == {"200": 1, "503": 1}
+    assert summary["total"]["requests"] == 2
+
+
+def test_compare_flags_p95_regression() -> None:
+    def result(p95: float) -> dict:
+        return {"endpoints": {"users_me": {"p95_ms": p95, "throughput_rps": 100.0}}}
+
+    _, regressed = compare(result(10.0), result(10.5), max_regression=0.10)
+    assert not regressed
+    _, regressed = compare(result(10.0), result(12.0), max_regression=0.10)
+    assert regressed
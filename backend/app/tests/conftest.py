@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.rate_limit import NullRateLimitStore, login_rate_limiter
 from app.database.session import engine, init_db
 from app.main import app
 from app.models.item import Item
@@ -25,6 +26,15 @@ def db() -> Generator[Session, None, None]:
         db.commit()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_login_rate_limit() -> Generator[None, None, None]:
+    # 테스트는 같은 계정/클라이언트로 반복 로그인하므로 제한을 끔 (제한 자체는 test_login에서 검증)
+    store = login_rate_limiter.store
+    login_rate_limiter.store = NullRateLimitStore()
+    yield
+    login_rate_limiter.store = store
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
@@ -0,0 +1,96 @@
+import asyncio
+import socket
+from collections.abc import Iterator
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.core.async_mail import AsyncSMTPTransport
+from app.core.mail import OutboundEmail, build_email_message
+from app.tests.core.test_mail_queue import RecordingHandler
+
+
+class SessionCountingHandler(RecordingHandler):
+    def __init__(self, reject: set[str] | None = None) -> None:
+        super().__init__(reject)
+        self.sessions = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):  # type: ignore[no-untyped-def]
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+
+@pytest.fixture
+def handler() -> Iterator[SessionCountingHandler]:
+    handler = SessionCountingHandler(reject={"bounce@example.com"})
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    handler.port = port  # type: ignore[attr-defined]
+    yield handler
+    controller.stop()
+
+
+def _make_transport(port: int, max_concurrency: int = 2) -> AsyncSMTPTransport:
+    async def connect() -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(hostname="127.0.0.1", port=port, start_tls=False, timeout=5)
+        await smtp.connect()
+        return smtp
+
+    return AsyncSMTPTransport(
+        connect=connect,
+        build_message=lambda mail: build_email_message(mail, from_name="Test", from_email="noreply@example.com"),
+        max_concurrency=max_concurrency,
+    )
+
+
+def _mail(email_to: str) -> OutboundEmail:
+    return OutboundEmail(email_to=email_to, subject="hi", html_content="<p>hi</p>")
+
+
+def test_send_reuses_connections_within_concurrency_limit(handler: SessionCountingHandler) -> None:
+    transport = _make_transport(handler.port, max_concurrency=2)  # type: ignore[attr-defined]
+    recipients = [f"user{i}@example.com" for i in range(10)]
+
+    async def run() -> None:
+        await asyncio.gather(*(transport.send(_mail(email_to)) for email_to in recipients))
+        await transport.send(_mail("again@example.com"))
+        await transport.close()
+
+    asyncio.run(run())
+    assert sorted(handler.received) == sorted(recipients + ["again@example.com"])
+    stats = transport.stats()
+    assert stats["sent"] == 11
+    assert stats["connections_opened"] <= 2
+    assert stats["idle_connections"] == 0
+
+
+def test_send_many_uses_one_session_and_reports_failures(handler: SessionCountingHandler) -> None:
+    transport = _make_transport(handler.port)  # type: ignore[attr-defined]
+    recipients = ["a@example.com", "bounce@example.com", "b@example.com"]
+
+    async def run() -> list[OutboundEmail]:
+        failures = await transport.send_many([_mail(email_to) for email_to in recipients])
+        await transport.close()
+        return failures
+
+    failures = asyncio.run(run())
+    assert sorted(handler.received) == ["a@example.com", "b@example.com"]
+    assert [mail.email_to for mail in failures] == ["bounce@example.com"]
+    assert failures[0].attempts == 1 and failures[0].last_error
+    assert handler.sessions == 1
+
+
+def test_send_many_connection_failure_fails_every_mail() -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    transport = _make_transport(port)
+
+    failures = asyncio.run(transport.send_many([_mail("a@example.com"), _mail("b@example.com")]))
+    assert [mail.email_to for mail in failures] == ["a@example.com", "b@example.com"]
+    assert transport.stats()["failed"] == 2
@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+
+from app.core.hashing import PasswordHasher, PasswordHasherBusy
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def test_run_many_keeps_input_order() -> None:
+    hasher = PasswordHasher(max_workers=0, max_pending=2)
+    assert hasher.run_many(_square, [(i,) for i in range(5)]) == [0, 1, 4, 9, 16]
+    assert hasher.stats()["completed"] == 5
+    assert hasher.stats()["pending"] == 0
+
+
+def test_full_queue_raises_busy() -> None:
+    hasher = PasswordHasher(max_workers=0, max_pending=2)
+    release = threading.Event()
+    started = threading.Barrier(3)
+
+    def hold() -> None:
+        started.wait()
+        release.wait(5)
+
+    # max_workers=0 runs the job on the calling thread, so each thread holds one slot
+    threads = [threading.Thread(target=hasher.run, args=(hold,)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            hasher.run(_square, 3)
+        assert hasher.stats()["pending"] == 2
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+    assert hasher.run(_square, 3) == 9
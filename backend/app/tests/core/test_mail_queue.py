@@ -0,0 +1,113 @@
+import smtplib
+import socket
+import time
+from collections.abc import Iterator
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.handlers import Sink
+
+from app.core.mail import MailQueue, MailQueueFull, OutboundEmail, SMTPConnectionPool, build_email_message
+
+
+class RecordingHandler(Sink):
+    def __init__(self, reject: set[str] | None = None) -> None:
+        self.received: list[str] = []
+        self.reject = reject or set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):  # type: ignore[no-untyped-def]
+        if address in self.reject:
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):  # type: ignore[no-untyped-def]
+        self.received.extend(envelope.rcpt_tos)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def handler() -> Iterator[RecordingHandler]:
+    handler = RecordingHandler(reject={"bounce@example.com"})
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    handler.port = port  # type: ignore[attr-defined]
+    yield handler
+    controller.stop()
+
+
+def _make_queue(port: int, dead: list[OutboundEmail], **kwargs: object) -> MailQueue:
+    options: dict = {
+        "workers": 2,
+        "max_size": 100,
+        "batch_size": 10,
+        "max_attempts": 2,
+        "backoff_seconds": 0.05,
+    }
+    options.update(kwargs)
+    return MailQueue(
+        pool=SMTPConnectionPool(
+            factory=lambda: smtplib.SMTP("127.0.0.1", port, timeout=5),
+            size=options["workers"],
+        ),
+        build_message=lambda mail: build_email_message(mail, from_name="Test", from_email="noreply@example.com"),
+        dead_letter=dead.append,
+        **options,
+    )
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+def test_mail_queue_delivers_batches(handler: RecordingHandler) -> None:
+    dead: list[OutboundEmail] = []
+    mail_queue = _make_queue(handler.port, dead)  # type: ignore[attr-defined]
+    mail_queue.start()
+    recipients = [f"user{i}@example.com" for i in range(25)]
+    for email_to in recipients:
+        mail_queue.enqueue(OutboundEmail(email_to=email_to, subject="hi", html_content="<p>hi</p>"))
+    _wait_for(lambda: mail_queue.stats()["sent"] == len(recipients))
+    mail_queue.stop()
+    assert sorted(handler.received) == sorted(recipients)
+    assert mail_queue.stats()["sent"] == len(recipients)
+    assert dead == []
+
+
+def test_mail_queue_dead_letters_permanent_failure(handler: RecordingHandler) -> None:
+    dead: list[OutboundEmail] = []
+    mail_queue = _make_queue(handler.port, dead)  # type: ignore[attr-defined]
+    mail_queue.start()
+    mail_queue.enqueue(OutboundEmail(email_to="bounce@example.com", subject="hi", html_content="x"))
+    mail_queue.enqueue(OutboundEmail(email_to="ok@example.com", subject="hi", html_content="x"))
+    _wait_for(lambda: mail_queue.stats()["sent"] == 1 and len(dead) == 1)
+    mail_queue.stop()
+    assert handler.received == ["ok@example.com"]
+    assert [mail.email_to for mail in dead] == ["bounce@example.com"]
+    assert dead[0].attempts == 1
+
+
+def test_mail_queue_retries_then_dead_letters_when_unreachable() -> None:
+    dead: list[OutboundEmail] = []
+    # nothing listens on port 9: every connection attempt fails
+    mail_queue = _make_queue(9, dead, workers=1)
+    mail_queue.start()
+    mail_queue.enqueue(OutboundEmail(email_to="user@example.com", subject="hi", html_content="x"))
+    _wait_for(lambda: len(dead) == 1)
+    mail_queue.stop()
+    assert len(dead) == 1
+    assert dead[0].attempts == 2
+    assert dead[0].last_error
+    assert mail_queue.stats()["failed"] == 2
+
+
+def test_mail_queue_full_raises() -> None:
+    mail_queue = _make_queue(9, [], max_size=1)
+    mail_queue.enqueue(OutboundEmail(email_to="a@example.com", subject="", html_content=""))
+    with pytest.raises(MailQueueFull):
+        mail_queue.enqueue(OutboundEmail(email_to="b@example.com", subject="", html_content=""))
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import DB_POOL_CHECKED_OUT, instrument_pool
+from app.database.pool import InstrumentedQueuePool
+
+_WORKER = """
+from app.core.metrics import REQUESTS_IN_FLIGHT, REQUESTS_TOTAL
+REQUESTS_TOTAL.labels(route="Users-read_user_me", method="GET", status="200").inc()
+REQUESTS_IN_FLIGHT.labels(route="Users-read_user_me").inc()
+"""
+
+_SHUTDOWN = """
+from app.core.metrics import mark_process_dead
+mark_process_dead()
+"""
+
+_SCRAPE = """
+from app.core.metrics import render_latest
+print(render_latest()[0].decode())
+"""
+
+
+def _run(code: str, multiproc_dir: Path) -> str:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+    backend_dir = Path(__file__).resolve().parents[3]
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, cwd=backend_dir, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def test_scrape_aggregates_all_workers(tmp_path: Path) -> None:
+    _run(_WORKER, tmp_path)
+    _run(_WORKER + _SHUTDOWN, tmp_path)
+
+    output = _run(_SCRAPE, tmp_path)
+
+    assert 'http_requests_total{method="GET",route="Users-read_user_me",status="200"} 2.0' in output
+    # livesum: 정상 종료(mark_process_dead)한 워커의 게이지는 합산에서 제외
+    assert 'http_requests_in_flight{route="Users-read_user_me"} 1.0' in output
+
+
+def test_pool_gauges_follow_checkouts(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db'}.db", poolclass=InstrumentedQueuePool)
+    instrument_pool(engine, "test")
+    gauge = DB_POOL_CHECKED_OUT.labels(pool="test")
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert gauge._value.get() == 1
+    assert gauge._value.get() == 0
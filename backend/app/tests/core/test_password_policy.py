@@ -0,0 +1,32 @@
+import pytest
+
+from app.core.security import PasswordPolicy
+
+
+def test_bcrypt_cost_change_triggers_rehash() -> None:
+    old = PasswordPolicy(scheme="bcrypt", bcrypt_rounds=4).context()
+    current = PasswordPolicy(scheme="bcrypt", bcrypt_rounds=5).context()
+    stored = old.hash("secret")
+
+    assert current.verify_and_update("wrong", stored) == (False, None)
+    verified, new_hash = current.verify_and_update("secret", stored)
+    assert verified
+    assert new_hash is not None and new_hash.startswith("$2b$05$")
+    assert current.verify_and_update("secret", new_hash) == (True, None)
+
+
+def test_argon2_policy_upgrades_bcrypt_hashes() -> None:
+    pytest.importorskip("argon2")
+    stored = PasswordPolicy(scheme="bcrypt", bcrypt_rounds=4).context().hash("secret")
+    current = PasswordPolicy(
+        scheme="argon2", argon2_time_cost=1, argon2_memory_cost_kib=1024, argon2_parallelism=1
+    ).context()
+
+    verified, new_hash = current.verify_and_update("secret", stored)
+    assert verified
+    assert new_hash is not None and new_hash.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+    # a memory cost change is an upgrade too
+    tuned = PasswordPolicy(
+        scheme="argon2", argon2_time_cost=1, argon2_memory_cost_kib=2048, argon2_parallelism=1
+    ).context()
+    assert tuned.verify_and_update("secret", new_hash)[1] is not None
@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core.rate_limit import LoginRateLimiter, MemoryRateLimitStore, RateLimit, RateLimited
+
+LIMIT = RateLimit(capacity=3, period_seconds=30)  # 0.1 token/s
+
+
+def test_bucket_allows_burst_then_rejects() -> None:
+    store = MemoryRateLimitStore(max_keys=10)
+    with patch("app.core.rate_limit.time.monotonic", return_value=100.0):
+        assert [store.take("k", LIMIT) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert store.take("k", LIMIT) == pytest.approx(10.0)
+
+
+def test_bucket_refills_over_time() -> None:
+    store = MemoryRateLimitStore(max_keys=10)
+    with patch("app.core.rate_limit.time.monotonic", return_value=100.0):
+        for _ in range(3):
+            store.take("k", LIMIT)
+    with patch("app.core.rate_limit.time.monotonic", return_value=110.0):
+        assert store.take("k", LIMIT) == 0.0
+        assert store.take("k", LIMIT) > 0
+
+
+def test_least_recently_used_buckets_are_evicted() -> None:
+    store = MemoryRateLimitStore(max_keys=2)
+    for key in ("a", "b", "c"):
+        store.take(key, LIMIT)
+    assert list(store._buckets) == ["b", "c"]
+
+
+def test_login_limiter_checks_email_case_insensitively() -> None:
+    limiter = LoginRateLimiter(
+        MemoryRateLimitStore(max_keys=10),
+        per_email=RateLimit(capacity=1, period_seconds=60),
+        per_ip=RateLimit(capacity=100, period_seconds=60),
+    )
+    limiter.check(email="User@Example.com", ip="10.0.0.1")
+    with pytest.raises(RateLimited) as exc_info:
+        limiter.check(email="user@example.com", ip="10.0.0.2")
+    assert exc_info.value.retry_after_header == "60"
+
+
+def test_login_limiter_checks_ip() -> None:
+    limiter = LoginRateLimiter(
+        MemoryRateLimitStore(max_keys=10),
+        per_email=RateLimit(capacity=100, period_seconds=60),
+        per_ip=RateLimit(capacity=2, period_seconds=60),
+    )
+    limiter.check(email="a@example.com", ip="10.0.0.1")
+    limiter.check(email="b@example.com", ip="10.0.0.1")
+    with pytest.raises(RateLimited):
+        limiter.check(email="c@example.com", ip="10.0.0.1")
+    limiter.check(email="c@example.com", ip="10.0.0.2")
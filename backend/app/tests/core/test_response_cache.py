@@ -0,0 +1,52 @@
+import pytest
+
+from app.core.config import settings
+from app.core.response_cache import MemoryCacheBackend, NullCacheBackend, ResponseCache, _make_backend
+
+
+def test_response_cache_round_trip_keeps_etag() -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_size=10, ttl=60), ttl=60)
+    stored = cache.set("profile:1", b'{"a":1}')
+    loaded = cache.get("profile:1")
+    assert loaded == stored
+    assert loaded.etag == ResponseCache.make_etag(b'{"a":1}')
+
+
+def test_response_cache_body_may_contain_newlines() -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_size=10, ttl=60), ttl=60)
+    cache.set("roles:0:100:", b'{"a":\n1}')
+    assert cache.get("roles:0:100:").body == b'{"a":\n1}'
+
+
+def test_response_cache_delete_prefix() -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_size=10, ttl=60), ttl=60)
+    cache.set("roles:0:100:", b"[]")
+    cache.set("roles:100:100:", b"[]")
+    cache.set("profile:1", b"{}")
+    cache.delete_prefix("roles:")
+    assert cache.get("roles:0:100:") is None
+    assert cache.get("roles:100:100:") is None
+    assert cache.get("profile:1") is not None
+
+
+def test_null_backend_never_hits() -> None:
+    cache = ResponseCache(NullCacheBackend(), ttl=60)
+    cache.set("profile:1", b"{}")
+    assert cache.get("profile:1") is None
+
+
+@pytest.mark.parametrize(
+    ("backend", "workers", "expected"),
+    [
+        ("auto", 1, MemoryCacheBackend),
+        ("auto", 4, NullCacheBackend),
+        ("memory", 4, MemoryCacheBackend),
+        ("none", 1, NullCacheBackend),
+    ],
+)
+def test_backend_selection_follows_worker_count(
+    monkeypatch: pytest.MonkeyPatch, backend: str, workers: int, expected: type
+) -> None:
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", workers)
+    assert isinstance(_make_backend(), expected)
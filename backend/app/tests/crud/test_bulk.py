@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.count import _item_count_cache_size
+
+from app.crud.item import crud_item
+from app.models.item import Item
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
+
+
+def test_update_many_items(db: Session) -> None:
+    user = create_random_user(db)
+    items = crud_item.create_many(
+        db, [ItemCreate(title=random_lower_string()) for _ in range(3)], owner_id=user.id
+    )
+    updated = crud_item.update_many(
+        db, [(item.id, ItemUpdate(id=item.id, title=f"renamed-{i}")) for i, item in enumerate(items)],
+        chunk_size=2,
+    )
+    assert updated == 3
+    db.expire_all()
+    titles = {item.id: db.get(Item, item.id).title for item in items}
+    assert titles == {item.id: f"renamed-{i}" for i, item in enumerate(items)}
+
+
+def test_delete_many_items(db: Session) -> None:
+    user = create_random_user(db)
+    items = crud_item.create_many(
+        db, [ItemCreate(title=random_lower_string()) for _ in range(3)], owner_id=user.id
+    )
+    assert crud_item.count_by_owner(db, user.id) == 3
+    deleted = crud_item.delete_many(db, [items[0].id, items[2].id], chunk_size=1)
+    assert {item.id for item in deleted} == {items[0].id, items[2].id}
+    db.expire_all()
+    assert db.get(Item, items[0].id) is None
+    assert db.get(Item, items[1].id) is not None
+    # delete_many 가 소유자별 개수 캐시를 무효화
+    assert crud_item.count_by_owner(db, user.id) == 1
+
+
+@pytest.mark.parametrize(
+    ("backend", "workers", "cached"),
+    [("auto", 1, True), ("auto", 4, False), ("memory", 4, True), ("none", 1, False)],
+)
+def test_item_count_cache_follows_worker_count(
+    monkeypatch: pytest.MonkeyPatch, backend: str, workers: int, cached: bool
+) -> None:
+    monkeypatch.setattr(settings, "ITEM_COUNT_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", workers)
+    assert (_item_count_cache_size() > 0) is cached
@@ -0,0 +1,119 @@
+import uuid
+from collections.abc import Generator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Connection, insert, select, text
+
+from app.crud.count import count_statement
+from app.crud.pagination import apply_keyset
+from app.crud.user import crud_user
+from app.database.session import engine
+from app.models.item import Item
+from app.models.profile import Profile, Role, profile_roles_association
+from app.models.user import User
+from app.tests.utils.explain import assert_no_seq_scan
+
+USERS = 5_000
+ITEMS_PER_USER = 10
+ROLES = 100
+ROLES_PER_PROFILE = 2
+
+
+@pytest.fixture(scope="module")
+def seeded() -> Generator[tuple[Connection, list[uuid.UUID], list[int]], None, None]:
+    """
+    hot 쿼리 플랜 확인용 데이터셋을 하나의 트랜잭션에 적재 (테스트 후 롤백)
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        now = datetime.utcnow()
+        user_ids = [uuid.uuid4() for _ in range(USERS)]
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "full_name": "",
+                    "email": f"plan-{index}@example.com",
+                    "hashed_password": "x",
+                    "is_active": True,
+                    "is_superuser": False,
+                    "created_at": now - timedelta(seconds=index),
+                    "updated_at": now,
+                }
+                for index, user_id in enumerate(user_ids)
+            ],
+        )
+        conn.execute(
+            insert(Item),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "title": "plan",
+                    "owner_id": user_id,
+                    "created_at": now - timedelta(seconds=index),
+                    "updated_at": now,
+                }
+                for user_id in user_ids
+                for index in range(ITEMS_PER_USER)
+            ],
+        )
+        role_ids = list(
+            conn.scalars(
+                insert(Role).returning(Role.id),
+                [{"name": f"plan-role-{uuid.uuid4().hex}"} for _ in range(ROLES)],
+            )
+        )
+        conn.execute(
+            insert(Profile),
+            [{"user_id": user_id, "created_at": now, "updated_at": now} for user_id in user_ids],
+        )
+        conn.execute(
+            insert(profile_roles_association),
+            [
+                {"profile_user_id": user_id, "role_id": role_ids[(index + offset) % ROLES]}
+                for index, user_id in enumerate(user_ids)
+                for offset in range(ROLES_PER_PROFILE)
+            ],
+        )
+        conn.execute(text("ANALYZE users, items, profiles, roles, profile_roles"))
+        yield conn, user_ids, role_ids
+        trans.rollback()
+
+
+def test_items_by_owner_keyset_uses_index(seeded: tuple[Connection, list[uuid.UUID], list[int]]) -> None:
+    conn, user_ids, _ = seeded
+    stmt = apply_keyset(select(Item).where(Item.owner_id == user_ids[0]), Item, None, 100)
+    assert_no_seq_scan(conn, stmt, "items")
+
+
+def test_items_count_by_owner_uses_index(seeded: tuple[Connection, list[uuid.UUID], list[int]]) -> None:
+    conn, user_ids, _ = seeded
+    assert_no_seq_scan(conn, count_statement(Item, Item.owner_id == user_ids[0]), "items")
+
+
+def test_items_delete_by_owner_uses_index(seeded: tuple[Connection, list[uuid.UUID], list[int]]) -> None:
+    conn, user_ids, _ = seeded
+    # remove_with_items
+    assert_no_seq_scan(conn, Item.__table__.delete().where(Item.owner_id == user_ids[0]), "items")
+
+
+def test_profiles_by_role_uses_index(seeded: tuple[Connection, list[uuid.UUID], list[int]]) -> None:
+    conn, _, role_ids = seeded
+    stmt = select(Profile).join(Profile.roles).where(Role.id == role_ids[0])
+    assert_no_seq_scan(conn, stmt, "profile_roles")
+
+
+def test_user_by_email_is_case_insensitive_index_lookup(
+    seeded: tuple[Connection, list[uuid.UUID], list[int]],
+) -> None:
+    conn, _, _ = seeded
+    stmt = select(User).where(crud_user.email_matches("PLAN-42@Example.com"))
+    assert_no_seq_scan(conn, stmt, "users")
+    assert conn.execute(stmt).one().email == "plan-42@example.com"
+
+
+def test_users_keyset_uses_index(seeded: tuple[Connection, list[uuid.UUID], list[int]]) -> None:
+    conn, _, _ = seeded
+    assert_no_seq_scan(conn, apply_keyset(select(User), User, None, 100), "users")
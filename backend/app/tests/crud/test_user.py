@@ -1,8 +1,16 @@
+import uuid
+
+import pytest
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.crud import item
-from app.core.security import verify_password
+from app.crud.profile import crud_profile, crud_role
+from app.crud.user import EmailAlreadyExists, UnknownRoles, crud_user
+from app.core.security import PasswordPolicy, verify_password
 from app.models.user import User
+from app.schemas.profile import ProfileCreate
+from app.schemas.role import RoleCreate
 from app.schemas.user import UserCreate, UserUpdate
 from app.tests.utils.utils import random_email, random_lower_string
 
@@ -26,6 +34,21 @@ def test_authenticate_user(db: Session) -> None:
     assert user.email == authenticated_user.email
 
 
+def test_authenticate_rehashes_outdated_hash(db: Session) -> None:
+    email = random_email()
+    password = random_lower_string()
+    user = crud_user.create_user(db=db, obj_in=UserCreate(email=email, password=password))
+    outdated = PasswordPolicy(scheme="bcrypt", bcrypt_rounds=4).context().hash(password)
+    user.hashed_password = outdated
+    db.commit()
+
+    authenticated_user = crud_user.authenticate(db=db, email=email, password=password)
+    assert authenticated_user
+    db.refresh(authenticated_user)
+    assert authenticated_user.hashed_password != outdated
+    assert verify_password(password, authenticated_user.hashed_password)
+
+
 def test_not_authenticate_user(db: Session) -> None:
     email = random_email()
     password = random_lower_string()
@@ -89,3 +112,44 @@ def test_update_user(db: Session) -> None:
     assert user_2
     assert user.email == user_2.email
     assert verify_password(new_password, user_2.hashed_password)
+
+
+def test_create_with_profile_single_transaction(db: Session) -> None:
+    email = random_email()
+    user_in = UserCreate(email=email, password=random_lower_string())
+    user = crud_user.create_with_profile(db=db, obj_in=user_in)
+    assert user.email == email
+    assert crud_profile.get_by_user_id(db, user.id) is not None
+
+
+def test_create_with_profile_duplicate_email(db: Session) -> None:
+    user_in = UserCreate(email=random_email(), password=random_lower_string())
+    crud_user.create_with_profile(db=db, obj_in=user_in)
+    with pytest.raises(EmailAlreadyExists):
+        crud_user.create_with_profile(db=db, obj_in=user_in)
+
+
+def test_create_with_profile_honors_flags(db: Session) -> None:
+    user_in = UserCreate(
+        email=random_email(), password=random_lower_string(), is_superuser=True, is_active=False
+    )
+    user = crud_user.create_with_profile(db=db, obj_in=user_in)
+    assert user.is_superuser is True
+    assert user.is_active is False
+
+
+def test_create_with_profile_unknown_roles(db: Session) -> None:
+    role = crud_role.create(db=db, obj_in=RoleCreate(name=random_lower_string()))
+    email = random_email()
+    user_in = UserCreate(email=email, password=random_lower_string())
+    profile_in = ProfileCreate(user_id=uuid.uuid4(), role_ids=[role.id, 2_000_000_000])
+    with pytest.raises(UnknownRoles) as exc_info:
+        crud_user.create_with_profile(db=db, obj_in=user_in, profile_in=profile_in)
+    assert exc_info.value.role_ids == [2_000_000_000]
+    # 검증 실패 시 사용자도 만들어지지 않음
+    assert db.scalars(select(User).where(User.email == email)).first() is None
+
+    profile_in = ProfileCreate(user_id=uuid.uuid4(), role_ids=[role.id])
+    user = crud_user.create_with_profile(db=db, obj_in=user_in, profile_in=profile_in)
+    profile = crud_profile.get_by_user_id(db, user.id)
+    assert [r.id for r in profile.roles] == [role.id]
@@ -0,0 +1,69 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, text
+
+from app.api.middleware import RequestMetricsMiddleware
+from app.database.instrumentation import QueryStats, current_query_stats, instrument_engine
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Engine:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db'}.db")
+    instrument_engine(engine)
+    return engine
+
+
+def test_counts_queries_in_current_context(engine: Engine) -> None:
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        current_query_stats.reset(token)
+    assert stats.count == 2
+    assert stats.total_seconds >= stats.slowest_seconds > 0
+    assert stats.slowest_statement in ("SELECT 1", "SELECT 2")
+
+
+def test_failed_statement_is_not_counted(engine: Engine) -> None:
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+    finally:
+        current_query_stats.reset(token)
+    assert stats.count == 1
+
+
+def test_middleware_reports_per_request(engine: Engine, caplog: pytest.LogCaptureFixture) -> None:
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/three", tags=["test"])
+    def three_queries() -> dict:
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {}
+
+    with caplog.at_level(logging.INFO, logger="app.requests"):
+        response = TestClient(app).get("/three")
+
+    assert response.status_code == 200
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    # httpx also logs the test request at INFO; only the middleware's record is JSON
+    records = [record for record in caplog.records if record.name == "app.requests"]
+    entry = json.loads(records[-1].getMessage())
+    assert entry["db_queries"] == 3
+    assert entry["route"] == "three_queries_three_get"
+    assert entry["db_slowest_statement"] == "SELECT 1"
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.database.pool import InstrumentedQueuePool, get_pool_stats
+from app.schemas.metrics import PoolStatus
+
+
+def test_uninstrumented_pools_report_full_shape(tmp_path: Path) -> None:
+    null_engine = create_engine(f"sqlite:///{tmp_path / 'null.db'}", poolclass=NullPool)
+    queue_engine = create_engine(
+        f"sqlite:///{tmp_path / 'queue.db'}", poolclass=QueuePool, pool_size=3, max_overflow=1
+    )
+    with queue_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    null_status = PoolStatus(name="null", **get_pool_stats(null_engine))
+    assert null_status.size == 0
+    assert null_status.checkouts == 0
+
+    queue_status = PoolStatus(name="queue", **get_pool_stats(queue_engine))
+    assert queue_status.size == 3
+    assert queue_status.max_overflow == 1
+    assert queue_status.checked_in == 1
+    # 계측되지 않은 풀은 누적 지표를 0으로 보고
+    assert queue_status.checkouts == 0
+    assert queue_status.wait_seconds_avg == 0.0
+
+
+def test_instrumented_pool_counts_checkouts(tmp_path: Path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'instrumented.db'}", poolclass=InstrumentedQueuePool, pool_size=2
+    )
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    status = PoolStatus(name="instrumented", **get_pool_stats(engine))
+    assert status.checkouts == 3
+    assert status.checked_out == 0
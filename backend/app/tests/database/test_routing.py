@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Engine, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database.routing import USE_REPLICA, RoutingSession
+
+metadata = MetaData()
+source = Table("source", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path) -> sessionmaker:
+    engines: list[Engine] = []
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(source).values(id=1, name=name))
+        engines.append(engine)
+    primary, replica = engines
+    return sessionmaker(bind=primary, class_=RoutingSession, replica_bind=replica)
+
+
+def test_reads_go_to_replica_when_enabled(session_factory: sessionmaker) -> None:
+    with session_factory() as db:
+        db.info[USE_REPLICA] = True
+        assert db.scalar(select(source.c.name)) == "replica"
+
+
+def test_reads_stay_on_primary_by_default(session_factory: sessionmaker) -> None:
+    with session_factory() as db:
+        assert db.scalar(select(source.c.name)) == "primary"
+
+
+def test_write_pins_session_to_primary(session_factory: sessionmaker) -> None:
+    with session_factory() as db:
+        db.info[USE_REPLICA] = True
+        db.execute(insert(source).values(id=2, name="new"))
+        assert db.scalar(select(source.c.name).where(source.c.id == 2)) == "new"
+        assert db.scalar(select(source.c.name).where(source.c.id == 1)) == "primary"
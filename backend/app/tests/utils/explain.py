@@ -0,0 +1,28 @@
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import Connection, Executable, text
+from sqlalchemy.dialects import postgresql
+
+
+def explain(conn: Connection, stmt: Executable) -> dict[str, Any]:
+    """
+    EXPLAIN (FORMAT JSON) 결과의 최상위 Plan 노드를 반환
+    """
+    compiled = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    return conn.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar_one()[0]["Plan"]
+
+
+def iter_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_nodes(child)
+
+
+def seq_scanned_tables(plan: dict[str, Any]) -> set[str]:
+    return {node["Relation Name"] for node in iter_nodes(plan) if node["Node Type"] == "Seq Scan"}
+
+
+def assert_no_seq_scan(conn: Connection, stmt: Executable, table: str) -> None:
+    plan = explain(conn, stmt)
+    assert table not in seq_scanned_tables(plan), f"sequential scan on {table}:\n{plan}"
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from app.crud import item
+from app.crud.item import crud_item
 from app.models.item import Item
 from app.schemas.item import ItemCreate
 from app.tests.utils.user import create_random_user
@@ -13,4 +13,4 @@ def create_random_item(db: Session) -> Item:
     title = random_lower_string()
     description = random_lower_string()
     item_in = ItemCreate(title=title, description=description)
-    return item.create_item(session=db, item_in=item_in, owner_id=owner_id)
+    return crud_item.create_many(db, [item_in], owner_id=owner_id)[0]
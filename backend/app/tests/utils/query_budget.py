@@ -0,0 +1,57 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from app.database.session import async_engine, async_replica_engine, engine, replica_engine
+
+
+@dataclass
+class QueryCounter:
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+def _engines() -> list[Engine]:
+    engines = [engine, async_engine.sync_engine]
+    if replica_engine is not None and async_replica_engine is not None:
+        engines += [replica_engine, async_replica_engine.sync_engine]
+    return engines
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    블록 안에서 애플리케이션 엔진들로 실행된 SQL 문을 모두 기록
+    """
+    counter = QueryCounter()
+
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        counter.statements.append(statement)
+
+    engines = _engines()
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryCounter]:
+    """
+    블록(보통 요청 하나) 안의 SQL 문 수가 budget을 넘으면 실행된 쿼리 목록과 함께 실패
+    """
+    with count_queries() as counter:
+        yield counter
+    assert counter.count <= budget, (
+        f"{counter.count} queries exceeded the budget of {budget}:\n"
+        + "\n".join(f"  {statement}" for statement in counter.statements)
+    )
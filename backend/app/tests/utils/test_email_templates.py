@@ -0,0 +1,35 @@
+import os
+from pathlib import Path
+
+from jinja2 import Template
+
+from app.utils.email_templates import EMAIL_TEMPLATES_DIR, EmailTemplateRegistry, email_templates
+
+
+def test_registry_matches_uncached_render() -> None:
+    context = {"project_name": "Test", "email": "user@example.com", "username": "user", "link": "http://x"}
+    email_templates.preload()
+    for name in email_templates.names():
+        expected = Template((EMAIL_TEMPLATES_DIR / name).read_text()).render(context)
+        assert email_templates.render(name, context) == expected
+
+
+def test_registry_reuses_compiled_template(tmp_path: Path) -> None:
+    (tmp_path / "hello.html").write_text("Hello {{ name }}")
+    registry = EmailTemplateRegistry(directory=tmp_path, auto_reload=False)
+    registry.preload()
+    first = registry.get("hello.html")
+    (tmp_path / "hello.html").write_text("Changed {{ name }}")
+    assert registry.get("hello.html") is first
+    assert registry.render("hello.html", {"name": "a"}) == "Hello a"
+
+
+def test_registry_reloads_on_mtime_change(tmp_path: Path) -> None:
+    path = tmp_path / "hello.html"
+    path.write_text("Hello {{ name }}")
+    registry = EmailTemplateRegistry(directory=tmp_path, auto_reload=True)
+    assert registry.render("hello.html", {"name": "a"}) == "Hello a"
+    path.write_text("Bye {{ name }}")
+    mtime = path.stat().st_mtime + 10
+    os.utime(path, (mtime, mtime))
+    assert registry.render("hello.html", {"name": "a"}) == "Bye a"
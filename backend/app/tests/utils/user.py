@@ -1,6 +1,6 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
-from app.crud import item
+from app.crud.user import crud_user
 from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -23,7 +23,7 @@ def create_random_user(db: Session) -> User:
     email = random_email()
     password = random_lower_string()
     user_in = UserCreate(email=email, password=password)
-    user = item.create_user(session=db, user_create=user_in)
+    user = crud_user.create_user(db=db, obj_in=user_in)
     return user
 
 
@@ -36,14 +36,14 @@ def authentication_token_from_email(
     If the user doesn't exist it is created first.
     """
     password = random_lower_string()
-    user = item.get_user_by_email(session=db, email=email)
+    user = crud_user.get_user_by_email(db=db, email=email)
     if not user:
         user_in_create = UserCreate(email=email, password=password)
-        user = item.create_user(session=db, user_create=user_in_create)
+        user = crud_user.create_user(db=db, obj_in=user_in_create)
     else:
         user_in_update = UserUpdate(password=password)
         if not user.id:
             raise Exception("User id not set")
-        user = item.update_user(session=db, db_user=user, user_in=user_in_update)
+        user = crud_user.update_user(db=db, db_obj=user, obj_in=user_in_update)
 
     return user_authentication_headers(client=client, email=email, password=password)
@@ -0,0 +1,65 @@
+# path: app/utils/email_templates.py
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+EMAIL_TEMPLATES_DIR = Path(__file__).parent.parent / "email-templates" / "build"
+
+
+class EmailTemplateRegistry:
+    """
+    email-templates/build 아래 템플릿을 한 번만 읽고 컴파일해 재사용하는 레지스트리.
+
+    - preload()로 시작 시 모든 템플릿을 미리 컴파일 (이후 렌더링은 디스크 I/O/파싱 없음)
+    - auto_reload=True 이면 렌더링마다 파일 mtime을 확인해 변경된 템플릿만 다시 컴파일 (로컬 개발용)
+    - jinja2는 첫 템플릿을 읽을 때 import (메일을 보내지 않는 워커의 시작 시간에 포함되지 않도록)
+    """
+
+    def __init__(self, *, directory: Path, auto_reload: bool) -> None:
+        self.directory = directory
+        self.auto_reload = auto_reload
+        self._env: "Environment | None" = None
+        self._templates: dict[str, "Template"] = {}
+
+    def _environment(self) -> "Environment":
+        if self._env is None:
+            from jinja2 import Environment, FileSystemLoader
+
+            # 기존 jinja2.Template(...) 렌더링과 동일하게 autoescape 없이 렌더링
+            self._env = Environment(
+                loader=FileSystemLoader(self.directory),
+                auto_reload=self.auto_reload,
+                cache_size=-1,
+            )
+        return self._env
+
+    def names(self) -> list[str]:
+        return sorted(path.name for path in self.directory.glob("*.html"))
+
+    def preload(self) -> None:
+        """
+        모든 템플릿을 컴파일해 캐시에 올림
+        """
+        for name in self.names():
+            self.get(name)
+
+    def get(self, name: str) -> "Template":
+        template = self._templates.get(name)
+        if template is None or (self.auto_reload and not template.is_up_to_date):
+            template = self._environment().get_template(name)
+            self._templates[name] = template
+        return template
+
+    def render(self, name: str, context: dict[str, Any]) -> str:
+        return self.get(name).render(context)
+
+
+email_templates = EmailTemplateRegistry(
+    directory=EMAIL_TEMPLATES_DIR,
+    auto_reload=settings.ENVIRONMENT == "local",
+)
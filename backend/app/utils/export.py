@@ -0,0 +1,77 @@
+# path: app/utils/export.py
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+def export_headers(name: str, fmt: ExportFormat) -> dict[str, str]:
+    return {"Content-Disposition": f'attachment; filename="{name}.{fmt}"'}
+
+
+def encode_header(fields: Sequence[str], fmt: ExportFormat) -> str:
+    if fmt != "csv":
+        return ""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(fields)
+    return buffer.getvalue()
+
+
+def encode_batch(rows: Iterable[Mapping[str, Any]], fields: Sequence[str], fmt: ExportFormat) -> str:
+    """
+    행 묶음(partition)을 하나의 문자열 chunk로 인코딩 (행마다 write 하지 않도록)
+    """
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([_csv_value(row[field]) for field in fields] for row in rows)
+        return buffer.getvalue()
+    return "".join(
+        json.dumps({field: row[field] for field in fields}, default=_json_default) + "\n"
+        for row in rows
+    )
+
+
+def stream_rows(
+    partitions: Iterable[Sequence[Mapping[str, Any]]], fields: Sequence[str], fmt: ExportFormat
+) -> Iterator[str]:
+    header = encode_header(fields, fmt)
+    if header:
+        yield header
+    for partition in partitions:
+        yield encode_batch(partition, fields, fmt)
+
+
+async def astream_rows(
+    partitions: AsyncIterator[Sequence[Mapping[str, Any]]], fields: Sequence[str], fmt: ExportFormat
+) -> AsyncIterator[str]:
+    header = encode_header(fields, fmt)
+    if header:
+        yield header
+    async for partition in partitions:
+        yield encode_batch(partition, fields, fmt)
@@ -1,18 +1,28 @@
 # path: app/utils/utiles.py 
 
+import asyncio
 import logging
+import smtplib
+from collections.abc import Callable
 from dataclasses import dataclass
+from email.message import EmailMessage
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import emails  # type: ignore
 import jwt
-from jinja2 import Template
 from jwt.exceptions import InvalidTokenError
 
 from app.core import security
+from app.core.async_mail import AsyncSMTPTransport
 from app.core.config import settings
+from app.core.mail import MailQueue, OutboundEmail, SMTPConnectionPool, build_email_message
+from app.crud.email import crud_email_dead_letter
+from app.database.session import SessionLocal
+from app.schemas.email import EmailDeadLetterCreate
+from app.utils.email_templates import email_templates
+
+if TYPE_CHECKING:
+    import aiosmtplib
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,11 +35,7 @@ class EmailData:
 
 
 def render_email_template(*, template_name: str, context: dict[str, Any]) -> str:
-    template_str = (
-        Path(__file__).parent / "email-templates" / "build" / template_name
-    ).read_text()
-    html_content = Template(template_str).render(context)
-    return html_content
+    return email_templates.render(template_name, context)
 
 
 def send_email(
@@ -39,6 +45,8 @@ def send_email(
     html_content: str = "",
 ) -> None:
     assert settings.emails_enabled, "no provided configuration for email variables"
+    import emails  # type: ignore  # heavy (lxml/premailer); only needed when actually sending
+
     message = emails.Message(
         subject=subject,
         html=html_content,
@@ -56,6 +64,118 @@ def send_email(
     response = message.send(to=email_to, smtp=smtp_options)
     logger.info(f"send email result: {response}")
 
+
+def _smtp_connection() -> smtplib.SMTP:
+    """
+    메일 큐 워커가 사용하는 SMTP 연결 생성 (send_email과 같은 TLS/SSL/로그인 설정)
+    """
+    conn: smtplib.SMTP
+    if settings.SMTP_SSL:
+        conn = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.MAIL_SMTP_TIMEOUT)
+    else:
+        conn = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.MAIL_SMTP_TIMEOUT)
+        if settings.SMTP_TLS:
+            conn.starttls()
+    if settings.SMTP_USER:
+        conn.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+    return conn
+
+
+async def _async_smtp_connection() -> "aiosmtplib.SMTP":
+    """
+    비동기 발송기가 사용하는 SMTP 연결 생성 (_smtp_connection과 같은 TLS/SSL/로그인 설정)
+    """
+    import aiosmtplib  # only needed when an async route actually sends mail
+
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        use_tls=settings.SMTP_SSL,
+        start_tls=settings.SMTP_TLS and not settings.SMTP_SSL,
+        timeout=settings.MAIL_SMTP_TIMEOUT,
+    )
+    await smtp.connect()
+    if settings.SMTP_USER:
+        await smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+    return smtp
+
+
+def _build_message(mail: OutboundEmail) -> EmailMessage:
+    return build_email_message(mail, from_name=settings.EMAILS_FROM_NAME, from_email=settings.EMAILS_FROM_EMAIL or "")
+
+
+def _store_dead_letter(mail: OutboundEmail) -> None:
+    with SessionLocal() as db:
+        crud_email_dead_letter.create(
+            db,
+            obj_in=EmailDeadLetterCreate(
+                email_to=mail.email_to,
+                subject=mail.subject,
+                html_content=mail.html_content,
+                attempts=mail.attempts,
+                last_error=mail.last_error,
+            ),
+        )
+
+
+mail_queue = MailQueue(
+    pool=SMTPConnectionPool(factory=_smtp_connection, size=settings.MAIL_QUEUE_WORKERS),
+    build_message=_build_message,
+    dead_letter=_store_dead_letter,
+    workers=settings.MAIL_QUEUE_WORKERS,
+    max_size=settings.MAIL_QUEUE_MAX_SIZE,
+    batch_size=settings.MAIL_BATCH_SIZE,
+    max_attempts=settings.MAIL_MAX_ATTEMPTS,
+    backoff_seconds=settings.MAIL_RETRY_BACKOFF_SECONDS,
+)
+
+
+mail_transport = AsyncSMTPTransport(
+    connect=_async_smtp_connection,
+    build_message=_build_message,
+    max_concurrency=settings.MAIL_ASYNC_MAX_CONCURRENCY,
+)
+
+
+async def send_email_async(
+    *,
+    email_to: str,
+    subject: str = "",
+    html_content: str = "",
+) -> None:
+    """
+    async 라우트에서 메일을 바로 발송 (이벤트 루프를 막지 않고, 열린 SMTP 연결 재사용)
+    """
+    assert settings.emails_enabled, "no provided configuration for email variables"
+    await mail_transport.send(OutboundEmail(email_to=email_to, subject=subject, html_content=html_content))
+
+
+async def send_generated_email_async(
+    generate: Callable[..., EmailData], *, email_to: str, **kwargs: Any
+) -> None:
+    """
+    generate_*_email 로 메일을 만들고 비동기로 발송.
+    템플릿 렌더링은 스레드에서 실행해 이벤트 루프를 막지 않음
+
+    예: await send_generated_email_async(generate_test_email, email_to=email)
+    """
+    email_data = await asyncio.to_thread(generate, email_to=email_to, **kwargs)
+    await send_email_async(email_to=email_to, subject=email_data.subject, html_content=email_data.html_content)
+
+
+def enqueue_email(
+    *,
+    email_to: str,
+    subject: str = "",
+    html_content: str = "",
+) -> None:
+    """
+    메일을 백그라운드 발송 대기열에 넣고 바로 반환 (SMTP 왕복을 요청 경로에서 제거)
+    """
+    assert settings.emails_enabled, "no provided configuration for email variables"
+    mail_queue.enqueue(OutboundEmail(email_to=email_to, subject=subject, html_content=html_content))
+
+
 def generate_verification_email(email_to: str, verification_link: str):
     """
     확인 이메일 발송 함수
@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+
+set -e
+set -x
+
+# Fails when `import app.main` is slower than the budget or loads emails/jinja2/sentry_sdk eagerly
+python -m app.benchmarks.importtime --budget-ms "${IMPORT_TIME_BUDGET_MS:-2000}" "$@"
@@ -6,3 +6,11 @@ set -x
 coverage run --source=app -m pytest
 coverage report --show-missing
 coverage html --title "${@-coverage}"
+
+# CRUD microbenchmarks (deselected above): RUN_BENCHMARKS=1 bash scripts/test.sh
+# Table sizes: BENCHMARK_USERS / BENCHMARK_ITEMS_PER_USER / BENCHMARK_ROLES
+if [ -n "${RUN_BENCHMARKS}" ]; then
+    python -m pytest -m microbenchmark app/tests/benchmarks \
+        --benchmark-autosave --benchmark-storage=file://./.benchmarks \
+        --benchmark-columns=min,median,mean,max,rounds
+fi